@@ -1,3 +1,17 @@
-from .plugins.base import Plugin
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .plugins.base import Plugin
 
 __all__ = ["Plugin"]
+
+
+def __getattr__(name: str) -> Any:
+    # Plugin is imported on first access, so CLI doesn't import graphql-core
+    # for commands that don't need it, eg. --version.
+    if name == "Plugin":
+        # pylint: disable=import-outside-toplevel
+        from .plugins.base import Plugin
+
+        return Plugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
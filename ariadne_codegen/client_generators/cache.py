@@ -0,0 +1,259 @@
+import contextlib
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Dict, List, Optional, Set, cast
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    print_ast,
+    print_schema,
+)
+
+from ..plugins.manager import PluginManager
+from ..settings import ClientSettings, GraphQLSchemaSettings
+from ..utils import write_file_atomically
+from .scalars import ScalarData
+
+CACHE_VERSIONED_PACKAGES = ("ariadne-codegen", "black", "isort", "autoflake")
+CACHE_KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+CODEGEN_SECTION_KEY = "ariadne-codegen"
+CODEGEN_SETTINGS_NAMES = {
+    f.name
+    for settings in (ClientSettings, GraphQLSchemaSettings)
+    for f in fields(settings)
+}
+
+
+@dataclass
+class CachedResultTypes:
+    code: str
+    operation_str: str
+    public_names: List[str]
+
+
+class ResultTypesCache:
+    """
+    Cache of formatted result types modules, keyed by content hashes.
+    Entries are stored on disk if cache_dir is provided and in memory if
+    entries dict is provided. On disk entries are stored in subdirectory
+    named after base key, so caches of different configurations can share
+    cache_dir without pruning each other's entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str],
+        base_key: str,
+        entries: Optional[Dict[str, CachedResultTypes]] = None,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.base_key = base_key
+        self.entries = entries
+        self.used_keys: Set[str] = set()
+
+    def get_key(
+        self,
+        operation_definition: OperationDefinitionNode,
+        fragments_definitions: Dict[str, FragmentDefinitionNode],
+    ) -> str:
+        """Return cache key of given operation and fragments used by it."""
+        used_fragments = get_used_fragments_names(
+            operation_definition.selection_set, fragments_definitions
+        )
+        document_str = "\n\n".join(
+            [print_ast(operation_definition)]
+            + [
+                print_ast(fragments_definitions[name])
+                for name in sorted(used_fragments)
+            ]
+        )
+        return get_hash(self.base_key, document_str)
+
+    def get(self, key: str) -> Optional[CachedResultTypes]:
+        """Return cached entry or None if it doesn't exist or cannot be read."""
+        self.used_keys.add(key)
+        if self.entries is not None and key in self.entries:
+            return self.entries[key]
+        if not self.cache_dir:
+            return None
+        try:
+            data = json.loads(self._get_entry_path(key).read_text(encoding="utf-8"))
+            entry = CachedResultTypes(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        if self.entries is not None:
+            self.entries[key] = entry
+        return entry
+
+    def set(self, key: str, entry: CachedResultTypes) -> None:
+        """Save entry under given key."""
+        self.used_keys.add(key)
+        if self.entries is not None:
+            self.entries[key] = entry
+        if self.cache_dir:
+            self._get_namespace_dir().mkdir(parents=True, exist_ok=True)
+            write_file_atomically(self._get_entry_path(key), json.dumps(asdict(entry)))
+
+    def prune(self) -> None:
+        """
+        Remove entries, in memory and in base key's subdirectory of cache_dir,
+        which weren't used by this cache.
+        """
+        if self.entries is not None:
+            for key in set(self.entries) - self.used_keys:
+                del self.entries[key]
+        if self.cache_dir and self._get_namespace_dir().is_dir():
+            for path in self._get_namespace_dir().glob("*.json"):
+                if CACHE_KEY_PATTERN.fullmatch(path.stem) and (
+                    path.stem not in self.used_keys
+                ):
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+
+    def _get_namespace_dir(self) -> Path:
+        return cast(Path, self.cache_dir) / self.base_key
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self._get_namespace_dir() / f"{key}.json"
+
+
+def get_result_types_cache_base_key(
+    schema: GraphQLSchema,
+    enums_module_name: str,
+    convert_to_snake_case: bool,
+    base_model_import: str,
+    custom_scalars: Dict[str, ScalarData],
+    plugin_manager: Optional[PluginManager] = None,
+    formatter: str = "",
+    fragments_module_name: Optional[str] = None,
+) -> str:
+    """Return hash of everything, except operation, that result types depend on."""
+    plugins = plugin_manager.plugins if plugin_manager else []
+    return get_hash(
+        json.dumps(
+            {
+                "versions": get_packages_versions(CACHE_VERSIONED_PACKAGES),
+                "sources": get_sources_hash(),
+                "schema": get_hash(print_schema(schema)),
+                "enums_module_name": enums_module_name,
+                "convert_to_snake_case": convert_to_snake_case,
+                "base_model_import": base_model_import,
+                "formatter": formatter,
+                "fragments_module_name": fragments_module_name,
+                "custom_scalars": {
+                    name: asdict(data) for name, data in custom_scalars.items()
+                },
+                "plugins": [
+                    f"{type(plugin).__module__}.{type(plugin).__qualname__}"
+                    for plugin in plugins
+                ],
+                "plugins_config": [
+                    get_plugins_config(plugin.config_dict) for plugin in plugins
+                ],
+                "plugins_cache_keys": [plugin.cache_key() for plugin in plugins],
+            },
+            sort_keys=True,
+            default=str,
+        )
+    )
+
+
+def get_used_fragments_names(
+    selection_set: Optional[SelectionSetNode],
+    fragments_definitions: Dict[str, FragmentDefinitionNode],
+    used_fragments: Optional[Set[str]] = None,
+) -> Set[str]:
+    """Return names of fragments used directly or indirectly by selection set."""
+    used_fragments = used_fragments if used_fragments is not None else set()
+    if not selection_set:
+        return used_fragments
+    for selection in selection_set.selections:
+        if isinstance(selection, (FieldNode, InlineFragmentNode)):
+            get_used_fragments_names(
+                selection.selection_set, fragments_definitions, used_fragments
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name not in used_fragments and name in fragments_definitions:
+                used_fragments.add(name)
+                get_used_fragments_names(
+                    fragments_definitions[name].selection_set,
+                    fragments_definitions,
+                    used_fragments,
+                )
+    return used_fragments
+
+
+def get_packages_versions(packages: tuple) -> Dict[str, str]:
+    versions = {}
+    for package in packages:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = ""
+    return versions
+
+
+@lru_cache(maxsize=None)
+def get_sources_hash() -> str:
+    """
+    Return hash of paths, sizes and modification times of ariadne-codegen source
+    files, so changes in editable installs, not reflected by version, are detected.
+    """
+    package_path = Path(__file__).parent.parent
+    files_stats = []
+    for path in sorted(package_path.rglob("*.py")):
+        stat = path.stat()
+        files_stats.append(
+            f"{path.relative_to(package_path).as_posix()}:"
+            f"{stat.st_size}:{stat.st_mtime_ns}"
+        )
+    return get_hash(*files_stats)
+
+
+def get_plugins_config(config_dict: Dict) -> Dict:
+    """
+    Return config without ariadne-codegen settings, which are included in cache key
+    only if they affect result types, eg. jobs or cache_dir don't.
+    """
+    plugins_config = dict(config_dict)
+    if isinstance(config_dict.get(CODEGEN_SECTION_KEY), dict):
+        plugins_config[CODEGEN_SECTION_KEY] = get_section_without_settings(
+            config_dict[CODEGEN_SECTION_KEY]
+        )
+    tool = config_dict.get("tool")
+    if isinstance(tool, dict) and isinstance(tool.get(CODEGEN_SECTION_KEY), dict):
+        plugins_config["tool"] = {
+            **tool,
+            CODEGEN_SECTION_KEY: get_section_without_settings(
+                tool[CODEGEN_SECTION_KEY]
+            ),
+        }
+    return plugins_config
+
+
+def get_section_without_settings(section: Dict) -> Dict:
+    return {
+        key: value
+        for key, value in section.items()
+        if key not in CODEGEN_SETTINGS_NAMES
+    }
+
+
+def get_hash(*values: str) -> str:
+    hash_ = hashlib.sha256()
+    for value in values:
+        hash_.update(value.encode("utf-8"))
+        hash_.update(b"\0")
+    return hash_.hexdigest()
@@ -11,11 +11,11 @@ from ..codegen import (
     generate_await,
     generate_call,
     generate_class_def,
-    generate_constant,
     generate_import_from,
     generate_keyword,
     generate_method_definition,
     generate_module,
+    generate_multiline_constant,
     generate_name,
     generate_return,
     generate_subscript,
@@ -157,9 +157,7 @@ class ClientGenerator:
             targets=[self._operation_str_variable],
             value=generate_call(
                 func=generate_name(self._gql_func_name),
-                args=[
-                    [generate_constant(l + "\n") for l in operation_str.splitlines()]
-                ],
+                args=[generate_multiline_constant(operation_str + "\n")],
             ),
             lineno=lineno,
         )
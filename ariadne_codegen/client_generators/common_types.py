@@ -0,0 +1,194 @@
+import ast
+import copy
+import hashlib
+from typing import Dict, List, Optional, Set, cast
+
+from ..codegen import (
+    generate_assign,
+    generate_constant,
+    generate_expr,
+    generate_list,
+    generate_method_call,
+    generate_module,
+)
+from .constants import UPDATE_FORWARD_REFS_METHOD
+
+ALL_VARIABLE_NAME = "__all__"
+
+
+class CommonTypesGenerator:
+    """
+    Moves models with the same structure, generated for different operations,
+    into common module. Structure of model consists of schema type it represents,
+    its bases and fields, with models used by fields compared by their structures.
+    Modules of operations import shared models under their original names.
+    """
+
+    def __init__(self, module_name: str) -> None:
+        self.module_name = module_name
+        self._modules: Dict[str, ast.Module] = {}
+        self._classes_types: Dict[str, Dict[str, str]] = {}
+
+    def add_module(
+        self, module_name: str, module: ast.Module, classes_types: Dict[str, str]
+    ) -> None:
+        """
+        Add module with models of operation.
+        Classes types map names of models to names of schema types they represent.
+        """
+        self._modules[module_name] = module
+        self._classes_types[module_name] = classes_types
+
+    def generate(self) -> ast.Module:
+        """
+        Return common module with models used more than once.
+        Added modules are updated in place to import these models.
+        """
+        modules_keys = {
+            module_name: self._get_classes_keys(module_name)
+            for module_name in sorted(self._modules)
+        }
+        counts: Dict[str, int] = {}
+        for keys in modules_keys.values():
+            for key in keys.values():
+                counts[key] = counts.get(key, 0) + 1
+
+        imports: Dict[str, ast.stmt] = {}
+        class_defs: Dict[str, ast.ClassDef] = {}
+        for module_name, keys in modules_keys.items():
+            shared = {name: key for name, key in keys.items() if counts[key] > 1}
+            if not shared:
+                continue
+            module = self._modules[module_name]
+            for stmt in module.body:
+                if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                    imports.setdefault(ast.dump(stmt), stmt)
+                elif isinstance(stmt, ast.ClassDef) and stmt.name in shared:
+                    key = shared[stmt.name]
+                    if key not in class_defs:
+                        class_defs[key] = self._get_shared_class_def(stmt, keys)
+            self._replace_shared_classes(module_name, shared)
+
+        sorted_class_defs = [class_defs[key] for key in sorted(class_defs)]
+        update_forward_refs_calls = [
+            generate_expr(
+                generate_method_call(class_def.name, UPDATE_FORWARD_REFS_METHOD)
+            )
+            for class_def in sorted_class_defs
+        ]
+        return generate_module(
+            list(imports.values())
+            + cast(List[ast.stmt], sorted_class_defs)
+            + cast(List[ast.stmt], update_forward_refs_calls)
+        )
+
+    def _get_classes_keys(self, module_name: str) -> Dict[str, str]:
+        """Return keys of models structures, also used as names of shared models."""
+        classes_types = self._classes_types[module_name]
+        class_defs = {
+            stmt.name: stmt
+            for stmt in self._modules[module_name].body
+            if isinstance(stmt, ast.ClassDef) and stmt.name in classes_types
+        }
+        keys: Dict[str, str] = {}
+        visiting: Set[str] = set()
+
+        def get_key(name: str) -> str:
+            if name in keys:
+                return keys[name]
+            if name in visiting:
+                # Model referencing itself is not compared with other models.
+                return f"{module_name}.{name}"
+            visiting.add(name)
+            class_def = copy.deepcopy(class_defs[name])
+            class_def.name = ""
+            for node in ast.walk(class_def):
+                if isinstance(node, ast.Name):
+                    referenced = get_referenced_class(node.id, class_defs)
+                    if referenced:
+                        node.id = get_key(referenced)
+                elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    referenced = get_referenced_class(node.value, class_defs)
+                    if referenced:
+                        node.value = get_key(referenced)
+            visiting.remove(name)
+            # Unparsed code, unlike dump of ast, is the same in all python versions.
+            structure = classes_types[name] + "\n" + ast.unparse(class_def)
+            keys[name] = (
+                f"{classes_types[name]}_"
+                f"{hashlib.sha256(structure.encode('utf-8')).hexdigest()[:12]}"
+            )
+            return keys[name]
+
+        for name in class_defs:
+            get_key(name)
+        return keys
+
+    def _get_shared_class_def(
+        self, class_def: ast.ClassDef, keys: Dict[str, str]
+    ) -> ast.ClassDef:
+        shared_class_def = copy.deepcopy(class_def)
+        shared_class_def.name = keys[class_def.name]
+        for node in ast.walk(shared_class_def):
+            if isinstance(node, ast.Name):
+                referenced = get_referenced_class(node.id, keys)
+                if referenced:
+                    node.id = node.id.replace(referenced, keys[referenced])
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                referenced = get_referenced_class(node.value, keys)
+                if referenced:
+                    node.value = node.value.replace(referenced, keys[referenced])
+        return shared_class_def
+
+    def _replace_shared_classes(self, module_name: str, shared: Dict[str, str]):
+        module = self._modules[module_name]
+        body: List[ast.stmt] = []
+        imports_count = 0
+        for stmt in module.body:
+            if isinstance(stmt, ast.ClassDef) and stmt.name in shared:
+                continue
+            if get_update_forward_refs_class(stmt) in shared:
+                continue
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                imports_count += 1
+            body.append(stmt)
+
+        shared_import = ast.ImportFrom(
+            module=self.module_name,
+            names=[
+                ast.alias(name=key, asname=name) for name, key in sorted(shared.items())
+            ],
+            level=1,
+        )
+        # Names imported only to be reexported have to be listed in __all__,
+        # otherwise they would be removed as unused imports.
+        all_assign = generate_assign(
+            [ALL_VARIABLE_NAME],
+            generate_list(
+                [
+                    generate_constant(name)
+                    for name in sorted(self._classes_types[module_name])
+                ]
+            ),
+        )
+        module.body = (
+            body[:imports_count] + [shared_import, all_assign] + body[imports_count:]
+        )
+
+
+def get_referenced_class(value: str, class_defs: Dict) -> Optional[str]:
+    """Return name of class if value is its name, quoted or not."""
+    name = value.strip('"')
+    return name if name in class_defs else None
+
+
+def get_update_forward_refs_class(stmt: ast.stmt) -> Optional[str]:
+    if (
+        isinstance(stmt, ast.Expr)
+        and isinstance(stmt.value, ast.Call)
+        and isinstance(stmt.value.func, ast.Attribute)
+        and stmt.value.func.attr == UPDATE_FORWARD_REFS_METHOD
+        and isinstance(stmt.value.func.value, ast.Name)
+    ):
+        return stmt.value.func.value.id
+    return None
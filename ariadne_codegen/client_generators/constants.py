@@ -52,3 +52,5 @@ GRAPHQL_CLIENT_EXCEPTIONS_NAMES = [
 
 SCALARS_PARSE_DICT_NAME = "SCALARS_PARSE_FUNCTIONS"
 SCALARS_SERIALIZE_DICT_NAME = "SCALARS_SERIALIZE_FUNCTIONS"
+
+RESULT_TYPES_MODULE_NAME = "result_types"
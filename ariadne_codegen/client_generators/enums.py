@@ -1,5 +1,5 @@
 import ast
-from typing import List, Optional, cast
+from typing import Collection, List, Optional, cast
 
 from graphql import GraphQLEnumType, GraphQLSchema
 
@@ -16,9 +16,13 @@ from .constants import ENUM_CLASS, ENUM_MODULE
 
 class EnumsGenerator:
     def __init__(
-        self, schema: GraphQLSchema, plugin_manager: Optional[PluginManager] = None
+        self,
+        schema: GraphQLSchema,
+        plugin_manager: Optional[PluginManager] = None,
+        included_types: Optional[Collection[str]] = None,
     ) -> None:
         self.schema = schema
+        self.included_types = included_types
         self.plugin_manager = plugin_manager
 
         self._imports: List[ast.ImportFrom] = [
@@ -44,7 +48,9 @@ class EnumsGenerator:
         return [
             definition
             for name, definition in self.schema.type_map.items()
-            if isinstance(definition, GraphQLEnumType) and not name.startswith("__")
+            if isinstance(definition, GraphQLEnumType)
+            and not name.startswith("__")
+            and (self.included_types is None or name in self.included_types)
         ]
 
     def _parse_enum_definition(self, definition: GraphQLEnumType) -> ast.ClassDef:
@@ -0,0 +1,108 @@
+import ast
+from typing import Dict, List, Optional, Set, cast
+
+from graphql import (
+    FragmentDefinitionNode,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLSchema,
+)
+
+from ..codegen import generate_expr, generate_method_call, generate_module
+from ..plugins.manager import PluginManager
+from .constants import UPDATE_FORWARD_REFS_METHOD
+from .result_types import ResultTypesGenerator
+from .scalars import ScalarData
+
+
+class FragmentsGenerator:
+    """
+    Generates module with models of fragments, which are shared by models
+    of operations instead of being copied into every operation's module.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments_definitions: Dict[str, FragmentDefinitionNode],
+        enums_module_name: str,
+        fragments_module_name: str,
+        base_model_import: Optional[ast.ImportFrom] = None,
+        convert_to_snake_case: bool = True,
+        custom_scalars: Optional[Dict[str, ScalarData]] = None,
+        plugin_manager: Optional[PluginManager] = None,
+    ) -> None:
+        self.schema = schema
+        self.fragments_definitions = fragments_definitions
+        self.plugin_manager = plugin_manager
+
+        self._generators: Dict[str, ResultTypesGenerator] = {
+            name: ResultTypesGenerator(
+                schema=schema,
+                operation_definition=definition,
+                enums_module_name=enums_module_name,
+                fragments_definitions=fragments_definitions,
+                base_model_import=base_model_import,
+                convert_to_snake_case=convert_to_snake_case,
+                custom_scalars=custom_scalars,
+                plugin_manager=plugin_manager,
+                fragments_module_name=fragments_module_name,
+            )
+            for name, definition in fragments_definitions.items()
+            if isinstance(
+                schema.type_map.get(definition.type_condition.name.value),
+                (GraphQLObjectType, GraphQLInterfaceType),
+            )
+        }
+
+    def generate(self) -> ast.Module:
+        imports: Dict[str, ast.ImportFrom] = {}
+        class_defs: List[ast.ClassDef] = []
+        for name in self._get_sorted_fragments_names():
+            generator = self._generators[name]
+            for import_ in generator.get_imports():
+                imports.setdefault(ast.dump(import_), import_)
+            class_defs.extend(generator.get_classes())
+
+        update_forward_refs_calls = [
+            generate_expr(
+                generate_method_call(class_def.name, UPDATE_FORWARD_REFS_METHOD)
+            )
+            for class_def in class_defs
+        ]
+        module = generate_module(
+            cast(List[ast.stmt], list(imports.values()))
+            + cast(List[ast.stmt], class_defs)
+            + cast(List[ast.stmt], update_forward_refs_calls)
+        )
+        if self.plugin_manager:
+            module = self.plugin_manager.generate_fragments_module(
+                module, fragments_definitions=self.fragments_definitions
+            )
+        return module
+
+    def get_generated_public_names(self) -> List[str]:
+        return [
+            name
+            for fragment_name in self._get_sorted_fragments_names()
+            for name in self._generators[fragment_name].get_generated_public_names()
+        ]
+
+    def _get_sorted_fragments_names(self) -> List[str]:
+        """Return names of fragments, ones inherited by others go first."""
+        sorted_names: List[str] = []
+        visited: Set[str] = set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            visited.add(name)
+            for base_name in sorted(
+                self._generators[name].get_inherited_fragments_names()
+            ):
+                visit(base_name)
+            sorted_names.append(name)
+
+        for name in self._generators:
+            visit(name)
+        return sorted_names
@@ -1,14 +1,43 @@
 import ast
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from ..codegen import generate_import_from
+from ..codegen import (
+    generate_arg,
+    generate_arguments,
+    generate_assign,
+    generate_call,
+    generate_constant,
+    generate_dict,
+    generate_import_from,
+    generate_method_definition,
+    generate_name,
+    generate_return,
+    generate_subscript,
+)
 from ..plugins.manager import PluginManager
+from .constants import ANY, LIST, TYPING_MODULE
+
+TYPE_CHECKING_FLAG = "TYPE_CHECKING"
+IMPORTLIB_MODULE = "importlib"
+IMPORT_MODULE_FUNCTION = "import_module"
+LAZY_IMPORTS_VARIABLE_NAME = "_LAZY_IMPORTS"
+# Names used by lazy module are imported as private aliases, to not shadow
+# exported names nor be exported themselves.
+LAZY_MODULE_ALIASES = {
+    IMPORT_MODULE_FUNCTION: "_import_module",
+    TYPE_CHECKING_FLAG: "_TYPE_CHECKING",
+    ANY: "_Any",
+    LIST: "_List",
+}
 
 
 class InitFileGenerator:
-    def __init__(self, plugin_manager: Optional[PluginManager] = None) -> None:
+    def __init__(
+        self, plugin_manager: Optional[PluginManager] = None, lazy: bool = False
+    ) -> None:
         self.imports: list = []
         self.plugin_manager = plugin_manager
+        self.lazy = lazy
 
     def add_import(self, names: List[str], from_: str, level: int = 0) -> None:
         """Add import to be included in init file."""
@@ -21,7 +50,10 @@ class InitFileGenerator:
 
     def generate(self) -> ast.Module:
         """Generate init with imports and public api of package."""
-        module = ast.Module(body=self.imports, type_ignores=[])
+        if self.lazy:
+            module = self._generate_lazy_module()
+        else:
+            module = ast.Module(body=self.imports, type_ignores=[])
         if self.imports:
             constants_names: List[str] = []
             for import_ in self.imports:
@@ -41,6 +73,152 @@ class InitFileGenerator:
                     lineno=len(self.imports) + 1,
                 )
             )
+        if self.lazy and self.imports:
+            module.body.extend(self._generate_lazy_functions())
         if self.plugin_manager:
             module = self.plugin_manager.generate_init_module(module)
         return module
+
+    def _generate_lazy_module(self) -> ast.Module:
+        """
+        Generate module importing names only for type checkers. At runtime names
+        are imported on first access, using table mapping them to modules.
+        """
+        if not self.imports:
+            return ast.Module(body=[], type_ignores=[])
+
+        lazy_imports: Dict[str, str] = {}
+        eager_imports: List[ast.stmt] = []
+        for import_ in self.imports:
+            if isinstance(import_, ast.ImportFrom) and all(
+                not alias.asname for alias in import_.names
+            ):
+                module_name = "." * (import_.level or 0) + (import_.module or "")
+                for alias in import_.names:
+                    lazy_imports[alias.name] = module_name
+            else:
+                eager_imports.append(import_)
+
+        return ast.Module(
+            body=[
+                generate_aliased_import_from(
+                    [IMPORT_MODULE_FUNCTION], IMPORTLIB_MODULE
+                ),
+                generate_aliased_import_from(
+                    [TYPE_CHECKING_FLAG, ANY, LIST], TYPING_MODULE
+                ),
+                *eager_imports,
+                ast.If(
+                    test=generate_name(LAZY_MODULE_ALIASES[TYPE_CHECKING_FLAG]),
+                    body=[i for i in self.imports if i not in eager_imports],
+                    orelse=[],
+                ),
+                generate_assign(
+                    [LAZY_IMPORTS_VARIABLE_NAME],
+                    generate_dict(
+                        keys=[generate_constant(n) for n in sorted(lazy_imports)],
+                        values=[
+                            generate_constant(lazy_imports[n])
+                            for n in sorted(lazy_imports)
+                        ],
+                    ),
+                ),
+            ],
+            type_ignores=[],
+        )
+
+    def _generate_lazy_functions(self) -> List[ast.stmt]:
+        getattr_body: List[ast.stmt] = [
+            ast.If(
+                test=ast.Compare(
+                    left=generate_name("name"),
+                    ops=[ast.NotIn()],
+                    comparators=[generate_name(LAZY_IMPORTS_VARIABLE_NAME)],
+                ),
+                body=[
+                    ast.Raise(
+                        exc=generate_call(
+                            generate_name("AttributeError"),
+                            [
+                                ast.JoinedStr(
+                                    values=[
+                                        generate_constant("module "),
+                                        ast.FormattedValue(
+                                            value=generate_name("__name__"),
+                                            conversion=ord("r"),
+                                        ),
+                                        generate_constant(" has no attribute "),
+                                        ast.FormattedValue(
+                                            value=generate_name("name"),
+                                            conversion=ord("r"),
+                                        ),
+                                    ]
+                                )
+                            ],
+                        )
+                    )
+                ],
+                orelse=[],
+            ),
+            generate_assign(
+                ["value"],
+                generate_call(
+                    generate_name("getattr"),
+                    [
+                        generate_call(
+                            generate_name(LAZY_MODULE_ALIASES[IMPORT_MODULE_FUNCTION]),
+                            [
+                                generate_subscript(
+                                    generate_name(LAZY_IMPORTS_VARIABLE_NAME),
+                                    generate_name("name"),
+                                ),
+                                generate_name("__package__"),
+                            ],
+                        ),
+                        generate_name("name"),
+                    ],
+                ),
+            ),
+            # Imported value is cached, so __getattr__ is called once per name.
+            ast.Assign(
+                targets=[
+                    generate_subscript(
+                        generate_call(generate_name("globals")), generate_name("name")
+                    )
+                ],
+                value=generate_name("value"),
+                lineno=1,
+            ),
+            generate_return(generate_name("value")),
+        ]
+        return [
+            generate_method_definition(
+                name="__getattr__",
+                arguments=generate_arguments(
+                    [generate_arg("name", generate_name("str"))]
+                ),
+                return_type=generate_name(LAZY_MODULE_ALIASES[ANY]),
+                body=getattr_body,
+            ),
+            generate_method_definition(
+                name="__dir__",
+                arguments=generate_arguments(),
+                return_type=generate_subscript(
+                    generate_name(LAZY_MODULE_ALIASES[LIST]), generate_name("str")
+                ),
+                body=[
+                    generate_return(
+                        generate_call(generate_name("list"), [generate_name("__all__")])
+                    )
+                ],
+            ),
+        ]
+
+
+def generate_aliased_import_from(names: List[str], from_: str) -> ast.ImportFrom:
+    """Generate import from statement importing names as LAZY_MODULE_ALIASES."""
+    return ast.ImportFrom(
+        module=from_,
+        names=[ast.alias(name=n, asname=LAZY_MODULE_ALIASES[n]) for n in names],
+        level=0,
+    )
@@ -1,6 +1,6 @@
 import ast
 from collections import defaultdict
-from typing import Dict, List, Optional, cast
+from typing import Collection, Dict, List, Optional, cast
 
 from graphql import (
     GraphQLEnumType,
@@ -45,8 +45,10 @@ class InputTypesGenerator:
         base_model_import: Optional[ast.ImportFrom] = None,
         custom_scalars: Optional[Dict[str, ScalarData]] = None,
         plugin_manager: Optional[PluginManager] = None,
+        included_types: Optional[Collection[str]] = None,
     ) -> None:
         self.schema = schema
+        self.included_types = included_types
         self.convert_to_snake_case = convert_to_snake_case
         self.enums_module = enums_module
         self.custom_scalars = custom_scalars if custom_scalars else {}
@@ -103,6 +105,7 @@ class InputTypesGenerator:
             for name, definition in self.schema.type_map.items()
             if isinstance(definition, GraphQLInputObjectType)
             and not name.startswith("__")
+            and (self.included_types is None or name in self.included_types)
         ]
 
     def _parse_input_definition(
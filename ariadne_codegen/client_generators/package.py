@@ -1,34 +1,81 @@
 import ast
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
 
-from graphql import FragmentDefinitionNode, GraphQLSchema, OperationDefinitionNode
+from graphql import (
+    FragmentDefinitionNode,
+    GraphQLSchema,
+    NameNode,
+    OperationDefinitionNode,
+)
 
 from ..codegen import generate_import_from
 from ..exceptions import ParsingError
 from ..plugins.manager import PluginManager
-from ..utils import ast_to_str, str_to_pascal_case, str_to_snake_case
+from ..profiling import Profiler, profile_stage
+from ..settings import ClientSettings
+from ..utils import (
+    Formatter,
+    ast_to_str,
+    str_to_pascal_case,
+    str_to_snake_case,
+    write_file_atomically,
+)
 from .arguments import ArgumentsGenerator
+from .cache import CachedResultTypes, ResultTypesCache, get_result_types_cache_base_key
 from .client import ClientGenerator
+from .common_types import CommonTypesGenerator
 from .constants import (
     BASE_MODEL_CLASS_NAME,
     COMMENT_DATETIME_FORMAT,
     DEFAULT_ASYNC_BASE_CLIENT_PATH,
     DEFAULT_BASE_CLIENT_PATH,
     GRAPHQL_CLIENT_EXCEPTIONS_NAMES,
+    RESULT_TYPES_MODULE_NAME,
     SOURCE_COMMENT,
     TIMESTAMP_COMMENT,
 )
 from .enums import EnumsGenerator
+from .fragments import FragmentsGenerator
 from .init_file import InitFileGenerator
 from .input_types import InputTypesGenerator
-from .result_types import ResultTypesGenerator
+from .result_types import RESULT_TYPES_HOOKS, ResultTypesGenerator
+from .result_types_pool import (
+    GeneratedResultTypes,
+    ResultTypesCodeGenerator,
+    generate_in_worker,
+    init_worker,
+)
 from .scalars import ScalarData, ScalarsDefinitionsGenerator
+from .shards import generate_index_module, merge_modules, pack_by_size, split_module
+from .used_types import get_used_types_names
+
+
+@dataclass
+class GeneratedModule:
+    file_name: str
+    code_hook: str
+    module: Optional[ast.Module] = None
+    code: Optional[str] = None
+    source: str = ""
+    remove_unused_imports: bool = True
+    multiline_strings: bool = False
+
+
+def remove_timestamp_comment(code: str) -> str:
+    """Return code without leading comment with generation timestamp."""
+    timestamp_prefix = TIMESTAMP_COMMENT.split("{}", maxsplit=1)[0]
+    if code.startswith(timestamp_prefix):
+        return code.split("\n", maxsplit=1)[-1]
+    return code
 
 
 class PackageGenerator:
-    def __init__(
+    def __init__(  # pylint: disable=too-many-statements
         self,
         package_name: str,
         target_path: str,
@@ -39,6 +86,12 @@ class PackageGenerator:
         base_client_file_path: Optional[str] = None,
         enums_module_name: str = "enums",
         input_types_module_name: str = "input_types",
+        fragments_module_name: Optional[str] = None,
+        common_types_module_name: Optional[str] = None,
+        prune_unused_types: bool = False,
+        lazy_init: bool = False,
+        input_types_shards: Optional[int] = None,
+        result_types_shards: Optional[int] = None,
         include_comments: bool = True,
         queries_source: str = "",
         schema_source: str = "",
@@ -53,6 +106,12 @@ class PackageGenerator:
         files_to_include: Optional[List[str]] = None,
         custom_scalars: Optional[Dict[str, ScalarData]] = None,
         plugin_manager: Optional[PluginManager] = None,
+        jobs: int = 1,
+        cache_dir: Optional[str] = None,
+        cache_entries: Optional[Dict[str, CachedResultTypes]] = None,
+        skip_unchanged_files: bool = False,
+        formatter: Formatter = Formatter.FULL,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         self.package_name = package_name
         self.target_path = target_path
@@ -63,6 +122,13 @@ class PackageGenerator:
         self.custom_scalars = custom_scalars if custom_scalars else {}
 
         self.plugin_manager = plugin_manager
+        # Plugins used by processes generating result types, None if they cannot
+        # be sent to processes, because they aren't pure or picklable.
+        self.pool_plugin_manager = (
+            plugin_manager.get_pool_plugin_manager(RESULT_TYPES_HOOKS)
+            if plugin_manager and jobs > 1
+            else None
+        )
 
         self.base_model_file_path = (
             Path(__file__).parent / "dependencies" / "base_model.py"
@@ -80,6 +146,11 @@ class PackageGenerator:
 
         self.enums_module_name = enums_module_name
         self.input_types_module_name = input_types_module_name
+        self.fragments_module_name = fragments_module_name
+        self.common_types_module_name = common_types_module_name
+        self.prune_unused_types = prune_unused_types
+        self.input_types_shards = input_types_shards
+        self.result_types_shards = result_types_shards
         self.client_file_name = client_file_name
 
         self.include_comments = include_comments
@@ -87,11 +158,15 @@ class PackageGenerator:
         self.schema_source = schema_source
         self.convert_to_snake_case = convert_to_snake_case
         self.async_client = async_client
+        self.jobs = jobs
+        self.skip_unchanged_files = skip_unchanged_files
+        self.formatter = formatter
+        self.profiler = profiler
 
         self.init_generator = (
             init_generator
             if init_generator
-            else InitFileGenerator(plugin_manager=self.plugin_manager)
+            else InitFileGenerator(plugin_manager=self.plugin_manager, lazy=lazy_init)
         )
         self.client_generator = (
             client_generator
@@ -112,22 +187,17 @@ class PackageGenerator:
                 plugin_manager=self.plugin_manager,
             )
         )
+        # If unused types are pruned, generators of schema types are created
+        # after all operations are added.
         self.input_types_generator = (
             input_types_generator
-            if input_types_generator
-            else InputTypesGenerator(
-                schema=self.schema,
-                enums_module=self.enums_module_name,
-                convert_to_snake_case=self.convert_to_snake_case,
-                base_model_import=self.base_model_import,
-                custom_scalars=self.custom_scalars,
-                plugin_manager=self.plugin_manager,
-            )
+            if input_types_generator or self.prune_unused_types
+            else self._get_input_types_generator()
         )
         self.enums_generator = (
             enums_generator
-            if enums_generator
-            else EnumsGenerator(schema=self.schema, plugin_manager=self.plugin_manager)
+            if enums_generator or self.prune_unused_types
+            else self._get_enums_generator()
         )
 
         if base_client_file_path:
@@ -140,28 +210,71 @@ class PackageGenerator:
 
         self.fragments_definitions = {f.name.value: f for f in fragments or []}
 
+        self.operations_definitions: List[OperationDefinitionNode] = []
+        self._used_types_names: Optional[Set[str]] = None
         self.result_types_files: Dict[str, ast.Module] = {}
+        self.result_types_classes_types: Dict[str, Dict[str, str]] = {}
+        self.cached_result_types_files: Dict[str, str] = {}
+        self.converted_result_types_files: Dict[str, str] = {}
+        self._result_types_to_cache: Dict[str, Tuple[str, str, List[str]]] = {}
+        self._result_types_names: Dict[str, Tuple[str, List[str]]] = {}
+        self._result_types_shards: Optional[Dict[str, List[str]]] = None
         self.generated_files: List[str] = []
         self.include_exceptions_file = self._include_exceptions()
 
-        self.scalars_definitions_generator = ScalarsDefinitionsGenerator(
-            scalars_data=list(self.custom_scalars.values()),
-            plugin_manager=self.plugin_manager,
+        self.scalars_definitions_generator = (
+            None
+            if self.prune_unused_types
+            else self._get_scalars_definitions_generator()
         )
         self.scalars_definitions_file_name = "scalars"
 
+        self.result_types_cache = (
+            ResultTypesCache(
+                cache_dir=cache_dir,
+                entries=cache_entries,
+                base_key=get_result_types_cache_base_key(
+                    schema=self.schema,
+                    enums_module_name=self.enums_module_name,
+                    convert_to_snake_case=self.convert_to_snake_case,
+                    base_model_import=ast.dump(self.base_model_import),
+                    custom_scalars=self.custom_scalars,
+                    plugin_manager=self.plugin_manager,
+                    formatter=self.formatter,
+                    fragments_module_name=self.fragments_module_name,
+                ),
+            )
+            # Modules with shared models or merged into shards depend on other
+            # operations, so they cannot be cached per operation. Neither can
+            # modules modified by plugins keeping state between hooks calls.
+            if (cache_dir or cache_entries is not None)
+            and not common_types_module_name
+            and not result_types_shards
+            and (
+                not plugin_manager or plugin_manager.are_hooks_pure(RESULT_TYPES_HOOKS)
+            )
+            else None
+        )
+
     def generate(self) -> List[str]:
         """Generate package with graphql client."""
         self._validate_unique_file_names()
         if not self.package_path.exists():
             self.package_path.mkdir()
-        self._generate_client()
-        self._generate_enums()
-        self._generate_input_types()
-        self._generate_result_types()
+        generated_modules = [
+            self._generate_client(),
+            self._generate_enums(),
+            *self._generate_input_types(),
+            *self._generate_result_types(),
+        ]
+        if self.fragments_module_name:
+            generated_modules.append(self._generate_fragments())
         self._copy_files()
-        self._generate_scalars_definitions()
-        self._generate_init()
+        generated_modules.append(self._generate_scalars_definitions())
+        generated_modules.append(self._generate_init())
+        self._write_generated_modules(generated_modules)
+        if self.result_types_cache:
+            self.result_types_cache.prune()
 
         return sorted(self.generated_files)
 
@@ -170,26 +283,131 @@ class PackageGenerator:
         if not name:
             raise ParsingError("Query without name.")
 
-        return_type_name = str_to_pascal_case(name.value)
-        method_name = str_to_snake_case(name.value)
-        module_name = method_name
-        file_name = f"{module_name}.py"
+        with profile_stage(self.profiler, "add_operation", operation=name.value):
+            self._add_operation(definition, name.value)
+        self.operations_definitions.append(definition)
+
+    def add_operations(self, definitions: Iterable[OperationDefinitionNode]):
+        """
+        Add operations. If jobs is greater than 1, result types of operations are
+        generated and converted into code by processes of a pool, then added in
+        given order. Otherwise, or if plugins modifying result types aren't pure
+        or shared models need ast of result types, operations are added one by one.
+        """
+        definitions = list(definitions)
+        for definition in definitions:
+            if not definition.name:
+                raise ParsingError("Query without name.")
+
+        if not self._can_add_operations_in_parallel(definitions):
+            for definition in definitions:
+                self.add_operation(definition)
+            return
+
+        with profile_stage(self.profiler, "add_operation", jobs=str(self.jobs)):
+            self._add_operations_in_parallel(definitions)
+        self.operations_definitions.extend(definitions)
+
+    def _can_add_operations_in_parallel(
+        self, definitions: List[OperationDefinitionNode]
+    ) -> bool:
+        return (
+            self.jobs > 1
+            and len(definitions) > 1
+            and (not self.plugin_manager or self.pool_plugin_manager is not None)
+            and not self.common_types_module_name
+            and not self.result_types_shards
+        )
 
-        query_types_generator = ResultTypesGenerator(
+    def _add_operations_in_parallel(self, definitions: List[OperationDefinitionNode]):
+        cached_results: Dict[str, Tuple[str, List[str]]] = {}
+        cache_keys: Dict[str, str] = {}
+        definitions_to_generate: List[OperationDefinitionNode] = []
+        for definition in definitions:
+            file_name = self._get_operation_file_name(definition)
+            cache_key, cached = self._get_cached_result_types(file_name, definition)
+            if cached:
+                cached_results[file_name] = cached
+                continue
+            if cache_key:
+                cache_keys[file_name] = cache_key
+            definitions_to_generate.append(definition)
+
+        generated = iter(self._generate_result_types_codes(definitions_to_generate))
+        for definition in definitions:
+            file_name = self._get_operation_file_name(definition)
+            if file_name in cached_results:
+                operation_str, public_names = cached_results[file_name]
+            else:
+                result = next(generated)
+                self.converted_result_types_files[file_name] = result.code
+                operation_str, public_names = result.operation_str, result.public_names
+                if file_name in cache_keys:
+                    self._result_types_to_cache[file_name] = (
+                        cache_keys[file_name],
+                        operation_str,
+                        public_names,
+                    )
+            self._add_operation_to_client(
+                definition,
+                cast(NameNode, definition.name).value,
+                operation_str,
+                public_names,
+            )
+
+    def _generate_result_types_codes(
+        self, definitions: List[OperationDefinitionNode]
+    ) -> List[GeneratedResultTypes]:
+        generator = ResultTypesCodeGenerator(
             schema=self.schema,
-            operation_definition=definition,
-            enums_module_name=self.enums_module_name,
+            operations_definitions=definitions,
             fragments_definitions=self.fragments_definitions,
+            enums_module_name=self.enums_module_name,
             base_model_import=self.base_model_import,
             convert_to_snake_case=self.convert_to_snake_case,
             custom_scalars=self.custom_scalars,
-            plugin_manager=self.plugin_manager,
-        )
-        self.result_types_files[file_name] = query_types_generator.generate()
-        operation_str = query_types_generator.get_operation_as_str()
-        self.init_generator.add_import(
-            query_types_generator.get_generated_public_names(), module_name, 1
+            fragments_module_name=self.fragments_module_name,
+            formatter=self.formatter,
+            plugin_manager=self.pool_plugin_manager,
         )
+        if len(definitions) < 2:
+            return [generator.generate(index) for index in range(len(definitions))]
+
+        chunksize = max(1, len(definitions) // (self.jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=init_worker, initargs=(generator,)
+        ) as executor:
+            return list(
+                executor.map(
+                    generate_in_worker, range(len(definitions)), chunksize=chunksize
+                )
+            )
+
+    def _get_operation_file_name(self, definition: OperationDefinitionNode) -> str:
+        return f"{str_to_snake_case(cast(NameNode, definition.name).value)}.py"
+
+    def _add_operation(self, definition: OperationDefinitionNode, name: str):
+        file_name = f"{str_to_snake_case(name)}.py"
+        operation_str, public_names = self._add_result_types(file_name, definition)
+        self._add_operation_to_client(definition, name, operation_str, public_names)
+
+    def _add_operation_to_client(
+        self,
+        definition: OperationDefinitionNode,
+        name: str,
+        operation_str: str,
+        public_names: List[str],
+    ):
+        return_type_name = str_to_pascal_case(name)
+        method_name = str_to_snake_case(name)
+        module_name = method_name
+        file_name = f"{module_name}.py"
+
+        if self.result_types_shards:
+            # Module of operation is known after all operations are added.
+            self._result_types_names[file_name] = (return_type_name, public_names)
+        else:
+            self.init_generator.add_import(public_names, module_name, 1)
 
         arguments, arguments_dict = self.arguments_generator.generate(
             definition.variable_definitions
@@ -202,7 +420,61 @@ class PackageGenerator:
             operation_str=operation_str,
             async_=self.async_client,
         )
-        self.client_generator.add_import([return_type_name], module_name, 1)
+        if not self.result_types_shards:
+            self.client_generator.add_import([return_type_name], module_name, 1)
+
+    def _get_cached_result_types(
+        self, file_name: str, definition: OperationDefinitionNode
+    ) -> Tuple[Optional[str], Optional[Tuple[str, List[str]]]]:
+        """Return cache key and cached operation string and public names."""
+        if not self.result_types_cache:
+            return None, None
+        cache_key = self.result_types_cache.get_key(
+            definition, self.fragments_definitions
+        )
+        cached = self.result_types_cache.get(cache_key)
+        if not cached:
+            return cache_key, None
+        self.cached_result_types_files[file_name] = cached.code
+        return cache_key, (cached.operation_str, cached.public_names)
+
+    def _add_result_types(
+        self, file_name: str, definition: OperationDefinitionNode
+    ) -> Tuple[str, List[str]]:
+        cache_key, cached = self._get_cached_result_types(file_name, definition)
+        if cached:
+            return cached
+
+        with profile_stage(
+            self.profiler,
+            "generate",
+            generator="result_types",
+            operation=cast(NameNode, definition.name).value,
+        ):
+            query_types_generator = ResultTypesGenerator(
+                schema=self.schema,
+                operation_definition=definition,
+                enums_module_name=self.enums_module_name,
+                fragments_definitions=self.fragments_definitions,
+                base_model_import=self.base_model_import,
+                convert_to_snake_case=self.convert_to_snake_case,
+                custom_scalars=self.custom_scalars,
+                plugin_manager=self.plugin_manager,
+                fragments_module_name=self.fragments_module_name,
+            )
+            self.result_types_files[file_name] = query_types_generator.generate()
+            self.result_types_classes_types[
+                file_name
+            ] = query_types_generator.get_classes_types()
+        operation_str = query_types_generator.get_operation_as_str()
+        public_names = query_types_generator.get_generated_public_names()
+        if cache_key:
+            self._result_types_to_cache[file_name] = (
+                cache_key,
+                operation_str,
+                public_names,
+            )
+        return operation_str, public_names
 
     def _include_exceptions(self):
         return self.base_client_file_path in (
@@ -211,18 +483,31 @@ class PackageGenerator:
         )
 
     def _validate_unique_file_names(self):
-        file_names = (
-            [
-                f"{self.client_file_name}.py",
-                self.base_client_file_path.name,
-                self.base_model_file_path.name,
-                f"{self.enums_module_name}.py",
-                f"{self.input_types_module_name}.py",
-                f"{self.scalars_definitions_file_name}.py",
-            ]
-            + list(self.result_types_files.keys())
-            + [f.name for f in self.files_to_include]
-        )
+        file_names = [
+            f"{self.client_file_name}.py",
+            self.base_client_file_path.name,
+            self.base_model_file_path.name,
+            f"{self.enums_module_name}.py",
+            f"{self.input_types_module_name}.py",
+            f"{self.scalars_definitions_file_name}.py",
+        ] + [f.name for f in self.files_to_include]
+        if self.input_types_shards:
+            file_names.extend(
+                f"{self.input_types_module_name}_{index}.py"
+                for index in range(self.input_types_shards)
+            )
+        if self.result_types_shards:
+            file_names.extend(
+                f"{shard_name}.py" for shard_name in self._get_result_types_shards()
+            )
+        else:
+            file_names.extend(self.result_types_files.keys())
+            file_names.extend(self.cached_result_types_files.keys())
+            file_names.extend(self.converted_result_types_files.keys())
+        if self.fragments_module_name:
+            file_names.append(f"{self.fragments_module_name}.py")
+        if self.common_types_module_name:
+            file_names.append(f"{self.common_types_module_name}.py")
         if self.include_exceptions_file:
             file_names.append(self.exceptions_file_path.name)
 
@@ -231,9 +516,32 @@ class PackageGenerator:
             duplicated_files = {n for n in file_names if n in seen or seen.add(n)}
             raise ParsingError(f"Duplicated file names: {',' .join(duplicated_files)}")
 
-    def _generate_client(self):
-        client_file_path = self.package_path / f"{self.client_file_name}.py"
-
+    def _get_result_types_shards(self) -> Dict[str, List[str]]:
+        """Return names of shards mapped to files of operations merged into them."""
+        if self._result_types_shards is None:
+            packed = pack_by_size(
+                {
+                    file_name: len(self.result_types_classes_types[file_name])
+                    for file_name in self.result_types_files
+                },
+                cast(int, self.result_types_shards),
+            )
+            self._result_types_shards = {
+                f"{RESULT_TYPES_MODULE_NAME}_{index}": file_names
+                for index, file_names in enumerate(packed)
+            }
+        return self._result_types_shards
+
+    def _add_result_types_shards_imports(self):
+        for shard_name, file_names in self._get_result_types_shards().items():
+            for file_name in file_names:
+                return_type_name, public_names = self._result_types_names[file_name]
+                self.client_generator.add_import([return_type_name], shard_name, 1)
+                self.init_generator.add_import(public_names, shard_name, 1)
+
+    def _generate_client(self) -> GeneratedModule:
+        if self.result_types_shards:
+            self._add_result_types_shards_imports()
         self.client_generator.add_import(
             names=self.arguments_generator.get_used_inputs(),
             from_=self.input_types_module_name,
@@ -258,18 +566,18 @@ class PackageGenerator:
             level=1,
         )
 
-        client_module = self.client_generator.generate()
-        code = self._proccess_generated_code(
-            ast_to_str(client_module, multiline_strings=True), self.queries_source
-        )
-        if self.plugin_manager:
-            code = self.plugin_manager.generate_client_code(code)
-        client_file_path.write_text(code)
-        self.generated_files.append(client_file_path.name)
-
+        with profile_stage(self.profiler, "generate", generator="client"):
+            client_module = self.client_generator.generate()
         self.init_generator.add_import(
             names=[self.client_generator.name], from_=self.client_file_name, level=1
         )
+        return GeneratedModule(
+            file_name=f"{self.client_file_name}.py",
+            module=client_module,
+            code_hook="generate_client_code",
+            source=self.queries_source,
+            multiline_strings=True,
+        )
 
     def _proccess_generated_code(self, code: str, source: str = "") -> str:
         if self.include_comments:
@@ -284,42 +592,192 @@ class PackageGenerator:
 
         return code
 
-    def _generate_enums(self):
-        module = self.enums_generator.generate()
-        code = self._proccess_generated_code(ast_to_str(module), self.schema_source)
-        if self.plugin_manager:
-            code = self.plugin_manager.generate_enums_code(code)
-        enums_file_path = self.package_path / f"{self.enums_module_name}.py"
-        enums_file_path.write_text(code)
-        self.generated_files.append(enums_file_path.name)
+    def _get_used_types_names(self) -> Optional[Set[str]]:
+        """Return names of schema types to generate, None means all types."""
+        if not self.prune_unused_types:
+            return None
+        if self._used_types_names is None:
+            with profile_stage(self.profiler, "used_types"):
+                self._used_types_names = get_used_types_names(
+                    self.schema,
+                    [
+                        *self.operations_definitions,
+                        *self.fragments_definitions.values(),
+                    ],
+                )
+        return self._used_types_names
+
+    def _get_enums_generator(self) -> EnumsGenerator:
+        return EnumsGenerator(
+            schema=self.schema,
+            plugin_manager=self.plugin_manager,
+            included_types=self._get_used_types_names(),
+        )
+
+    def _get_input_types_generator(self) -> InputTypesGenerator:
+        return InputTypesGenerator(
+            schema=self.schema,
+            enums_module=self.enums_module_name,
+            convert_to_snake_case=self.convert_to_snake_case,
+            base_model_import=self.base_model_import,
+            custom_scalars=self.custom_scalars,
+            plugin_manager=self.plugin_manager,
+            included_types=self._get_used_types_names(),
+        )
+
+    def _get_scalars_definitions_generator(self) -> ScalarsDefinitionsGenerator:
+        used_types_names = self._get_used_types_names()
+        return ScalarsDefinitionsGenerator(
+            scalars_data=[
+                data
+                for name, data in self.custom_scalars.items()
+                if used_types_names is None or name in used_types_names
+            ],
+            plugin_manager=self.plugin_manager,
+        )
+
+    def _generate_enums(self) -> GeneratedModule:
+        if not self.enums_generator:
+            self.enums_generator = self._get_enums_generator()
+        with profile_stage(self.profiler, "generate", generator="enums"):
+            module = self.enums_generator.generate()
         self.init_generator.add_import(
             self.enums_generator.get_generated_public_names(), self.enums_module_name, 1
         )
+        return GeneratedModule(
+            file_name=f"{self.enums_module_name}.py",
+            module=module,
+            code_hook="generate_enums_code",
+            source=self.schema_source,
+        )
 
-    def _generate_input_types(self):
-        module = self.input_types_generator.generate()
-        input_types_file_path = self.package_path / f"{self.input_types_module_name}.py"
-        code = self._proccess_generated_code(ast_to_str(module), self.schema_source)
-        if self.plugin_manager:
-            code = self.plugin_manager.generate_inputs_code(code)
-        input_types_file_path.write_text(code)
-        self.generated_files.append(input_types_file_path.name)
+    def _generate_input_types(self) -> List[GeneratedModule]:
+        if not self.input_types_generator:
+            self.input_types_generator = self._get_input_types_generator()
+        with profile_stage(self.profiler, "generate", generator="input_types"):
+            module = self.input_types_generator.generate()
         self.init_generator.add_import(
             self.input_types_generator.get_generated_public_names(),
             self.input_types_module_name,
             1,
         )
+        if not self.input_types_shards:
+            return [
+                GeneratedModule(
+                    file_name=f"{self.input_types_module_name}.py",
+                    module=module,
+                    code_hook="generate_inputs_code",
+                    source=self.schema_source,
+                )
+            ]
+
+        with profile_stage(self.profiler, "generate", generator="input_types_shards"):
+            shards_modules = split_module(
+                module, self.input_types_module_name, self.input_types_shards
+            )
+            index_module = generate_index_module(shards_modules)
+        return [
+            GeneratedModule(
+                file_name=f"{self.input_types_module_name}.py",
+                module=index_module,
+                code_hook="generate_inputs_code",
+                source=self.schema_source,
+                remove_unused_imports=False,
+            )
+        ] + [
+            GeneratedModule(
+                file_name=f"{shard_name}.py",
+                module=shard_module,
+                code_hook="generate_inputs_code",
+                source=self.schema_source,
+            )
+            for shard_name, shard_module in shards_modules.items()
+        ]
+
+    def _generate_result_types(self) -> List[GeneratedModule]:
+        common_types_modules = []
+        if self.common_types_module_name:
+            common_types_modules.append(self._generate_common_types())
+        if self.result_types_shards:
+            return common_types_modules + [
+                GeneratedModule(
+                    file_name=f"{shard_name}.py",
+                    module=merge_modules(
+                        [self.result_types_files[file_name] for file_name in file_names]
+                    ),
+                    code_hook="generate_result_types_code",
+                    source=self.queries_source,
+                )
+                for shard_name, file_names in self._get_result_types_shards().items()
+            ]
+        return (
+            common_types_modules
+            + [
+                GeneratedModule(
+                    file_name=file_name,
+                    module=module,
+                    code_hook="generate_result_types_code",
+                    source=self.queries_source,
+                )
+                for file_name, module in self.result_types_files.items()
+            ]
+            + [
+                GeneratedModule(
+                    file_name=file_name,
+                    code=code,
+                    code_hook="generate_result_types_code",
+                    source=self.queries_source,
+                )
+                for file_name, code in {
+                    **self.cached_result_types_files,
+                    **self.converted_result_types_files,
+                }.items()
+            ]
+        )
 
-    def _generate_result_types(self):
+    def _generate_common_types(self) -> GeneratedModule:
+        common_types_generator = CommonTypesGenerator(
+            module_name=cast(str, self.common_types_module_name)
+        )
         for file_name, module in self.result_types_files.items():
-            file_path = self.package_path / file_name
-            code = self._proccess_generated_code(
-                ast_to_str(module), self.queries_source
+            common_types_generator.add_module(
+                Path(file_name).stem,
+                module,
+                self.result_types_classes_types[file_name],
             )
-            if self.plugin_manager:
-                code = self.plugin_manager.generate_result_types_code(code)
-            file_path.write_text(code)
-            self.generated_files.append(file_path.name)
+        with profile_stage(self.profiler, "generate", generator="common_types"):
+            module = common_types_generator.generate()
+        return GeneratedModule(
+            file_name=f"{self.common_types_module_name}.py",
+            module=module,
+            code_hook="generate_result_types_code",
+            source=self.queries_source,
+        )
+
+    def _generate_fragments(self) -> GeneratedModule:
+        fragments_generator = FragmentsGenerator(
+            schema=self.schema,
+            fragments_definitions=self.fragments_definitions,
+            enums_module_name=self.enums_module_name,
+            fragments_module_name=cast(str, self.fragments_module_name),
+            base_model_import=self.base_model_import,
+            convert_to_snake_case=self.convert_to_snake_case,
+            custom_scalars=self.custom_scalars,
+            plugin_manager=self.plugin_manager,
+        )
+        with profile_stage(self.profiler, "generate", generator="fragments"):
+            module = fragments_generator.generate()
+        self.init_generator.add_import(
+            fragments_generator.get_generated_public_names(),
+            cast(str, self.fragments_module_name),
+            1,
+        )
+        return GeneratedModule(
+            file_name=f"{self.fragments_module_name}.py",
+            module=module,
+            code_hook="generate_fragments_code",
+            source=self.queries_source,
+        )
 
     def _copy_files(self):
         files_to_copy = self.files_to_include + [
@@ -337,9 +795,7 @@ class PackageGenerator:
             code = self._proccess_generated_code(source_path.read_text())
             if self.plugin_manager:
                 code = self.plugin_manager.copy_code(code)
-            target_path = self.package_path / source_path.name
-            target_path.write_text(code)
-            self.generated_files.append(target_path.name)
+            self._write_file(self.package_path / source_path.name, code)
 
         self.init_generator.add_import(
             names=[self.base_client_name],
@@ -352,22 +808,147 @@ class PackageGenerator:
             level=1,
         )
 
-    def _generate_scalars_definitions(self):
-        module = self.scalars_definitions_generator.generate()
-        scalars_file_path = (
-            self.package_path / f"{self.scalars_definitions_file_name}.py"
-        )
-        code = self._proccess_generated_code(ast_to_str(module))
-        if self.plugin_manager:
-            code = self.plugin_manager.generate_scalars_code(code)
-        scalars_file_path.write_text(code)
-        self.generated_files.append(scalars_file_path.name)
-
-    def _generate_init(self):
-        init_file_path = self.package_path / "__init__.py"
-        init_module = self.init_generator.generate()
-        code = self._proccess_generated_code(ast_to_str(init_module, False))
-        if self.plugin_manager:
-            code = self.plugin_manager.generate_init_code(code)
-        init_file_path.write_text(code)
-        self.generated_files.append(init_file_path.name)
+    def _generate_scalars_definitions(self) -> GeneratedModule:
+        if not self.scalars_definitions_generator:
+            self.scalars_definitions_generator = (
+                self._get_scalars_definitions_generator()
+            )
+        with profile_stage(self.profiler, "generate", generator="scalars"):
+            module = self.scalars_definitions_generator.generate()
+        return GeneratedModule(
+            file_name=f"{self.scalars_definitions_file_name}.py",
+            module=module,
+            code_hook="generate_scalars_code",
+        )
+
+    def _generate_init(self) -> GeneratedModule:
+        with profile_stage(self.profiler, "generate", generator="init"):
+            module = self.init_generator.generate()
+        return GeneratedModule(
+            file_name="__init__.py",
+            module=module,
+            code_hook="generate_init_code",
+            remove_unused_imports=False,
+        )
+
+    def _write_generated_modules(self, generated_modules: List[GeneratedModule]):
+        codes = self._convert_modules_to_str(generated_modules)
+        self._save_result_types_in_cache(generated_modules, codes)
+        for generated_module, code in zip(generated_modules, codes):
+            code = self._proccess_generated_code(code, generated_module.source)
+            if self.plugin_manager:
+                code = getattr(self.plugin_manager, generated_module.code_hook)(code)
+            self._write_file(self.package_path / generated_module.file_name, code)
+
+    def _write_file(self, file_path: Path, code: str):
+        with profile_stage(self.profiler, "write_file", file=file_path.name):
+            self._write_file_if_changed(file_path, code)
+        self.generated_files.append(file_path.name)
+
+    def _write_file_if_changed(self, file_path: Path, code: str):
+        if not (
+            self.skip_unchanged_files
+            and file_path.is_file()
+            and remove_timestamp_comment(file_path.read_text(encoding="utf-8"))
+            == remove_timestamp_comment(code)
+        ):
+            write_file_atomically(file_path, code)
+
+    def _convert_modules_to_str(
+        self, generated_modules: List[GeneratedModule]
+    ) -> List[str]:
+        modules_to_convert = [m for m in generated_modules if m.code is None]
+        modules = [cast(ast.Module, m.module) for m in modules_to_convert]
+        remove_unused_imports = [m.remove_unused_imports for m in modules_to_convert]
+        multiline_strings = [m.multiline_strings for m in modules_to_convert]
+        convert = partial(ast_to_str, formatter=self.formatter)
+        if self.jobs < 2 or len(modules_to_convert) < 2:
+            codes = []
+            for generated_module, module, remove_imports, multiline in zip(
+                modules_to_convert, modules, remove_unused_imports, multiline_strings
+            ):
+                with profile_stage(
+                    self.profiler, "ast_to_str", file=generated_module.file_name
+                ):
+                    codes.append(convert(module, remove_imports, multiline))
+        else:
+            chunksize = max(1, len(modules_to_convert) // (self.jobs * 4))
+            with profile_stage(
+                self.profiler, "ast_to_str", jobs=str(self.jobs)
+            ), ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                codes = list(
+                    executor.map(
+                        convert,
+                        modules,
+                        remove_unused_imports,
+                        multiline_strings,
+                        chunksize=chunksize,
+                    )
+                )
+
+        converted_codes = iter(codes)
+        return [
+            m.code if m.code is not None else next(converted_codes)
+            for m in generated_modules
+        ]
+
+    def _save_result_types_in_cache(
+        self, generated_modules: List[GeneratedModule], codes: List[str]
+    ):
+        if not self.result_types_cache:
+            return
+        for generated_module, code in zip(generated_modules, codes):
+            if generated_module.file_name not in self._result_types_to_cache:
+                continue
+            cache_key, operation_str, public_names = self._result_types_to_cache[
+                generated_module.file_name
+            ]
+            self.result_types_cache.set(
+                cache_key,
+                CachedResultTypes(
+                    code=code, operation_str=operation_str, public_names=public_names
+                ),
+            )
+
+
+def get_package_generator(
+    settings: ClientSettings,
+    schema: GraphQLSchema,
+    schema_source: str,
+    fragments: List[FragmentDefinitionNode],
+    plugin_manager: Optional[PluginManager] = None,
+    cache_entries: Optional[Dict[str, CachedResultTypes]] = None,
+    profiler: Optional[Profiler] = None,
+) -> PackageGenerator:
+    """Return package generator configured with given settings."""
+    return PackageGenerator(
+        package_name=settings.target_package_name,
+        target_path=settings.target_package_path,
+        schema=schema,
+        client_name=settings.client_name,
+        client_file_name=settings.client_file_name,
+        base_client_name=cast(str, settings.base_client_name),
+        base_client_file_path=settings.base_client_file_path,
+        input_types_module_name=settings.input_types_module_name,
+        fragments_module_name=settings.fragments_module_name,
+        common_types_module_name=settings.common_types_module_name,
+        prune_unused_types=settings.prune_unused_types,
+        lazy_init=settings.lazy_init,
+        input_types_shards=settings.input_types_shards,
+        result_types_shards=settings.result_types_shards,
+        queries_source=settings.queries_path,
+        schema_source=schema_source,
+        include_comments=settings.include_comments,
+        fragments=fragments,
+        convert_to_snake_case=settings.convert_to_snake_case,
+        async_client=settings.async_client,
+        files_to_include=settings.files_to_include,
+        custom_scalars=settings.scalars,
+        plugin_manager=plugin_manager,
+        jobs=settings.jobs,
+        cache_dir=settings.cache_dir,
+        cache_entries=cache_entries,
+        skip_unchanged_files=settings.skip_unchanged_files,
+        formatter=settings.formatter,
+        profiler=profiler,
+    )
@@ -1,5 +1,5 @@
 import ast
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
 from graphql import (
     DirectiveNode,
@@ -34,6 +34,7 @@ from ..codegen import (
 from ..exceptions import NotSupported, ParsingError
 from ..plugins.manager import PluginManager
 from ..utils import str_to_pascal_case, str_to_snake_case
+from .cache import get_used_fragments_names
 from .constants import (
     ANY,
     BASE_MODEL_CLASS_NAME,
@@ -53,24 +54,42 @@ from .result_fields import FieldNames, parse_operation_field
 from .scalars import ScalarData
 from .types import CodegenResultFieldType
 
+# Hooks of plugins called by ResultTypesGenerator.
+RESULT_TYPES_HOOKS = [
+    "generate_result_types_module",
+    "generate_operation_str",
+    "generate_result_class",
+    "generate_result_field",
+]
+
 
 class ResultTypesGenerator:
+    """
+    Generates models for result of operation.
+    If fragments module name is provided, models of fragments spread on the same
+    type inherit from models generated into fragments module, instead of having
+    fragments' fields copied into them. Given definition can also be fragment,
+    then its models are generated to be included in fragments module.
+    """
+
     def __init__(
         self,
         schema: GraphQLSchema,
-        operation_definition: OperationDefinitionNode,
+        operation_definition: Union[OperationDefinitionNode, FragmentDefinitionNode],
         enums_module_name: str,
         fragments_definitions: Optional[Dict[str, FragmentDefinitionNode]] = None,
         base_model_import: Optional[ast.ImportFrom] = None,
         convert_to_snake_case: bool = True,
         custom_scalars: Optional[Dict[str, ScalarData]] = None,
         plugin_manager: Optional[PluginManager] = None,
+        fragments_module_name: Optional[str] = None,
     ) -> None:
         self.schema = schema
         self.operation_definition = operation_definition
         if not self.operation_definition.name:
             raise NotSupported("Operations without name are not supported.")
 
+        self.fragments_module_name = fragments_module_name
         self.enums_module_name = enums_module_name
         self.fragments_definitions = (
             fragments_definitions if fragments_definitions else {}
@@ -86,16 +105,24 @@ class ResultTypesGenerator:
             or generate_import_from([BASE_MODEL_CLASS_NAME], PYDANTIC_MODULE),
         ]
         self._public_names: List[str] = []
+        self._classes_types: Dict[str, str] = {}
         self._class_defs: List[ast.ClassDef] = []
         self._used_enums: List[str] = []
         self._used_scalars: List[str] = []
         self._used_fragments_names: set[str] = set()
-
-        self._class_defs = self._parse_type_definition(
-            class_name=str_to_pascal_case(self.operation_definition.name.value),
-            type_name=self._get_operation_type_name(
+        self._inherited_fragments_names: Set[str] = set()
+
+        if isinstance(self.operation_definition, FragmentDefinitionNode):
+            class_name = self.operation_definition.name.value
+            type_name = self.operation_definition.type_condition.name.value
+        else:
+            class_name = str_to_pascal_case(self.operation_definition.name.value)
+            type_name = self._get_operation_type_name(
                 self.operation_definition.operation
-            ),
+            )
+        self._class_defs = self._parse_type_definition(
+            class_name=class_name,
+            type_name=type_name,
             selection_set=self.operation_definition.selection_set,
         )
 
@@ -109,19 +136,6 @@ class ResultTypesGenerator:
         raise NotSupported(f"Not supported operation type: {operation_type}")
 
     def generate(self) -> ast.Module:
-        if self._used_enums:
-            self._imports.append(
-                generate_import_from(self._used_enums, self.enums_module_name, 1)
-            )
-        if self._used_scalars:
-            for scalar_name in self._used_scalars:
-                scalar_data = self.custom_scalars[scalar_name]
-                if scalar_data.import_ and scalar_data.names_to_import:
-                    self._imports.append(
-                        generate_import_from(
-                            names=scalar_data.names_to_import, from_=scalar_data.import_
-                        )
-                    )
         update_forward_refs_calls = [
             generate_expr(
                 generate_method_call(class_def.name, UPDATE_FORWARD_REFS_METHOD)
@@ -129,18 +143,53 @@ class ResultTypesGenerator:
             for class_def in self._class_defs
         ]
         module_body = (
-            cast(List[ast.stmt], self._imports)
+            cast(List[ast.stmt], self.get_imports())
             + cast(List[ast.stmt], self._class_defs)
             + cast(List[ast.stmt], update_forward_refs_calls)
         )
 
         module = generate_module(module_body)
-        if self.plugin_manager:
+        if self.plugin_manager and isinstance(
+            self.operation_definition, OperationDefinitionNode
+        ):
             module = self.plugin_manager.generate_result_types_module(
                 module, operation_definition=self.operation_definition
             )
         return module
 
+    def get_imports(self) -> List[ast.ImportFrom]:
+        imports = list(self._imports)
+        if self._used_enums:
+            imports.append(
+                generate_import_from(self._used_enums, self.enums_module_name, 1)
+            )
+        for scalar_name in self._used_scalars:
+            scalar_data = self.custom_scalars[scalar_name]
+            if scalar_data.import_ and scalar_data.names_to_import:
+                imports.append(
+                    generate_import_from(
+                        names=scalar_data.names_to_import, from_=scalar_data.import_
+                    )
+                )
+        if self._inherited_fragments_names and isinstance(
+            self.operation_definition, OperationDefinitionNode
+        ):
+            imports.append(
+                generate_import_from(
+                    sorted(self._inherited_fragments_names),
+                    cast(str, self.fragments_module_name),
+                    1,
+                )
+            )
+        return imports
+
+    def get_classes(self) -> List[ast.ClassDef]:
+        return self._class_defs
+
+    def get_inherited_fragments_names(self) -> Set[str]:
+        """Return names of fragments which generated models inherit from."""
+        return self._inherited_fragments_names
+
     def get_operation_as_str(self) -> str:
         operation_str = print_ast(self.operation_definition)
         if self._used_fragments_names:
@@ -151,13 +200,20 @@ class ResultTypesGenerator:
 
         if self.plugin_manager:
             operation_str = self.plugin_manager.generate_operation_str(
-                operation_str, operation_definition=self.operation_definition
+                operation_str,
+                operation_definition=cast(
+                    OperationDefinitionNode, self.operation_definition
+                ),
             )
         return operation_str
 
     def get_generated_public_names(self) -> List[str]:
         return self._public_names
 
+    def get_classes_types(self) -> Dict[str, str]:
+        """Return names of schema types represented by generated models."""
+        return self._classes_types
+
     def _parse_type_definition(
         self,
         class_name: str,
@@ -166,24 +222,36 @@ class ResultTypesGenerator:
         add_typename: bool = False,
         extra_bases: Optional[List[str]] = None,
     ) -> List[ast.ClassDef]:
-        class_bases = [BASE_MODEL_CLASS_NAME]
+        if class_name in self._public_names:
+            return []
+        self._public_names.append(class_name)
+        self._classes_types[class_name] = type_name
+
+        resolved_selection_set, inherited_fragments = self._resolve_selection_set(
+            selection_set, type_name, share_fragments=bool(self.fragments_module_name)
+        )
+        self._inherited_fragments_names.update(inherited_fragments)
+        class_bases = list(inherited_fragments) or [BASE_MODEL_CLASS_NAME]
         if extra_bases:
             class_bases.extend(extra_bases)
         class_def = generate_class_def(class_name, class_bases)
 
-        if class_def.name in self._public_names:
-            return []
-        self._public_names.append(class_def.name)
-
         extra_classes = []
-        resolved_selection_set = self._resolve_selection_set(selection_set, type_name)
         if add_typename:
+            inherited_fields = [
+                field
+                for fragment_name in inherited_fragments
+                for field in self._resolve_fragment(fragment_name, type_name)
+            ]
             (
                 resolved_selection_set,
                 selection_set.selections,
             ) = self._add_typename_field_to_selections(
-                resolved_selection_set, selection_set
+                resolved_selection_set, selection_set, inherited_fields
             )
+        if not resolved_selection_set:
+            # All fields are inherited from fragments.
+            class_def.body.append(ast.Pass())
         for lineno, field in enumerate(
             resolved_selection_set,
             start=1,
@@ -226,40 +294,121 @@ class ResultTypesGenerator:
             self._save_used_enums(field_types_names)
             self._save_used_scalars(field_types_names)
 
-            if self.plugin_manager:
-                class_def = self.plugin_manager.generate_result_class(
-                    class_def,
-                    operation_definition=self.operation_definition,
-                    selection_set=selection_set,
-                )
+        if self.plugin_manager:
+            class_def = self.plugin_manager.generate_result_class(
+                class_def,
+                operation_definition=self.operation_definition,
+                selection_set=selection_set,
+            )
         return [class_def] + extra_classes
 
     def _resolve_selection_set(
-        self, selection_set: SelectionSetNode, root_type: str = ""
-    ) -> List[FieldNode]:
-        fields = []
+        self,
+        selection_set: SelectionSetNode,
+        root_type: str = "",
+        share_fragments: bool = False,
+    ) -> Tuple[List[FieldNode], List[str]]:
+        """
+        Return fields selected by selection set and, if fragments are shared,
+        names of fragments which fields are inherited instead of being returned.
+        """
+        # Names of shared fragments are kept in place of their fields, so fields
+        # of fragments which cannot be inherited are inlined in the same order.
+        selections: List[Union[FieldNode, str]] = []
+        shared_fragments: Dict[str, List[FieldNode]] = {}
         for selection in selection_set.selections:
             if isinstance(selection, FieldNode):
-                fields.append(selection)
+                selections.append(selection)
             elif isinstance(selection, FragmentSpreadNode):
-                self._used_fragments_names.add(selection.name.value)
-                fields.extend(
-                    self._resolve_selection_set(
-                        self.fragments_definitions[selection.name.value].selection_set,
-                        root_type,
-                    )
-                )
+                name = selection.name.value
+                fragment_fields = self._resolve_fragment(name, root_type)
+                if share_fragments and self._can_inherit_fragment(name, root_type):
+                    if name not in shared_fragments:
+                        shared_fragments[name] = fragment_fields
+                        selections.append(name)
+                else:
+                    selections.extend(fragment_fields)
             elif isinstance(selection, InlineFragmentNode):
                 if selection.type_condition.name.value == root_type:
-                    fields.extend(
-                        self._resolve_selection_set(selection.selection_set, root_type)
+                    selections.extend(
+                        self._resolve_selection_set(selection.selection_set, root_type)[
+                            0
+                        ]
                     )
-        return fields
+
+        inlined_fragments = self._pop_conflicted_fragments(
+            [s for s in selections if isinstance(s, FieldNode)], shared_fragments
+        )
+        fields: List[FieldNode] = []
+        for item in selections:
+            if isinstance(item, FieldNode):
+                fields.append(item)
+            else:
+                fields.extend(inlined_fragments.get(item, []))
+        for name in shared_fragments:
+            # Fields of inherited fragment are not parsed, so fragments used
+            # by its subfields have to be found here.
+            get_used_fragments_names(
+                self.fragments_definitions[name].selection_set,
+                self.fragments_definitions,
+                self._used_fragments_names,
+            )
+        return fields, list(shared_fragments)
+
+    def _resolve_fragment(self, name: str, root_type: str) -> List[FieldNode]:
+        self._used_fragments_names.add(name)
+        return self._resolve_selection_set(
+            self.fragments_definitions[name].selection_set, root_type
+        )[0]
+
+    def _can_inherit_fragment(self, name: str, type_name: str) -> bool:
+        return self.fragments_definitions[name].type_condition.name.value == type_name
+
+    def _pop_conflicted_fragments(
+        self, fields: List[FieldNode], shared_fragments: Dict[str, List[FieldNode]]
+    ) -> Dict[str, List[FieldNode]]:
+        """Remove from shared fragments ones which have to be inlined."""
+        inlined_fragments: Dict[str, List[FieldNode]] = {}
+        conflicted = self._get_conflicted_fragment(fields, shared_fragments)
+        while conflicted:
+            inlined_fragments[conflicted] = shared_fragments.pop(conflicted)
+            conflicted = self._get_conflicted_fragment(
+                fields + [f for fs in inlined_fragments.values() for f in fs],
+                shared_fragments,
+            )
+        return inlined_fragments
+
+    def _get_conflicted_fragment(
+        self, fields: List[FieldNode], shared_fragments: Dict[str, List[FieldNode]]
+    ) -> Optional[str]:
+        """
+        Return name of shared fragment which selects the same key as other
+        selection, unless both select the same field without subfields.
+        Such fragment cannot be inherited, because its field would be overridden.
+        """
+        groups = [("", fields)] + list(shared_fragments.items())
+        for name, fragment_fields in groups[1:]:
+            fragment_keys = {
+                self._get_field_name(f): print_ast(f) for f in fragment_fields
+            }
+            for other_name, other_fields in groups:
+                if other_name == name:
+                    continue
+                for field in other_fields:
+                    key = self._get_field_name(field)
+                    if key in fragment_keys and (
+                        field.selection_set or fragment_keys[key] != print_ast(field)
+                    ):
+                        return name
+        return None
 
     def _add_typename_field_to_selections(
-        self, resolved_fields: List[FieldNode], selection_set: SelectionSetNode
+        self,
+        resolved_fields: List[FieldNode],
+        selection_set: SelectionSetNode,
+        inherited_fields: Optional[List[FieldNode]] = None,
     ) -> Tuple[List[FieldNode], Tuple[SelectionNode, ...]]:
-        field_names = {f.name.value for f in resolved_fields}
+        field_names = {f.name.value for f in resolved_fields + (inherited_fields or [])}
         if TYPENAME_FIELD_NAME not in field_names:
             typename_field = FieldNode(name=NameNode(value=TYPENAME_FIELD_NAME))
             return [typename_field, *resolved_fields], (
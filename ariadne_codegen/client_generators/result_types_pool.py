@@ -0,0 +1,105 @@
+import ast
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from graphql import (
+    FragmentDefinitionNode,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    build_ast_schema,
+    parse,
+    print_schema,
+)
+
+from ..plugins.manager import PluginManager
+from ..utils import Formatter, ast_to_str
+from .result_types import ResultTypesGenerator
+from .scalars import ScalarData
+
+
+@dataclass
+class GeneratedResultTypes:
+    code: str
+    operation_str: str
+    public_names: List[str]
+
+
+class ResultTypesCodeGenerator:
+    """
+    Generates code of result types of operations, independently of each other,
+    so it can be used by processes of a pool. When pickled for a process, schema
+    is replaced with its SDL and built again in that process, then assigned to
+    plugins of given plugin manager, which have to be pure.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        operations_definitions: List[OperationDefinitionNode],
+        fragments_definitions: Dict[str, FragmentDefinitionNode],
+        enums_module_name: str,
+        base_model_import: Optional[ast.ImportFrom] = None,
+        convert_to_snake_case: bool = True,
+        custom_scalars: Optional[Dict[str, ScalarData]] = None,
+        fragments_module_name: Optional[str] = None,
+        formatter: Formatter = Formatter.FULL,
+        plugin_manager: Optional[PluginManager] = None,
+    ) -> None:
+        self.schema = schema
+        self.operations_definitions = operations_definitions
+        self.fragments_definitions = fragments_definitions
+        self.enums_module_name = enums_module_name
+        self.base_model_import = base_model_import
+        self.convert_to_snake_case = convert_to_snake_case
+        self.custom_scalars = custom_scalars
+        self.fragments_module_name = fragments_module_name
+        self.formatter = formatter
+        self.plugin_manager = plugin_manager
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["schema"] = print_schema(self.schema)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state["schema"] = build_ast_schema(
+            parse(state["schema"]), assume_valid=True, assume_valid_sdl=True
+        )
+        self.__dict__.update(state)
+        if self.plugin_manager:
+            for plugin in self.plugin_manager.plugins:
+                plugin.schema = self.schema
+
+    def generate(self, index: int) -> GeneratedResultTypes:
+        """Generate code of result types of operation with given index."""
+        generator = ResultTypesGenerator(
+            schema=self.schema,
+            operation_definition=self.operations_definitions[index],
+            enums_module_name=self.enums_module_name,
+            fragments_definitions=self.fragments_definitions,
+            base_model_import=self.base_model_import,
+            convert_to_snake_case=self.convert_to_snake_case,
+            custom_scalars=self.custom_scalars,
+            plugin_manager=self.plugin_manager,
+            fragments_module_name=self.fragments_module_name,
+        )
+        return GeneratedResultTypes(
+            code=ast_to_str(generator.generate(), formatter=self.formatter),
+            operation_str=generator.get_operation_as_str(),
+            public_names=generator.get_generated_public_names(),
+        )
+
+
+# Generator used by jobs executed by current process of a pool.
+_WORKER_STATE: Dict[str, ResultTypesCodeGenerator] = {}
+
+
+def init_worker(generator: ResultTypesCodeGenerator) -> None:
+    """Initialize process of a pool with generator used by all its jobs."""
+    _WORKER_STATE["generator"] = generator
+
+
+def generate_in_worker(index: int) -> GeneratedResultTypes:
+    if "generator" not in _WORKER_STATE:
+        raise RuntimeError("Worker is not initialized.")
+    return _WORKER_STATE["generator"].generate(index)
@@ -1,5 +1,4 @@
 import ast
-from dataclasses import dataclass
 from typing import List, Optional, cast
 
 from ..codegen import (
@@ -21,18 +20,7 @@ from .constants import (
     SCALARS_SERIALIZE_DICT_NAME,
     TYPING_MODULE,
 )
-
-
-@dataclass
-class ScalarData:
-    type_: str
-    serialize: Optional[str] = None
-    parse: Optional[str] = None
-    import_: Optional[str] = None
-
-    @property
-    def names_to_import(self) -> List[str]:
-        return [name for name in (self.type_, self.serialize, self.parse) if name]
+from .scalars_data import ScalarData
 
 
 class ScalarsDefinitionsGenerator:
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class ScalarData:
+    type_: str
+    serialize: Optional[str] = None
+    parse: Optional[str] = None
+    import_: Optional[str] = None
+
+    @property
+    def names_to_import(self) -> List[str]:
+        return [name for name in (self.type_, self.serialize, self.parse) if name]
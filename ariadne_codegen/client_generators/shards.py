@@ -0,0 +1,274 @@
+import ast
+from typing import Dict, List, Optional, Set, cast
+
+from ..codegen import generate_assign, generate_constant, generate_list, generate_module
+from .common_types import (
+    ALL_VARIABLE_NAME,
+    get_referenced_class,
+    get_update_forward_refs_class,
+)
+from .init_file import InitFileGenerator
+
+
+def get_strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Return strongly connected components of graph, using Tarjan's algorithm.
+    Every component comes after components it depends on.
+    """
+    order = {node: index for index, node in enumerate(graph)}
+    indexes: Dict[str, int] = {}
+    low_links: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components: List[List[str]] = []
+
+    for root in graph:
+        if root in indexes:
+            continue
+        indexes[root] = low_links[root] = len(indexes)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, successors = work[-1]
+            successor = next(successors, None)
+            if successor is not None:
+                if successor not in indexes:
+                    indexes[successor] = low_links[successor] = len(indexes)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph[successor])))
+                elif successor in on_stack:
+                    low_links[node] = min(low_links[node], indexes[successor])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low_links[parent] = min(low_links[parent], low_links[node])
+            if low_links[node] == indexes[node]:
+                component: List[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.remove(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component, key=order.__getitem__))
+    return components
+
+
+def pack_components(components: List[List[str]], shards: int) -> List[List[str]]:
+    """
+    Split components into at most given number of shards with similar number of
+    nodes. Order of components is kept and components are never split.
+    """
+    remaining = sum(len(component) for component in components)
+    packed: List[List[str]] = []
+    shard: List[str] = []
+    for component in components:
+        size = -(-remaining // (shards - len(packed)))
+        if shard and len(shard) + len(component) > size and len(packed) < shards - 1:
+            packed.append(shard)
+            remaining -= len(shard)
+            shard = []
+        shard.extend(component)
+    if shard:
+        packed.append(shard)
+    return packed
+
+
+def pack_by_size(sizes: Dict[str, int], shards: int) -> List[List[str]]:
+    """
+    Split keys into at most given number of shards with similar sum of sizes.
+    Largest keys are assigned first, each to the smallest shard.
+    Keys of every shard keep their original order.
+    """
+    order = {key: index for index, key in enumerate(sizes)}
+    packed: List[List[str]] = [[] for _ in range(min(shards, len(sizes)))]
+    totals = [0] * len(packed)
+    for key in sorted(sizes, key=lambda k: (-sizes[k], order[k])):
+        index = totals.index(min(totals))
+        packed[index].append(key)
+        totals[index] += sizes[key]
+    return [sorted(shard, key=order.__getitem__) for shard in packed if shard]
+
+
+def split_module(
+    module: ast.Module, module_name: str, shards: int
+) -> Dict[str, ast.Module]:
+    """
+    Split module into modules named with given prefix, grouping classes by
+    strongly connected components of graph of references between them.
+    Shards import classes they reference from previous shards, so there are
+    no import cycles between them, and refer to them without quotes.
+    Imports of original module are copied into every shard, remaining
+    statements are put into the last shard.
+    """
+    imports: List[ast.stmt] = []
+    class_defs: Dict[str, ast.ClassDef] = {}
+    class_stmts: Dict[str, List[ast.stmt]] = {}
+    other_stmts: List[ast.stmt] = []
+    for stmt in module.body:
+        updated_class = get_update_forward_refs_class(stmt)
+        if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            imports.append(stmt)
+        elif isinstance(stmt, ast.ClassDef):
+            class_defs[stmt.name] = stmt
+            class_stmts[stmt.name] = []
+        elif updated_class and updated_class in class_stmts:
+            class_stmts[updated_class].append(stmt)
+        else:
+            other_stmts.append(stmt)
+
+    dependencies = {
+        name: get_referenced_classes(class_def, class_defs)
+        for name, class_def in class_defs.items()
+    }
+    packed = pack_components(
+        get_strongly_connected_components(dependencies), shards
+    ) or [[]]
+
+    shards_modules: Dict[str, ast.Module] = {}
+    classes_shards: Dict[str, str] = {}
+    for index, names in enumerate(packed):
+        shard_name = f"{module_name}_{index}"
+        for name in names:
+            classes_shards[name] = shard_name
+        shard_imports: Dict[str, List[str]] = {}
+        for name in names:
+            for dependency in dependencies[name]:
+                if classes_shards[dependency] != shard_name:
+                    shard_imports.setdefault(classes_shards[dependency], [])
+                    if dependency not in shard_imports[classes_shards[dependency]]:
+                        shard_imports[classes_shards[dependency]].append(dependency)
+        body: List[ast.stmt] = list(imports)
+        body.extend(
+            ast.ImportFrom(
+                module=from_,
+                names=[ast.alias(name=n) for n in sorted(imported)],
+                level=1,
+            )
+            for from_, imported in shard_imports.items()
+        )
+        imported_names = {n for imported in shard_imports.values() for n in imported}
+        body.extend(
+            unquote_references(class_defs[name], imported_names) for name in names
+        )
+        body.extend(stmt for name in names for stmt in class_stmts[name])
+        shards_modules[shard_name] = generate_module(body)
+    shards_modules[f"{module_name}_{len(packed) - 1}"].body.extend(other_stmts)
+    return shards_modules
+
+
+def merge_modules(modules: List[ast.Module]) -> ast.Module:
+    """
+    Return module with statements of all given modules. Imports are moved to the
+    top without duplicates and names listed in __all__ are merged.
+    """
+    imports: Dict[str, ast.stmt] = {}
+    all_names: List[str] = []
+    has_all = False
+    body: List[ast.stmt] = []
+    for module in modules:
+        module_all_names = get_all_names(module)
+        if module_all_names is None:
+            module_all_names = [
+                stmt.name for stmt in module.body if isinstance(stmt, ast.ClassDef)
+            ]
+        else:
+            has_all = True
+        all_names.extend(module_all_names)
+        for stmt in module.body:
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                imports.setdefault(ast.dump(stmt), stmt)
+            elif not is_all_assign(stmt):
+                body.append(stmt)
+
+    all_assigns: List[ast.stmt] = []
+    if has_all:
+        all_assigns.append(
+            generate_assign(
+                [ALL_VARIABLE_NAME],
+                generate_list([generate_constant(name) for name in all_names]),
+            )
+        )
+    return generate_module(list(imports.values()) + all_assigns + body)
+
+
+def get_all_names(module: ast.Module) -> Optional[List[str]]:
+    """Return names listed in __all__ of given module, None if it's not defined."""
+    for stmt in module.body:
+        if is_all_assign(stmt):
+            value = cast(ast.List, cast(ast.Assign, stmt).value)
+            return [
+                e.value
+                for e in value.elts
+                if isinstance(e, ast.Constant) and isinstance(e.value, str)
+            ]
+    return None
+
+
+def is_all_assign(stmt: ast.stmt) -> bool:
+    return (
+        isinstance(stmt, ast.Assign)
+        and isinstance(stmt.targets[0], ast.Name)
+        and stmt.targets[0].id == ALL_VARIABLE_NAME
+        and isinstance(stmt.value, ast.List)
+    )
+
+
+def generate_index_module(shards_modules: Dict[str, ast.Module]) -> ast.Module:
+    """Return module importing classes of given shards on first access."""
+    index_generator = InitFileGenerator(lazy=True)
+    for shard_name, shard_module in shards_modules.items():
+        index_generator.add_import(
+            [stmt.name for stmt in shard_module.body if isinstance(stmt, ast.ClassDef)],
+            shard_name,
+            1,
+        )
+    return index_generator.generate()
+
+
+def get_referenced_classes(
+    class_def: ast.ClassDef, class_defs: Dict[str, ast.ClassDef]
+) -> List[str]:
+    """Return names of other classes referenced by given class, quoted or not."""
+    referenced: List[str] = []
+    for node in ast.walk(class_def):
+        if isinstance(node, ast.Name):
+            name = get_referenced_class(node.id, class_defs)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            name = get_referenced_class(node.value, class_defs)
+        else:
+            continue
+        if name and name != class_def.name and name not in referenced:
+            referenced.append(name)
+    return referenced
+
+
+def unquote_references(class_def: ast.ClassDef, names: Set[str]) -> ast.ClassDef:
+    """
+    Replace quoted references to given classes in annotations of fields with names,
+    so imports of these classes are not removed as unused.
+    """
+    for stmt in class_def.body:
+        if isinstance(stmt, ast.AnnAssign):
+            stmt.annotation = _UnquoteReferences(names).visit(stmt.annotation)
+    return class_def
+
+
+class _UnquoteReferences(ast.NodeTransformer):
+    def __init__(self, names: Set[str]) -> None:
+        self.names = names
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:  # pylint: disable=invalid-name
+        if node.id.strip('"') in self.names:
+            node.id = node.id.strip('"')
+        return node
+
+    def visit_Constant(  # pylint: disable=invalid-name
+        self, node: ast.Constant
+    ) -> ast.expr:
+        if isinstance(node.value, str) and node.value in self.names:
+            return ast.Name(id=node.value)
+        return node
@@ -0,0 +1,66 @@
+from typing import Iterable, List, Set, cast
+
+from graphql import (
+    ExecutableDefinitionNode,
+    FieldNode,
+    GraphQLEnumType,
+    GraphQLInputObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    TypeInfo,
+    TypeInfoVisitor,
+    VariableDefinitionNode,
+    Visitor,
+    get_named_type,
+    type_from_ast,
+    visit,
+)
+
+
+class _UsedTypesVisitor(Visitor):
+    def __init__(self, schema: GraphQLSchema, type_info: TypeInfo) -> None:
+        super().__init__()
+        self.schema = schema
+        self.type_info = type_info
+        self.types_names: Set[str] = set()
+
+    def enter_field(self, _: FieldNode, *_args) -> None:
+        type_ = get_named_type(self.type_info.get_type())
+        if isinstance(type_, (GraphQLEnumType, GraphQLScalarType)):
+            self.types_names.add(type_.name)
+
+    def enter_variable_definition(self, node: VariableDefinitionNode, *_args) -> None:
+        type_ = get_named_type(type_from_ast(self.schema, node.type))
+        if type_:
+            self.types_names.add(type_.name)
+
+
+def get_used_types_names(
+    schema: GraphQLSchema, definitions: Iterable[ExecutableDefinitionNode]
+) -> Set[str]:
+    """
+    Return names of input types, enums and scalars used by variables and results
+    of given operations and fragments, including types used by fields of used
+    input types.
+    """
+    type_info = TypeInfo(schema)
+    visitor = _UsedTypesVisitor(schema, type_info)
+    for definition in definitions:
+        visit(definition, TypeInfoVisitor(type_info, visitor))
+
+    types_names = set(visitor.types_names)
+    input_types: List[str] = [
+        name
+        for name in types_names
+        if isinstance(schema.type_map.get(name), GraphQLInputObjectType)
+    ]
+    while input_types:
+        input_type = cast(GraphQLInputObjectType, schema.type_map[input_types.pop()])
+        for field in input_type.fields.values():
+            field_type = get_named_type(field.type)
+            if field_type.name in types_names:
+                continue
+            types_names.add(field_type.name)
+            if isinstance(field_type, GraphQLInputObjectType):
+                input_types.append(field_type.name)
+    return types_names
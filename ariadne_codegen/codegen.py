@@ -22,6 +22,7 @@ from .client_generators.constants import (
 )
 from .client_generators.types import Annotation, CodegenResultFieldType
 from .exceptions import ParsingError
+from .native_formatter import MULTILINE_STRING_ATTRIBUTE
 
 
 def generate_import_from(
@@ -120,6 +121,13 @@ def generate_constant(value: Any) -> ast.Constant:
     return ast.Constant(value=value)
 
 
+def generate_multiline_constant(value: str) -> ast.Constant:
+    """Generate string constant written as triple-quoted multiline string."""
+    constant = ast.Constant(value=value)
+    setattr(constant, MULTILINE_STRING_ATTRIBUTE, True)
+    return constant
+
+
 def generate_assign(
     targets: List[str], value: Union[ast.expr, List[ast.expr]], lineno: int = 1
 ) -> ast.Assign:
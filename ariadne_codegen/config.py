@@ -5,7 +5,7 @@ from warnings import simplefilter, warn
 
 import toml
 
-from .client_generators.scalars import ScalarData
+from .client_generators.scalars_data import ScalarData
 from .exceptions import ConfigFileNotFound, MissingConfiguration
 from .settings import ClientSettings, GraphQLSchemaSettings
 
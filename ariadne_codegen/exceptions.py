@@ -32,3 +32,7 @@ class IntrospectionError(CodeGenException):
 
 class PluginImportError(CodeGenException):
     """Error occurred during the plugin lookup."""
+
+
+class ServerError(CodeGenException):
+    """Error reported by or occurred while connecting to codegen server."""
@@ -1,5 +1,6 @@
 import ast
 from pathlib import Path
+from typing import Optional
 
 from graphql import GraphQLSchema
 from graphql.type.schema import TypeMap
@@ -16,7 +17,8 @@ from ..codegen import (
     generate_module,
     generate_name,
 )
-from ..utils import ast_to_str
+from ..profiling import Profiler, profile_stage
+from ..utils import Formatter, ast_to_str, write_file_atomically
 from .constants import STANDARD_TYPES
 from .directives import generate_directive
 from .named_types import generate_named_type
@@ -28,14 +30,20 @@ def generate_graphql_schema_file(
     target_file_path: str,
     type_map_name: str,
     schema_variable_name: str,
+    formatter: Formatter = Formatter.FULL,
+    profiler: Optional[Profiler] = None,
 ):
-    module = generate_schema_module(
-        schema,
-        type_map_name=type_map_name,
-        schema_variable_name=schema_variable_name,
-    )
-    code = ast_to_str(module)
-    Path(target_file_path).write_text(code, encoding="UTF-8")
+    file_name = Path(target_file_path).name
+    with profile_stage(profiler, "generate", generator="schema"):
+        module = generate_schema_module(
+            schema,
+            type_map_name=type_map_name,
+            schema_variable_name=schema_variable_name,
+        )
+    with profile_stage(profiler, "ast_to_str", file=file_name):
+        code = ast_to_str(module, formatter=formatter)
+    with profile_stage(profiler, "write_file", file=file_name):
+        write_file_atomically(Path(target_file_path), code)
 
 
 def generate_schema_module(
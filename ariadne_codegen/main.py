@@ -2,20 +2,14 @@ import sys
 
 import click
 
-from .client_generators.package import PackageGenerator
 from .config import get_client_settings, get_config_dict, get_graphql_schema_settings
-from .graphql_schema_generators.schema import generate_graphql_schema_file
-from .plugins.explorer import get_plugins_types
-from .plugins.manager import PluginManager
-from .schema import (
-    filter_fragments_definitions,
-    filter_operations_definitions,
-    get_graphql_queries,
-    get_graphql_schema_from_path,
-    get_graphql_schema_from_url,
-)
+from .profiling import Profiler, profile_stage
 from .settings import Strategy
 
+# Modules used only by some strategies are imported in functions using them,
+# so every command pays only for dependencies it needs.
+# pylint: disable=import-outside-toplevel
+
 
 @click.command()
 @click.version_option()
@@ -26,83 +20,204 @@ from .settings import Strategy
     type=click.Choice([e.value for e in Strategy]),
     required=False,
 )
-def main(strategy=Strategy.CLIENT, config=None):
-    config_dict = get_config_dict(config)
+@click.option(
+    "--jobs",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of processes used to format generated files.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Regenerate client every time schema or queries change.",
+)
+@click.option(
+    "--server",
+    is_flag=True,
+    default=False,
+    help="Send job to server started with 'ariadne-codegen serve'.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help="Path to server's Unix socket.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Print time and memory peak of every generation stage.",
+)
+@click.option(
+    "--profile-output",
+    default=None,
+    help="Path to JSON file to save profile report in.",
+)
+def main(
+    strategy=Strategy.CLIENT,
+    config=None,
+    jobs=None,
+    watch=False,
+    server=False,
+    socket_path=None,
+    profile=False,
+    profile_output=None,
+):  # pylint: disable=too-many-arguments
+    if strategy == Strategy.SERVE or server:
+        if watch or profile or profile_output:
+            raise click.UsageError(
+                "--watch, --profile and --profile-output options "
+                "can't be used with server."
+            )
+
+        from .server import get_default_socket_path, send_job, serve
+
+        socket_path = socket_path or get_default_socket_path()
+        if strategy == Strategy.SERVE:
+            serve(socket_path, graphql_schema_job=graphql_schema)
+            return
+        sys.stdout.write(send_job(socket_path, strategy, config=config, jobs=jobs))
+        return
+
+    profiler = Profiler() if profile or profile_output else None
+    if profiler:
+        profiler.start()
+
+    with profile_stage(profiler, "config_load"):
+        config_dict = get_config_dict(config)
     if strategy == Strategy.CLIENT:
-        client(config_dict)
+        client(config_dict, jobs=jobs, watch=watch, profiler=profiler)
 
     if strategy == Strategy.GRAPHQL_SCHEMA:
-        graphql_schema(config_dict)
-
-
-def client(config_dict):
-    settings = get_client_settings(config_dict)
-    if settings.schema_path:
-        schema = get_graphql_schema_from_path(settings.schema_path)
-        schema_source = settings.schema_path
-    else:
-        schema = get_graphql_schema_from_url(
-            url=settings.remote_schema_url,
-            headers=settings.remote_schema_headers,
-            verify_ssl=settings.remote_schema_verify_ssl,
-        )
-        schema_source = settings.remote_schema_url
+        graphql_schema(config_dict, profiler=profiler)
+
+    if profiler:
+        profiler.stop()
+        sys.stdout.write("\n" + profiler.format_report())
+        if profile_output:
+            with open(profile_output, "w", encoding="utf-8") as report_file:
+                report_file.write(profiler.get_report_json())
+
+
+def client(config_dict, jobs=None, watch=False, profiler=None):
+    with profile_stage(profiler, "config_load"):
+        settings = get_client_settings(config_dict)
+    if jobs:
+        settings.jobs = jobs
+    if watch:
+        from .watch import ClientWatcher
+
+        sys.stdout.write(settings.used_settings_message)
+        ClientWatcher(settings=settings, config_dict=config_dict).run()
+        return
+
+    from .client_generators.package import get_package_generator
+    from .plugins.explorer import get_plugins_types
+    from .plugins.manager import PluginManager
+    from .schema import (
+        filter_fragments_definitions,
+        filter_operations_definitions,
+        get_graphql_queries,
+        get_graphql_schema_from_object,
+        get_graphql_schema_from_path,
+        get_graphql_schema_from_url,
+    )
 
-    definitions = get_graphql_queries(settings.queries_path)
-    queries = filter_operations_definitions(definitions)
-    fragments = filter_fragments_definitions(definitions)
+    with profile_stage(profiler, "schema_load"):
+        if settings.schema_path:
+            schema = get_graphql_schema_from_path(
+                settings.schema_path,
+                cache_path=settings.schema_cache_path,
+                include=settings.graphql_files_include,
+                exclude=settings.graphql_files_exclude,
+                jobs=settings.jobs,
+            )
+            schema_source = settings.schema_path
+        elif settings.schema_object:
+            schema = get_graphql_schema_from_object(settings.schema_object)
+            schema_source = settings.schema_object
+        else:
+            schema = get_graphql_schema_from_url(
+                url=settings.remote_schema_url,
+                headers=settings.remote_schema_headers,
+                verify_ssl=settings.remote_schema_verify_ssl,
+                cache_path=settings.remote_schema_cache_path,
+                cache_ttl=settings.remote_schema_cache_ttl,
+            )
+            schema_source = settings.remote_schema_url
+
+    with profile_stage(profiler, "queries_parsing"):
+        definitions = get_graphql_queries(
+            settings.queries_path,
+            include=settings.graphql_files_include,
+            exclude=settings.graphql_files_exclude,
+            jobs=settings.jobs,
+        )
+        queries = filter_operations_definitions(definitions)
+        fragments = filter_fragments_definitions(definitions)
 
     sys.stdout.write(settings.used_settings_message)
 
-    package_generator = PackageGenerator(
-        package_name=settings.target_package_name,
-        target_path=settings.target_package_path,
-        schema=schema,
-        client_name=settings.client_name,
-        client_file_name=settings.client_file_name,
-        base_client_name=settings.base_client_name,
-        base_client_file_path=settings.base_client_file_path,
-        input_types_module_name=settings.input_types_module_name,
-        queries_source=settings.queries_path,
-        schema_source=schema_source,
-        include_comments=settings.include_comments,
-        fragments=fragments,
-        convert_to_snake_case=settings.convert_to_snake_case,
-        async_client=settings.async_client,
-        files_to_include=settings.files_to_include,
-        custom_scalars=settings.scalars,
-        plugin_manager=PluginManager(
+    with profile_stage(profiler, "package_generator_setup"):
+        package_generator = get_package_generator(
+            settings=settings,
             schema=schema,
-            config_dict=config_dict,
-            plugins_types=get_plugins_types(settings.plugins),
-        ),
-    )
-    for query in queries:
-        package_generator.add_operation(query)
+            schema_source=schema_source,
+            fragments=fragments,
+            plugin_manager=PluginManager(
+                schema=schema,
+                config_dict=config_dict,
+                plugins_types=get_plugins_types(settings.plugins),
+                profiler=profiler,
+            ),
+            profiler=profiler,
+        )
+    package_generator.add_operations(queries)
     generated_files = package_generator.generate()
 
     sys.stdout.write("\nGenerated files:\n  " + "\n  ".join(generated_files) + "\n")
 
 
-def graphql_schema(config_dict):
-    settings = get_graphql_schema_settings(config_dict)
+def graphql_schema(config_dict, profiler=None):
+    from .graphql_schema_generators.schema import generate_graphql_schema_file
+    from .schema import (
+        get_graphql_schema_from_object,
+        get_graphql_schema_from_path,
+        get_graphql_schema_from_url,
+    )
+
+    with profile_stage(profiler, "config_load"):
+        settings = get_graphql_schema_settings(config_dict)
     sys.stdout.write(settings.used_settings_message)
 
-    schema = (
-        get_graphql_schema_from_path(settings.schema_path)
-        if settings.schema_path
-        else get_graphql_schema_from_url(
-            url=settings.remote_schema_url,
-            headers=settings.remote_schema_headers,
-            verify_ssl=settings.remote_schema_verify_ssl,
-        )
-    )
+    with profile_stage(profiler, "schema_load"):
+        if settings.schema_path:
+            schema = get_graphql_schema_from_path(
+                settings.schema_path,
+                cache_path=settings.schema_cache_path,
+                include=settings.graphql_files_include,
+                exclude=settings.graphql_files_exclude,
+            )
+        elif settings.schema_object:
+            schema = get_graphql_schema_from_object(settings.schema_object)
+        else:
+            schema = get_graphql_schema_from_url(
+                url=settings.remote_schema_url,
+                headers=settings.remote_schema_headers,
+                verify_ssl=settings.remote_schema_verify_ssl,
+                cache_path=settings.remote_schema_cache_path,
+                cache_ttl=settings.remote_schema_cache_ttl,
+            )
 
     generate_graphql_schema_file(
         schema=schema,
         target_file_path=settings.target_file_path,
         type_map_name=settings.type_map_variable_name,
         schema_variable_name=settings.schema_variable_name,
+        formatter=settings.formatter,
+        profiler=profiler,
     )
 
 
@@ -0,0 +1,374 @@
+import ast
+import io
+import sys
+import tokenize
+from textwrap import indent
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+MAX_LINE_LENGTH = 88
+if sys.version_info >= (3, 10):
+    STDLIB_MODULES_NAMES: Set[str] = set(sys.stdlib_module_names)
+else:
+    from .stdlib_modules import STDLIB_MODULES_NAMES as FALLBACK_STDLIB_MODULES_NAMES
+
+    STDLIB_MODULES_NAMES = set(FALLBACK_STDLIB_MODULES_NAMES)
+# Attribute of string constants which are unparsed as multiline strings.
+MULTILINE_STRING_ATTRIBUTE = "multiline_string"
+
+
+def format_module(
+    module: ast.Module,
+    remove_unused_imports: bool = True,
+    multiline_strings: bool = False,
+) -> str:
+    """
+    Convert module into PEP 8 formatted code without using external formatters.
+    Leading imports are merged, deduplicated, sorted and grouped, long lines
+    are wrapped and defaults of annotated arguments are surrounded with spaces.
+    """
+    imports_count = 0
+    for stmt in module.body:
+        if not isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            break
+        imports_count += 1
+    imports = module.body[:imports_count]
+    body = module.body[imports_count:]
+
+    used_names = get_used_names(body) if remove_unused_imports else None
+    blocks = []
+    imports_code = format_imports(imports, used_names)
+    if imports_code:
+        blocks.append((imports_code, False))
+    blocks.extend(
+        (unparse(stmt, multiline_strings, wrap_lines=True), is_definition(stmt))
+        for stmt in body
+    )
+
+    code = ""
+    previous_is_definition = False
+    for block_code, block_is_definition in blocks:
+        if code:
+            separate = block_is_definition or previous_is_definition
+            code += "\n\n\n" if separate else "\n"
+        code += block_code
+        previous_is_definition = block_is_definition
+    return code + "\n" if code else code
+
+
+def unparse(
+    node: ast.AST, multiline_strings: bool = True, wrap_lines: bool = False
+) -> str:
+    """
+    Convert node into code like ast.unparse, but string constants marked with
+    MULTILINE_STRING_ATTRIBUTE are written as indented triple-quoted strings
+    and, if wrap_lines is true, lines longer than MAX_LINE_LENGTH are split.
+    """
+    multiline_constants: Dict[int, Tuple[ast.Constant, str]] = {}
+    if multiline_strings:
+        for child in ast.walk(node):
+            if (
+                isinstance(child, ast.Constant)
+                and isinstance(child.value, str)
+                and getattr(child, MULTILINE_STRING_ATTRIBUTE, False)
+                and id(child) not in multiline_constants
+            ):
+                multiline_constants[id(child)] = (child, child.value)
+
+    # Marked constants are unparsed as placeholders replaced after wrapping,
+    # so content of multiline strings doesn't count into lines length.
+    placeholders: Dict[str, str] = {}
+    for index, (constant, value) in enumerate(multiline_constants.values()):
+        placeholder = f"__multiline_string_{index}__"
+        placeholders[repr(placeholder)] = value
+        constant.value = placeholder
+    try:
+        code = ast.unparse(node)
+    finally:
+        for constant, value in multiline_constants.values():
+            constant.value = value
+
+    if "def " in code:
+        code = add_spaces_around_annotated_defaults(code)
+    if wrap_lines:
+        code = wrap_long_lines(code)
+    for placeholder, value in placeholders.items():
+        position = code.index(placeholder)
+        line_start = code[code.rfind("\n", 0, position) + 1 : position]
+        # Content is indented one level deeper than line with the string.
+        indent_size = len(line_start) - len(line_start.lstrip(" ")) + 4
+        code = code.replace(placeholder, format_multiline_string(value, indent_size), 1)
+    return code
+
+
+def add_spaces_around_annotated_defaults(code: str) -> str:
+    """
+    Surround with spaces "=" of default values of annotated arguments,
+    which ast.unparse writes without them, eg. "a: int=1" becomes "a: int = 1".
+    """
+    lines = code.split("\n")
+    for row, column in reversed(list(get_annotated_defaults_positions(code))):
+        line = lines[row - 1]
+        lines[row - 1] = line[:column] + " = " + line[column + 1 :]
+    return "\n".join(lines)
+
+
+def get_annotated_defaults_positions(code: str) -> Iterator[Tuple[int, int]]:
+    """Yield rows and columns of "=" before defaults of annotated arguments."""
+    depth = 0
+    arguments_depth: Optional[int] = None
+    after_def = False
+    annotated = False
+    for token in tokenize.generate_tokens(io.StringIO(code).readline):
+        if token.type == tokenize.NAME and token.string == "def":
+            after_def = True
+        if token.type != tokenize.OP:
+            continue
+        if token.string in ("(", "[", "{"):
+            depth += 1
+            if after_def and token.string == "(":
+                arguments_depth, after_def, annotated = depth, False, False
+        elif token.string in (")", "]", "}"):
+            if depth == arguments_depth:
+                arguments_depth = None
+            depth -= 1
+        elif depth == arguments_depth:
+            if token.string == "=" and annotated:
+                yield token.start
+            if token.string == ":":
+                annotated = True
+            elif token.string in (",", "="):
+                # Colons in default value, eg. of lambda, aren't annotations.
+                annotated = False
+
+
+def format_multiline_string(value: str, indent_size: int) -> str:
+    """Return triple-quoted string literal with lines of value indented."""
+    content = value.replace("\\", "\\\\").replace("\r", "\\r")
+    content = content.replace('"""', '""\\"')
+    if not content.endswith("\n"):
+        content += "\n"
+    return '"""\n' + indent(content + '"""', indent_size * " ")
+
+
+def wrap_long_lines(code: str) -> str:
+    """Split lines longer than MAX_LINE_LENGTH at brackets."""
+    lines = code.split("\n")
+    long_lines_indexes = [
+        index for index, line in enumerate(lines) if len(line) > MAX_LINE_LENGTH
+    ]
+    if not long_lines_indexes:
+        return code
+
+    # Lines being part of multiline strings, eg. docstrings, are left untouched.
+    strings_lines_indexes: Set[int] = set()
+    for token in tokenize.generate_tokens(io.StringIO(code).readline):
+        if token.type == tokenize.STRING and token.start[0] != token.end[0]:
+            strings_lines_indexes.update(range(token.start[0] - 1, token.end[0]))
+
+    for index in reversed(long_lines_indexes):
+        if index not in strings_lines_indexes:
+            lines[index : index + 1] = wrap_line(lines[index])
+    return "\n".join(lines)
+
+
+def wrap_line(line: str) -> List[str]:
+    """
+    Split line at its last top level brackets pair with non empty content,
+    or at earlier pair if line's part before the last one is too long.
+    Content is moved to separate line or, if it's still too long, its every
+    comma separated item is placed in separate line and wrapped recursively.
+    """
+    if len(line) <= MAX_LINE_LENGTH:
+        return [line]
+    if (
+        line.lstrip(" ").startswith("from ")
+        and " import " in line
+        and not line.endswith(")")
+    ):
+        line = line.replace(" import ", " import (", 1) + ")"
+    try:
+        brackets = [
+            (opening, closing, commas)
+            for opening, closing, commas in get_top_level_brackets(line)
+            if line[opening + 1 : closing].strip()
+        ]
+    except (tokenize.TokenError, SyntaxError):
+        return [line]
+    if not brackets:
+        return [line]
+
+    opening, closing, commas = brackets[-1]
+    for bracket in reversed(brackets):
+        if bracket[0] < MAX_LINE_LENGTH:
+            opening, closing, commas = bracket
+            break
+
+    line_indent = line[: len(line) - len(line.lstrip(" "))]
+    items_indent = line_indent + "    "
+    head = line[: opening + 1]
+    tail = wrap_line(line_indent + line[closing:])
+    content = line[opening + 1 : closing].strip()
+    if len(items_indent) + len(content) <= MAX_LINE_LENGTH:
+        return [head, items_indent + content, *tail]
+
+    starts = [opening + 1] + [comma + 1 for comma in commas]
+    items = [line[start:end].strip() for start, end in zip(starts, commas + [closing])]
+    has_trailing_comma = not items[-1]
+    if has_trailing_comma:
+        items.pop()
+    # Single item is followed by comma only if it already was, eg. in tuple.
+    separator = "," if len(items) > 1 or has_trailing_comma else ""
+    wrapped_lines = [head]
+    for item in items:
+        wrapped_lines.extend(wrap_line(items_indent + item + separator))
+    wrapped_lines.extend(tail)
+    return wrapped_lines
+
+
+def get_top_level_brackets(line: str) -> List[Tuple[int, int, List[int]]]:
+    """
+    Return columns of opening and closing brackets which aren't nested in other
+    brackets and columns of commas directly inside them.
+    Closing brackets without opening ones, eg. of wrapped line's tail, are skipped.
+    """
+    brackets: List[Tuple[int, int, List[int]]] = []
+    depth = 0
+    opening = 0
+    commas: List[int] = []
+    for token in tokenize.generate_tokens(io.StringIO(line.lstrip(" ")).readline):
+        if token.type != tokenize.OP:
+            continue
+        column = token.start[1] + len(line) - len(line.lstrip(" "))
+        if token.string in ("(", "[", "{"):
+            if depth == 0:
+                opening, commas = column, []
+            depth += 1
+        elif token.string in (")", "]", "}") and depth > 0:
+            depth -= 1
+            if depth == 0:
+                brackets.append((opening, column, commas))
+        elif token.string == "," and depth == 1:
+            commas.append(column)
+    return brackets
+
+
+def is_definition(stmt: ast.stmt) -> bool:
+    return isinstance(stmt, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+
+
+def get_used_names(body: List[ast.stmt]) -> Set[str]:
+    """Return names used by statements, including names in string constants."""
+    used_names: Set[str] = set()
+    for node in walk_nodes(body):
+        if isinstance(node, ast.Name):
+            used_names.add(node.id)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            used_names.update(get_names_from_string(node.value))
+    return used_names
+
+
+def walk_nodes(nodes: list) -> Iterator[ast.AST]:
+    """Like ast.walk, but also accepts lists nested in places of single nodes."""
+    todo: list = [nodes]
+    while todo:
+        node = todo.pop()
+        if isinstance(node, list):
+            todo.extend(node)
+        elif isinstance(node, ast.AST):
+            yield node
+            todo.extend(value for _, value in ast.iter_fields(node))
+
+
+def get_names_from_string(value: str) -> Set[str]:
+    try:
+        expression = ast.parse(value, mode="eval")
+    except SyntaxError:
+        return set()
+    return {n.id for n in ast.walk(expression) if isinstance(n, ast.Name)}
+
+
+def format_imports(imports: List[ast.stmt], used_names: Optional[Set[str]]) -> str:
+    plain_imports: Dict[int, Set[Tuple[str, Optional[str]]]] = {}
+    from_imports: Dict[Tuple[int, str, int], Set[Tuple[str, Optional[str]]]] = {}
+    for import_ in imports:
+        if isinstance(import_, ast.Import):
+            for alias in import_.names:
+                if is_alias_used(alias, used_names):
+                    section = get_import_section(alias.name, 0)
+                    plain_imports.setdefault(section, set()).add(
+                        (alias.name, alias.asname)
+                    )
+        elif isinstance(import_, ast.ImportFrom):
+            module_name = import_.module or ""
+            level = import_.level or 0
+            key = (get_import_section(module_name, level), module_name, level)
+            names = from_imports.setdefault(key, set())
+            for alias in import_.names:
+                if is_alias_used(alias, used_names):
+                    names.add((alias.name, alias.asname))
+
+    sections: Dict[int, List[str]] = {}
+    for section, aliases in plain_imports.items():
+        sections.setdefault(section, []).extend(
+            format_import(name, asname) for name, asname in sorted(aliases)
+        )
+    for (section, module_name, level), aliases in sorted(
+        from_imports.items(), key=lambda item: get_from_import_sort_key(*item[0])
+    ):
+        if aliases:
+            sections.setdefault(section, []).append(
+                format_import_from(module_name, level, aliases)
+            )
+    return "\n\n".join("\n".join(sections[s]) for s in sorted(sections))
+
+
+def is_alias_used(alias: ast.alias, used_names: Optional[Set[str]]) -> bool:
+    if used_names is None or alias.name == "*":
+        return True
+    name = alias.asname or alias.name.split(".", maxsplit=1)[0]
+    return name in used_names
+
+
+def get_import_section(module_name: str, level: int) -> int:
+    """Return order of section in which import belongs, like isort does."""
+    if level:
+        return 3
+    top_level_name = module_name.split(".", maxsplit=1)[0]
+    if top_level_name == "__future__":
+        return 0
+    if top_level_name in STDLIB_MODULES_NAMES:
+        return 1
+    return 2
+
+
+def get_from_import_sort_key(section: int, module_name: str, level: int) -> tuple:
+    return (section, -level, module_name.lower(), module_name)
+
+
+def get_name_sort_key(alias: Tuple[str, Optional[str]]) -> tuple:
+    name, asname = alias
+    if name.isupper() and len(name) > 1:
+        type_order = 0
+    elif name[:1].isupper():
+        type_order = 1
+    else:
+        type_order = 2
+    return (type_order, name.lower(), name, asname or "")
+
+
+def format_import(name: str, asname: Optional[str]) -> str:
+    return f"import {name} as {asname}" if asname else f"import {name}"
+
+
+def format_import_from(
+    module_name: str, level: int, aliases: Set[Tuple[str, Optional[str]]]
+) -> str:
+    names = [
+        f"{name} as {asname}" if asname else name
+        for name, asname in sorted(aliases, key=get_name_sort_key)
+    ]
+    prefix = f"from {'.' * level}{module_name} import "
+    single_line = prefix + ", ".join(names)
+    if len(single_line) <= MAX_LINE_LENGTH:
+        return single_line
+    return prefix + "(\n" + "".join(f"    {name},\n" for name in names) + ")"
@@ -2,7 +2,9 @@ import ast
 from typing import Dict, Tuple, Union
 
 from graphql import (
+    ExecutableDefinitionNode,
     FieldNode,
+    FragmentDefinitionNode,
     GraphQLEnumType,
     GraphQLInputField,
     GraphQLInputObjectType,
@@ -15,10 +17,29 @@ from graphql import (
 
 # pylint: disable=too-many-public-methods
 class Plugin:
+    # Pure plugins declare that results of their hooks depend only on arguments,
+    # schema, config_dict and cache_key(), and that hooks don't keep any state
+    # between calls. Hooks of pure, picklable plugins can be called by processes
+    # of a pool and their results can be cached.
+    pure: bool = False
+
     def __init__(self, schema: GraphQLSchema, config_dict: Dict) -> None:
         self.schema = schema
         self.config_dict = config_dict
 
+    def __getstate__(self) -> dict:
+        # Schema is not picklable, process unpickling plugin assigns it again.
+        state = self.__dict__.copy()
+        state["schema"] = None
+        return state
+
+    def cache_key(self) -> str:
+        """
+        Return string identifying configuration of plugin not included in
+        config_dict, eg. read from other files. It's part of cache keys.
+        """
+        return ""
+
     def generate_init_module(self, module: ast.Module) -> ast.Module:
         return module
 
@@ -101,7 +122,7 @@ class Plugin:
     def generate_result_class(
         self,
         class_def: ast.ClassDef,
-        operation_definition: OperationDefinitionNode,
+        operation_definition: ExecutableDefinitionNode,
         selection_set: SelectionSetNode,
     ) -> ast.ClassDef:
         return class_def
@@ -110,11 +131,19 @@ class Plugin:
     def generate_result_field(
         self,
         field_implementation: ast.AnnAssign,
-        operation_definition: OperationDefinitionNode,
+        operation_definition: ExecutableDefinitionNode,
         field: FieldNode,
     ) -> ast.AnnAssign:
         return field_implementation
 
+    # pylint: disable=unused-argument
+    def generate_fragments_module(
+        self,
+        module: ast.Module,
+        fragments_definitions: Dict[str, FragmentDefinitionNode],
+    ) -> ast.Module:
+        return module
+
     def generate_scalars_module(self, module: ast.Module) -> ast.Module:
         return module
 
@@ -136,6 +165,9 @@ class Plugin:
     def generate_result_types_code(self, generated_code: str) -> str:
         return generated_code
 
+    def generate_fragments_code(self, generated_code: str) -> str:
+        return generated_code
+
     def copy_code(self, copied_code: str) -> str:
         return copied_code
 
@@ -1,8 +1,12 @@
 import ast
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import copy
+import pickle
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from graphql import (
+    ExecutableDefinitionNode,
     FieldNode,
+    FragmentDefinitionNode,
     GraphQLEnumType,
     GraphQLInputField,
     GraphQLInputObjectType,
@@ -12,8 +16,16 @@ from graphql import (
     VariableDefinitionNode,
 )
 
+from ..profiling import Profiler, StageStats
 from .base import Plugin
 
+PLUGIN_STAGE = "plugin"
+HOOKS_NAMES: List[str] = [
+    name
+    for name, value in vars(Plugin).items()
+    if callable(value) and not name.startswith("_") and name != "cache_key"
+]
+
 
 # pylint: disable=too-many-public-methods
 class PluginManager:
@@ -22,18 +34,90 @@ class PluginManager:
         schema: GraphQLSchema,
         config_dict: Optional[Dict] = None,
         plugins_types: Optional[List[Type[Plugin]]] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         self.plugins: List[Plugin] = [
             cls(schema=schema, config_dict=config_dict or {})
             for cls in plugins_types or []
         ]
+        self.profiler = profiler
+        # Bound methods of plugins overriding every hook, in order of plugins.
+        self.hooks: Dict[str, List[Callable[..., Any]]] = get_hooks(
+            self.plugins, self.profiler
+        )
+
+    def __getstate__(self) -> dict:
+        # Profiler and profiled hooks are not sent to processes of a pool.
+        return {"plugins": self.plugins}
+
+    def __setstate__(self, state: dict) -> None:
+        self.plugins = state["plugins"]
+        self.profiler = None
+        self.hooks = get_hooks(self.plugins, self.profiler)
+
+    def get_plugins_overriding(self, hooks_names: List[str]) -> List[Plugin]:
+        """Return plugins overriding any of given hooks."""
+        return [
+            plugin
+            for plugin in self.plugins
+            if any(overrides_hook(plugin, name) for name in hooks_names)
+        ]
+
+    def are_hooks_pure(self, hooks_names: List[str]) -> bool:
+        """Check if all plugins overriding any of given hooks are pure."""
+        return all(
+            is_pure(plugin) for plugin in self.get_plugins_overriding(hooks_names)
+        )
+
+    def get_pool_plugin_manager(
+        self, hooks_names: List[str]
+    ) -> Optional["PluginManager"]:
+        """
+        Return manager with only plugins overriding given hooks, which can be sent
+        to processes of a pool. Return None if any of these plugins is not pure
+        or cannot be pickled.
+        """
+        if not self.are_hooks_pure(hooks_names):
+            return None
+        manager = copy.copy(self)
+        manager.plugins = self.get_plugins_overriding(hooks_names)
+        manager.profiler = None
+        manager.hooks = get_hooks(manager.plugins)
+        try:
+            pickle.dumps(manager)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        return manager
+
+    def get_plugins_stats(self) -> Dict[str, Dict[str, StageStats]]:
+        """
+        Return number of calls and cumulative time of hooks of every plugin,
+        recorded by profiler. Keys are plugins import paths and hooks names.
+        """
+        plugins_stats: Dict[str, Dict[str, StageStats]] = {}
+        if self.profiler:
+            for stats in self.profiler.stages.values():
+                if stats.name == PLUGIN_STAGE:
+                    plugin_stats = plugins_stats.setdefault(stats.details["plugin"], {})
+                    plugin_stats[stats.details["hook"]] = stats
+        return plugins_stats
 
     def _apply_plugins_on_object(
         self, method_name: str, obj: Any, *args, **kwargs
+    ) -> Any:
+        methods = self.hooks[method_name]
+        if not methods:
+            return obj
+        if self.profiler:
+            with self.profiler.stage("plugin_hook", hook=method_name):
+                return self._call_plugins(methods, obj, *args, **kwargs)
+        return self._call_plugins(methods, obj, *args, **kwargs)
+
+    def _call_plugins(
+        self, methods: List[Callable[..., Any]], obj: Any, *args, **kwargs
     ) -> Any:
         modified_obj = obj
-        for plugin in self.plugins:
-            method = getattr(plugin, method_name)
+        for method in methods:
             modified_obj = method(modified_obj, *args, **kwargs)
         return modified_obj
 
@@ -132,7 +216,7 @@ class PluginManager:
     def generate_result_class(
         self,
         class_def: ast.ClassDef,
-        operation_definition: OperationDefinitionNode,
+        operation_definition: ExecutableDefinitionNode,
         selection_set: SelectionSetNode,
     ) -> ast.ClassDef:
         return self._apply_plugins_on_object(
@@ -145,7 +229,7 @@ class PluginManager:
     def generate_result_field(
         self,
         field_implementation: ast.AnnAssign,
-        operation_definition: OperationDefinitionNode,
+        operation_definition: ExecutableDefinitionNode,
         field: FieldNode,
     ) -> ast.AnnAssign:
         return self._apply_plugins_on_object(
@@ -155,6 +239,17 @@ class PluginManager:
             field=field,
         )
 
+    def generate_fragments_module(
+        self,
+        module: ast.Module,
+        fragments_definitions: Dict[str, FragmentDefinitionNode],
+    ) -> ast.Module:
+        return self._apply_plugins_on_object(
+            "generate_fragments_module",
+            module,
+            fragments_definitions=fragments_definitions,
+        )
+
     def generate_scalars_module(self, module: ast.Module) -> ast.Module:
         return self._apply_plugins_on_object("generate_scalars_module", module)
 
@@ -178,6 +273,9 @@ class PluginManager:
             "generate_result_types_code", generated_code
         )
 
+    def generate_fragments_code(self, generated_code: str) -> str:
+        return self._apply_plugins_on_object("generate_fragments_code", generated_code)
+
     def copy_code(self, copied_code: str) -> str:
         return self._apply_plugins_on_object("copy_code", copied_code)
 
@@ -186,3 +284,48 @@ class PluginManager:
 
     def generate_init_code(self, generated_code: str) -> str:
         return self._apply_plugins_on_object("generate_init_code", generated_code)
+
+
+def get_hooks(
+    plugins: List[Plugin], profiler: Optional[Profiler] = None
+) -> Dict[str, List[Callable[..., Any]]]:
+    """Return methods of plugins overriding every hook, in order of plugins."""
+    return {
+        name: [
+            get_hook_method(plugin, name, profiler)
+            for plugin in plugins
+            if overrides_hook(plugin, name)
+        ]
+        for name in HOOKS_NAMES
+    }
+
+
+def get_hook_method(
+    plugin: Plugin, name: str, profiler: Optional[Profiler] = None
+) -> Callable[..., Any]:
+    method = getattr(plugin, name)
+    if not profiler:
+        return method
+    plugin_name = get_plugin_name(plugin)
+
+    def profiled_method(*args, **kwargs):
+        with profiler.stage(PLUGIN_STAGE, plugin=plugin_name, hook=name):
+            return method(*args, **kwargs)
+
+    return profiled_method
+
+
+def overrides_hook(plugin: Any, name: str) -> bool:
+    """Check if plugin implements hook other than default one of base Plugin."""
+    return getattr(type(plugin), name, None) is not getattr(Plugin, name) or (
+        name in getattr(plugin, "__dict__", {})
+    )
+
+
+def is_pure(plugin: Any) -> bool:
+    return getattr(plugin, "pure", False) is True
+
+
+def get_plugin_name(plugin: Any) -> str:
+    plugin_type = type(plugin)
+    return f"{plugin_type.__module__}.{plugin_type.__qualname__}"
@@ -0,0 +1,115 @@
+import contextlib
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import ContextManager, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class StageStats:
+    name: str
+    details: Dict[str, str] = field(default_factory=dict)
+    count: int = 0
+    time: float = 0.0
+    peak_memory: int = 0
+
+
+class Profiler:
+    """
+    Records wall time and tracemalloc memory peak of named stages.
+    Stages can be nested, repeated calls of stage with the same name and
+    details are aggregated.
+    """
+
+    def __init__(self, measure_memory: bool = True) -> None:
+        self.measure_memory = measure_memory
+        self.stages: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], StageStats] = {}
+        self._started_tracemalloc = False
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        # (memory at start of stage, peak of already finished nested stages)
+        self._memory_stack: List[List[int]] = []
+
+    def start(self) -> None:
+        self._start_time = time.perf_counter()
+        if self.measure_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        self._end_time = time.perf_counter()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **details: str) -> Iterator[None]:
+        measure_memory = self.measure_memory and tracemalloc.is_tracing()
+        if measure_memory:
+            self._push_memory_frame()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak_memory = self._pop_memory_frame() if measure_memory else 0
+            key = (name, tuple(sorted(details.items())))
+            stats = self.stages.setdefault(key, StageStats(name=name, details=details))
+            stats.count += 1
+            stats.time += elapsed
+            stats.peak_memory = max(stats.peak_memory, peak_memory)
+
+    def _push_memory_frame(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            parent = self._memory_stack[-1]
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+        self._memory_stack.append([current, 0])
+
+    def _pop_memory_frame(self) -> int:
+        start_memory, nested_peak = self._memory_stack.pop()
+        peak = max(nested_peak, tracemalloc.get_traced_memory()[1])
+        if self._memory_stack:
+            parent = self._memory_stack[-1]
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+        return max(0, peak - start_memory)
+
+    def get_report(self) -> dict:
+        """Return report with stats of every recorded stage."""
+        total_time = None
+        if self._start_time is not None:
+            total_time = (self._end_time or time.perf_counter()) - self._start_time
+        return {
+            "total_time": total_time,
+            "stages": [asdict(stats) for stats in self.stages.values()],
+        }
+
+    def get_report_json(self) -> str:
+        return json.dumps(self.get_report(), indent=2) + "\n"
+
+    def format_report(self) -> str:
+        """Return human readable report, stages are sorted by time."""
+        lines = ["Profile:"]
+        report = self.get_report()
+        if report["total_time"] is not None:
+            lines.append(f"  total: {report['total_time']:.3f} s")
+        for stats in sorted(self.stages.values(), key=lambda s: -s.time):
+            details = ", ".join(f"{k}={v}" for k, v in stats.details.items())
+            name = f"{stats.name} ({details})" if details else stats.name
+            lines.append(
+                f"  {stats.time:9.3f} s {stats.peak_memory / 1024 / 1024:9.1f} MiB"
+                f" {stats.count:6}x  {name}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def profile_stage(
+    profiler: Optional[Profiler], name: str, **details: str
+) -> ContextManager[None]:
+    """Return context manager recording stage, if profiler is provided."""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name, **details)
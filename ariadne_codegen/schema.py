@@ -1,14 +1,34 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from importlib import import_module, reload
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple, cast
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
-import httpx
 from graphql import (
     DefinitionNode,
+    DocumentNode,
     FragmentDefinitionNode,
     GraphQLSchema,
     GraphQLSyntaxError,
     IntrospectionQuery,
     OperationDefinitionNode,
+    Source,
     assert_valid_schema,
     build_ast_schema,
     build_client_schema,
@@ -16,7 +36,23 @@ from graphql import (
     parse,
 )
 
-from .exceptions import IntrospectionError, InvalidGraphqlSyntax
+from .exceptions import IntrospectionError, InvalidConfiguration, InvalidGraphqlSyntax
+from .schema_cache import (
+    CachedIntrospection,
+    get_headers_hash,
+    get_introspection_data_hash,
+    get_schema_files_hash,
+    load_cached_introspection,
+    load_cached_schema_document,
+    save_introspection_in_cache,
+    save_schema_document_in_cache,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+# Modification times of schema objects modules files at the time of import.
+SCHEMA_MODULES_MTIMES: Dict[str, Optional[int]] = {}
 
 
 def filter_operations_definitions(
@@ -33,34 +69,163 @@ def filter_fragments_definitions(
     return [d for d in definitions if isinstance(d, FragmentDefinitionNode)]
 
 
-def get_graphql_queries(queries_path: str) -> Tuple[DefinitionNode, ...]:
+def get_graphql_queries(
+    queries_path: str,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    jobs: int = 1,
+) -> Tuple[DefinitionNode, ...]:
     """Get graphql queries definitions build from provided path."""
-    queries_str = load_graphql_files_from_path(Path(queries_path))
-    queries_ast = parse(queries_str)
+    queries_ast = merge_documents(
+        load_graphql_documents_from_path(
+            Path(queries_path), include=include, exclude=exclude, jobs=jobs
+        )
+    )
     return queries_ast.definitions
 
 
+def get_graphql_schema_from_object(object_path: str) -> GraphQLSchema:
+    """
+    Import schema from object path in format 'package.module:variable'.
+    Current working directory is added to import paths for the time of import,
+    so modules of project in which codegen is run can be imported.
+    Module imported before is reloaded if its file changed since then.
+    """
+    module_name, _, attributes = object_path.partition(":")
+    cwd = os.getcwd()
+    add_cwd = cwd not in sys.path
+    if add_cwd:
+        sys.path.insert(0, cwd)
+    try:
+        obj = import_schema_module(module_name)
+    except (ImportError, SyntaxError) as exc:
+        raise InvalidConfiguration(
+            f"Cannot import module {module_name} of schema object {object_path}."
+        ) from exc
+    finally:
+        if add_cwd:
+            sys.path.remove(cwd)
+    for name in attributes.split("."):
+        try:
+            obj = getattr(obj, name)
+        except AttributeError as exc:
+            raise InvalidConfiguration(
+                f"Schema object {object_path} not found."
+            ) from exc
+
+    if not isinstance(obj, GraphQLSchema):
+        raise InvalidConfiguration(
+            f"Object {object_path} is not an instance of GraphQLSchema."
+        )
+    assert_valid_schema(obj)
+    return obj
+
+
+def import_schema_module(module_name: str) -> ModuleType:
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = import_module(module_name)
+    elif SCHEMA_MODULES_MTIMES.get(module_name) != get_module_mtime(module):
+        module = reload(module)
+    SCHEMA_MODULES_MTIMES[module_name] = get_module_mtime(module)
+    return module
+
+
+def get_schema_object_module_path(object_path: str) -> Optional[Path]:
+    """Return path of imported module's file in which schema object is defined."""
+    module = sys.modules.get(object_path.partition(":")[0])
+    module_file = getattr(module, "__file__", None)
+    return Path(module_file) if module_file else None
+
+
+def get_module_mtime(module: ModuleType) -> Optional[int]:
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return None
+    try:
+        return Path(module_file).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def get_graphql_schema_from_url(
-    url: str, headers: Optional[Dict[str, str]] = None, verify_ssl: bool = True
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    verify_ssl: bool = True,
+    cache_path: Optional[str] = None,
+    cache_ttl: int = 0,
 ) -> GraphQLSchema:
     return build_client_schema(
-        introspect_remote_schema(url=url, headers=headers, verify_ssl=verify_ssl)
+        introspect_remote_schema(
+            url=url,
+            headers=headers,
+            verify_ssl=verify_ssl,
+            cache_path=cache_path,
+            cache_ttl=cache_ttl,
+        )
     )
 
 
 def introspect_remote_schema(
-    url: str, headers: Optional[Dict[str, str]] = None, verify_ssl: bool = True
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    verify_ssl: bool = True,
+    cache_path: Optional[str] = None,
+    cache_ttl: int = 0,
 ) -> IntrospectionQuery:
+    """
+    Get introspection result from remote schema.
+    If cache path is provided, result fetched less than cache_ttl seconds ago
+    is returned without request. Otherwise cached result's ETag is sent
+    in conditional request and cached result is reused if server responds
+    with 304 status code.
+    """
+    cached = (
+        load_cached_introspection(Path(cache_path), url=url, headers=headers)
+        if cache_path
+        else None
+    )
+    if cached and time.time() - cached.fetched_at < cache_ttl:
+        return cast(IntrospectionQuery, cached.data)
+
+    request_headers = dict(headers or {})
+    if cached and cached.etag:
+        request_headers["If-None-Match"] = cached.etag
+
+    import httpx  # pylint: disable=import-outside-toplevel
+
     try:
         response = httpx.post(
             url,
             json={"query": get_introspection_query(descriptions=False)},
-            headers=headers,
+            headers=request_headers,
             verify=verify_ssl,
         )
     except httpx.InvalidURL as exc:
         raise IntrospectionError(f"Invalid remote schema url: {url}") from exc
 
+    if cached and cache_path and response.status_code == 304:
+        cached.fetched_at = time.time()
+        save_introspection_in_cache(Path(cache_path), cached)
+        return cast(IntrospectionQuery, cached.data)
+
+    data = parse_introspection_response(response)
+    if cache_path:
+        save_introspection_in_cache(
+            Path(cache_path),
+            CachedIntrospection(
+                url=url,
+                headers_hash=get_headers_hash(headers),
+                data_hash=get_introspection_data_hash(data),
+                fetched_at=time.time(),
+                data=data,
+                etag=response.headers.get("etag"),
+            ),
+        )
+    return cast(IntrospectionQuery, data)
+
+
+def parse_introspection_response(response: "httpx.Response") -> dict:
     if not response.is_success:
         raise IntrospectionError(
             "Failure of remote schema introspection. "
@@ -83,43 +248,200 @@ def introspect_remote_schema(
     if not isinstance(data, dict):
         raise IntrospectionError("Invalid data key in introspection result.")
 
-    return cast(IntrospectionQuery, data)
+    return data
+
+
+def get_graphql_schema_from_path(
+    schema_path: str,
+    cache_path: Optional[str] = None,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    jobs: int = 1,
+) -> GraphQLSchema:
+    """
+    Get graphql schema build from provided path.
+    If path is a json file, schema is built from introspection result in it.
+    Otherwise, if cache path is provided, valid schema's document is cached and
+    reused as long as schema files don't change. Cached document skips parsing
+    and validation, but schema is still built from it: schemas built by
+    graphql-core 3.2 reference lambdas, so they can't be pickled.
+    """
+    if is_introspection_file(Path(schema_path)):
+        return get_graphql_schema_from_introspection_file(Path(schema_path))
 
+    files_hash = None
+    if cache_path:
+        files_hash = get_schema_files_hash(
+            get_graphql_files_paths(Path(schema_path), include=include, exclude=exclude)
+        )
+        cached_document = load_cached_schema_document(Path(cache_path), files_hash)
+        if cached_document:
+            return build_ast_schema(
+                cached_document, assume_valid=True, assume_valid_sdl=True
+            )
 
-def get_graphql_schema_from_path(schema_path: str) -> GraphQLSchema:
-    """Get graphql schema build from provided path."""
-    schema_str = load_graphql_files_from_path(Path(schema_path))
-    graphql_ast = parse(schema_str)
+    graphql_ast = merge_documents(
+        load_graphql_documents_from_path(
+            Path(schema_path), include=include, exclude=exclude, jobs=jobs
+        )
+    )
     schema: GraphQLSchema = build_ast_schema(graphql_ast)
     assert_valid_schema(schema)
+    if cache_path and files_hash:
+        save_schema_document_in_cache(Path(cache_path), files_hash, graphql_ast)
     return schema
 
 
-def load_graphql_files_from_path(path: Path) -> str:
+def is_introspection_file(path: Path) -> bool:
+    return path.suffix == ".json" and path.is_file()
+
+
+def get_graphql_schema_from_introspection_file(path: Path) -> GraphQLSchema:
     """
-    Get schema from given path.
-    If path is a directory, collect schemas from multiple files.
+    Build schema from introspection result saved in json file, either whole
+    response with data key or only its data.
     """
+    try:
+        with open(path, "rb") as json_file:
+            introspection = json.load(json_file)
+    except ValueError as exc:
+        raise IntrospectionError(
+            f"Introspection result in file {path} is not a valid json."
+        ) from exc
+
+    if isinstance(introspection, dict) and "data" in introspection:
+        errors = introspection.get("errors")
+        if errors:
+            raise IntrospectionError(f"Introspection errors in file {path}: {errors}")
+        introspection = introspection["data"]
+    if not isinstance(introspection, dict) or "__schema" not in introspection:
+        raise IntrospectionError(f"Invalid introspection result format in file {path}.")
+
+    try:
+        schema = build_client_schema(cast(IntrospectionQuery, introspection))
+        assert_valid_schema(schema)
+    except (TypeError, KeyError) as exc:
+        raise IntrospectionError(
+            f"Invalid introspection result in file {path}: {exc}"
+        ) from exc
+    return schema
+
+
+def get_graphql_files_paths(
+    path: Path,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+) -> List[Path]:
+    """Return paths of graphql files in the same order in which they are loaded."""
     if path.is_dir():
-        schema_list = [read_graphql_file(f) for f in sorted(walk_graphql_files(path))]
-        return "\n".join(schema_list)
-    return read_graphql_file(path.resolve())
+        return sorted(walk_graphql_files(path, include=include, exclude=exclude))
+    return [path.resolve()]
+
+
+def load_graphql_documents_from_path(
+    path: Path,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    jobs: int = 1,
+) -> List[DocumentNode]:
+    """
+    Get parsed documents from given path.
+    If path is a directory, parse every graphql file from it.
+    Files are read by given number of threads and parsed in calling thread.
+    Parsing holds the GIL, and documents parsed by other processes take about
+    as long to unpickle as to parse, so only reading is done in parallel.
+    """
+    paths = get_graphql_files_paths(path, include=include, exclude=exclude)
+    if jobs < 2 or len(paths) < 2:
+        return [parse_graphql_file(f) for f in paths]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return [
+            parse_graphql_source(source)
+            for source in executor.map(read_graphql_source, paths)
+        ]
+
+
+def merge_documents(documents: Iterable[DocumentNode]) -> DocumentNode:
+    """Return document with definitions from all given documents."""
+    return DocumentNode(
+        definitions=tuple(
+            definition for document in documents for definition in document.definitions
+        )
+    )
 
 
-def walk_graphql_files(path: Path) -> Generator[Path, None, None]:
-    """Find graphql files within given path."""
+def walk_graphql_files(
+    path: Path,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+) -> Generator[Path, None, None]:
+    """
+    Find graphql files within given path.
+    If include patterns are provided, only files matching any of them are returned.
+    Files and directories matching any of exclude patterns are skipped, without
+    walking excluded directories.
+    """
     extensions = (".graphql", ".graphqls", ".gql")
-    for file_ in path.glob("**/*"):
-        if file_.suffix in extensions:
-            yield file_
+    for dir_path, dir_names, file_names in os.walk(path):
+        relative_dir = Path(dir_path).relative_to(path)
+        if exclude:
+            dir_names[:] = [
+                name
+                for name in dir_names
+                if not matches_any_pattern(relative_dir / name, exclude)
+            ]
+        for name in file_names:
+            if not name.endswith(extensions):
+                continue
+            relative_path = relative_dir / name
+            if include and not matches_any_pattern(relative_path, include):
+                continue
+            if exclude and matches_any_pattern(relative_path, exclude):
+                continue
+            yield Path(dir_path) / name
 
 
-def read_graphql_file(path: Path) -> str:
-    """Return content of file."""
+def matches_any_pattern(relative_path: Path, patterns: Sequence[str]) -> bool:
+    """
+    Check if path, relative to walked directory, or its name matches any of given
+    glob patterns. Wildcards in patterns match also path separators and every
+    `**/` matches also zero directories.
+    """
+    posix_path = relative_path.as_posix()
+    for pattern in patterns:
+        if fnmatchcase(relative_path.name, pattern) or any(
+            fnmatchcase(posix_path, variant)
+            for variant in get_pattern_variants(pattern)
+        ):
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def get_pattern_variants(pattern: str) -> Tuple[str, ...]:
+    """Return pattern and its variants with any of `**/` segments removed."""
+    segment, separator, rest = pattern.partition("/")
+    if not separator:
+        return (pattern,)
+    rest_variants = get_pattern_variants(rest)
+    variants = tuple(f"{segment}/{variant}" for variant in rest_variants)
+    return variants + rest_variants if segment == "**" else variants
+
+
+def parse_graphql_file(path: Path) -> DocumentNode:
+    """Parse content of file, file path is used as name of document's source."""
+    return parse_graphql_source(read_graphql_source(path))
+
+
+def read_graphql_source(path: Path) -> Source:
     with open(path, "r", encoding="utf-8") as graphql_file:
-        schema = graphql_file.read()
+        return Source(graphql_file.read(), path.as_posix())
+
+
+def parse_graphql_source(source: Source) -> DocumentNode:
     try:
-        parse(schema)
+        return parse(source)
     except GraphQLSyntaxError as exc:
-        raise InvalidGraphqlSyntax(f"Invalid graphql syntax in file {path}") from exc
-    return schema
+        raise InvalidGraphqlSyntax(
+            f"Invalid graphql syntax in file {source.name}"
+        ) from exc
@@ -0,0 +1,124 @@
+import hashlib
+import io
+import json
+import pickle
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from graphql import DocumentNode, Location
+
+from .utils import write_file_atomically
+
+SCHEMA_CACHE_VERSIONED_PACKAGES = ("ariadne-codegen", "graphql-core")
+
+
+@dataclass
+class CachedIntrospection:
+    url: str
+    headers_hash: str
+    data_hash: str
+    fetched_at: float
+    data: dict
+    etag: Optional[str] = None
+
+
+class _DocumentPickler(pickle.Pickler):
+    """Pickler which skips locations, they are not needed to build schema."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, Location):
+            return type(None), ()
+        return NotImplemented
+
+
+def get_schema_files_hash(paths: Iterable[Path]) -> str:
+    """Return hash of names and contents of given files and of used versions."""
+    hash_ = hashlib.sha256()
+    for package in SCHEMA_CACHE_VERSIONED_PACKAGES:
+        try:
+            hash_.update(f"{package}=={version(package)}\0".encode("utf-8"))
+        except PackageNotFoundError:
+            hash_.update(f"{package}\0".encode("utf-8"))
+    for path in paths:
+        hash_.update(path.as_posix().encode("utf-8") + b"\0")
+        hash_.update(path.read_bytes() + b"\0")
+    return hash_.hexdigest()
+
+
+def load_cached_schema_document(
+    cache_path: Path, files_hash: str
+) -> Optional[DocumentNode]:
+    """
+    Return cached schema document if it was saved for given files hash.
+    Hash is stored in the first line, so document saved for other files or
+    versions of packages isn't unpickled at all.
+    """
+    try:
+        with cache_path.open("rb") as cache_file:
+            if cache_file.readline().rstrip(b"\n") != files_hash.encode("ascii"):
+                return None
+            document = pickle.load(cache_file)
+    except (
+        OSError,
+        EOFError,
+        ValueError,
+        TypeError,
+        AttributeError,
+        ImportError,
+        pickle.UnpicklingError,
+    ):
+        return None
+    if not isinstance(document, DocumentNode):
+        return None
+    return document
+
+
+def save_schema_document_in_cache(
+    cache_path: Path, files_hash: str, document: DocumentNode
+) -> None:
+    """Save valid schema document in cache, without locations."""
+    buffer = io.BytesIO()
+    buffer.write(files_hash.encode("ascii") + b"\n")
+    _DocumentPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(document)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_file_atomically(cache_path, buffer.getvalue())
+
+
+def get_headers_hash(headers: Optional[Dict[str, str]]) -> str:
+    """Return hash of headers, so their values aren't stored in cache."""
+    return hashlib.sha256(
+        json.dumps(headers or {}, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def get_introspection_data_hash(data: dict) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_cached_introspection(
+    cache_path: Path, url: str, headers: Optional[Dict[str, str]] = None
+) -> Optional[CachedIntrospection]:
+    """Return cached introspection of given url made with the same headers."""
+    try:
+        cached = CachedIntrospection(
+            **json.loads(cache_path.read_text(encoding="utf-8"))
+        )
+    except (OSError, ValueError, TypeError):
+        return None
+    if (
+        cached.url != url
+        or cached.headers_hash != get_headers_hash(headers)
+        or not isinstance(cached.data, dict)
+        or cached.data_hash != get_introspection_data_hash(cached.data)
+    ):
+        return None
+    return cached
+
+
+def save_introspection_in_cache(
+    cache_path: Path, cached_introspection: CachedIntrospection
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_file_atomically(cache_path, json.dumps(asdict(cached_introspection)))
@@ -0,0 +1,160 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .exceptions import CodeGenException, ServerError
+
+if TYPE_CHECKING:
+    from .watch import ClientWatcher
+
+MAX_WATCHERS = 16
+
+
+def get_default_socket_path() -> str:
+    user_id = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"ariadne-codegen-{user_id}.sock")
+
+
+def send_job(
+    socket_path: str,
+    strategy: str,
+    config: Optional[str] = None,
+    jobs: Optional[int] = None,
+) -> str:
+    """
+    Send generation job to running server and return its output.
+    Job is executed in current working directory.
+    """
+    request = {"strategy": strategy, "config": config, "jobs": jobs, "cwd": os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(socket_path)
+            client_socket.sendall(json.dumps(request).encode("utf-8"))
+            client_socket.shutdown(socket.SHUT_WR)
+            response = json.loads(read_all(client_socket).decode("utf-8"))
+    except OSError as exc:
+        raise ServerError(
+            f"Cannot connect to ariadne-codegen server at {socket_path}. "
+            "Start it with 'ariadne-codegen serve'."
+        ) from exc
+    except ValueError as exc:
+        raise ServerError("Invalid response from ariadne-codegen server.") from exc
+
+    if response.get("error"):
+        raise ServerError(response["output"] + response["error"])
+    return response["output"]
+
+
+def read_all(sock: socket.socket) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+class CodegenServer(socketserver.UnixStreamServer):
+    """
+    Server which executes generation jobs one at a time, keeping imported
+    tooling, schemas, parsed queries and generated modules in memory.
+    Jobs are executed in working directory of the client which sent them.
+    State of only MAX_WATCHERS most recently used configurations is kept.
+    """
+
+    def __init__(
+        self, socket_path: str, graphql_schema_job: Callable[[Dict], None]
+    ) -> None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.socket_path = socket_path
+        self.graphql_schema_job = graphql_schema_job
+        self.watchers: "OrderedDict[Tuple[str, str], ClientWatcher]" = OrderedDict()
+        super().__init__(socket_path, CodegenRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(OSError):
+            os.remove(self.socket_path)
+
+    def run_job(self, request: Dict) -> Dict:
+        """Execute job and return its output, errors are returned, not raised."""
+        output = io.StringIO()
+        error = None
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(request["cwd"])
+            with contextlib.redirect_stdout(output):
+                self._run_job(
+                    strategy=request["strategy"],
+                    config=request.get("config"),
+                    jobs=request.get("jobs"),
+                )
+        except CodeGenException as exc:
+            error = f"{type(exc).__name__}: {exc}\n"
+        except Exception:  # pylint: disable=broad-except
+            error = traceback.format_exc()
+        finally:
+            os.chdir(previous_cwd)
+        return {"output": output.getvalue(), "error": error}
+
+    def _run_job(self, strategy: str, config: Optional[str], jobs: Optional[int]):
+        # pylint: disable=import-outside-toplevel
+        from .config import get_client_settings, get_config_dict
+        from .settings import Strategy
+        from .watch import ClientWatcher
+
+        config_dict = get_config_dict(config)
+        if strategy == Strategy.GRAPHQL_SCHEMA:
+            self.graphql_schema_job(config_dict)
+            return
+
+        settings = get_client_settings(config_dict)
+        if jobs:
+            settings.jobs = jobs
+        key = (os.getcwd(), json.dumps(config_dict, sort_keys=True, default=str))
+        watcher = self.watchers.get(key)
+        if watcher is None:
+            watcher = ClientWatcher(
+                settings=settings, config_dict=config_dict, keep_remote_schema=False
+            )
+            self.watchers[key] = watcher
+            if len(self.watchers) > MAX_WATCHERS:
+                self.watchers.popitem(last=False)
+        else:
+            self.watchers.move_to_end(key)
+        watcher.settings = settings
+        sys.stdout.write(settings.used_settings_message)
+        generated_files = watcher.regenerate()
+        sys.stdout.write("\nGenerated files:\n  " + "\n  ".join(generated_files) + "\n")
+
+
+class CodegenRequestHandler(socketserver.BaseRequestHandler):
+    server: CodegenServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(read_all(self.request).decode("utf-8"))
+        except ValueError:
+            response = {"output": "", "error": "Invalid request.\n"}
+        else:
+            response = self.server.run_job(request)
+        self.request.sendall(json.dumps(response).encode("utf-8"))
+
+
+def serve(socket_path: str, graphql_schema_job: Callable[[Dict], None]) -> None:
+    """Run server until interrupted."""
+    with CodegenServer(socket_path, graphql_schema_job) as server:
+        sys.stdout.write(f"Listening on {socket_path}\n")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
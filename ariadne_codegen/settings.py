@@ -10,32 +10,68 @@ from .client_generators.constants import (
     DEFAULT_ASYNC_BASE_CLIENT_PATH,
     DEFAULT_BASE_CLIENT_PATH,
 )
-from .client_generators.scalars import ScalarData
+from .client_generators.scalars_data import ScalarData
 from .exceptions import InvalidConfiguration
+from .utils import Formatter
 
 
 class Strategy(str, enum.Enum):
     CLIENT = "client"
     GRAPHQL_SCHEMA = "graphqlschema"
+    SERVE = "serve"
 
 
 @dataclass
 class BaseSettings:
     schema_path: Optional[str] = None
+    schema_object: Optional[str] = None
     remote_schema_url: Optional[str] = None
     remote_schema_headers: dict = field(default_factory=dict)
     remote_schema_verify_ssl: bool = True
+    remote_schema_cache_path: Optional[str] = None
+    remote_schema_cache_ttl: int = 0
+    schema_cache_path: Optional[str] = None
+    graphql_files_include: List[str] = field(default_factory=list)
+    graphql_files_exclude: List[str] = field(default_factory=list)
+    formatter: Formatter = Formatter.FULL
 
     def __post_init__(self):
-        if not self.schema_path and not self.remote_schema_url:
+        if not self.schema_source:
             raise InvalidConfiguration(
-                "Schema source not provided. Use schema_path or remote_schema_url"
+                "Schema source not provided. "
+                "Use schema_path, schema_object or remote_schema_url"
             )
 
         if self.schema_path:
             assert_path_exists(self.schema_path)
+        elif self.schema_object:
+            assert_object_path_is_valid(self.schema_object)
 
         self.remote_schema_headers = resolve_headers(self.remote_schema_headers)
+        assert_number_is_not_negative(
+            self.remote_schema_cache_ttl, "remote_schema_cache_ttl"
+        )
+        self.formatter = resolve_formatter(self.formatter)
+
+    @property
+    def schema_source(self) -> Optional[str]:
+        return self.schema_path or self.schema_object or self.remote_schema_url
+
+    @property
+    def graphql_files_include_message(self) -> str:
+        if self.graphql_files_include:
+            return "Reading only graphql files matching: " + ",".join(
+                self.graphql_files_include
+            )
+        return "Reading all graphql files."
+
+    @property
+    def graphql_files_exclude_message(self) -> str:
+        if self.graphql_files_exclude:
+            return "Skipping graphql files and directories matching: " + ",".join(
+                self.graphql_files_exclude
+            )
+        return "Not skipping graphql files."
 
 
 @dataclass
@@ -49,12 +85,21 @@ class ClientSettings(BaseSettings):
     base_client_file_path: Optional[str] = None
     enums_module_name: str = "enums"
     input_types_module_name: str = "input_types"
+    fragments_module_name: Optional[str] = None
+    common_types_module_name: Optional[str] = None
+    prune_unused_types: bool = False
+    lazy_init: bool = False
+    input_types_shards: Optional[int] = None
+    result_types_shards: Optional[int] = None
     include_comments: bool = True
     convert_to_snake_case: bool = True
     async_client: bool = True
     files_to_include: List[str] = field(default_factory=list)
     plugins: List[str] = field(default_factory=list)
     scalars: Dict[str, ScalarData] = field(default_factory=dict)
+    jobs: int = 1
+    cache_dir: Optional[str] = None
+    skip_unchanged_files: bool = False
 
     def __post_init__(self):
         if not self.queries_path:
@@ -78,10 +123,20 @@ class ClientSettings(BaseSettings):
 
         assert_string_is_valid_python_identifier(self.enums_module_name)
         assert_string_is_valid_python_identifier(self.input_types_module_name)
+        if self.fragments_module_name:
+            assert_string_is_valid_python_identifier(self.fragments_module_name)
+        if self.common_types_module_name:
+            assert_string_is_valid_python_identifier(self.common_types_module_name)
 
         for file_path in self.files_to_include:
             assert_path_is_valid_file(file_path)
 
+        if self.input_types_shards is not None:
+            assert_number_is_positive(self.input_types_shards, "input_types_shards")
+        if self.result_types_shards is not None:
+            assert_number_is_positive(self.result_types_shards, "result_types_shards")
+        assert_number_is_positive(self.jobs, "jobs")
+
     def _set_default_base_client_data(self):
         if not self.base_client_name and not self.base_client_file_path:
             if self.async_client:
@@ -108,6 +163,37 @@ class ClientSettings(BaseSettings):
             if self.async_client
             else "Generating not async client."
         )
+        fragments_msg = (
+            f"Generating fragments into '{self.fragments_module_name}.py'."
+            if self.fragments_module_name
+            else "Generating fragments into modules of operations using them."
+        )
+        common_types_msg = (
+            "Generating models shared by operations into "
+            f"'{self.common_types_module_name}.py'."
+            if self.common_types_module_name
+            else "Not sharing models between operations."
+        )
+        prune_unused_types_msg = (
+            "Generating only input types, enums and scalars used by operations."
+            if self.prune_unused_types
+            else "Generating all input types, enums and scalars."
+        )
+        lazy_init_msg = (
+            "Generating '__init__.py' importing names on first access."
+            if self.lazy_init
+            else "Generating '__init__.py' importing all names eagerly."
+        )
+        input_types_shards_msg = (
+            f"Splitting input types into up to {self.input_types_shards} modules."
+            if self.input_types_shards
+            else "Not splitting input types into modules."
+        )
+        result_types_shards_msg = (
+            f"Merging result types into {self.result_types_shards} modules."
+            if self.result_types_shards
+            else "Generating result types into module per operation."
+        )
         files_to_include_list = ",".join(self.files_to_include)
         files_to_include_msg = (
             f"Coping following files into package: {files_to_include_list}"
@@ -120,11 +206,28 @@ class ClientSettings(BaseSettings):
             if self.plugins
             else "No plugin is being used."
         )
+        jobs_msg = (
+            f"Formatting generated files using {self.jobs} processes."
+            if self.jobs > 1
+            else "Formatting generated files in a single process."
+        )
+        cache_msg = (
+            f"Caching generated result types in '{self.cache_dir}'."
+            if self.cache_dir
+            else "Not caching generated result types."
+        )
+        skip_unchanged_files_msg = (
+            "Not overwriting files which content didn't change."
+            if self.skip_unchanged_files
+            else "Overwriting all generated files."
+        )
         return dedent(
             f"""\
             Selected strategy: {Strategy.CLIENT}
-            Using schema from '{self.schema_path or self.remote_schema_url}'.
+            Using schema from '{self.schema_source}'.
             Reading queries from '{self.queries_path}'.
+            {self.graphql_files_include_message}
+            {self.graphql_files_exclude_message}
             Using '{self.target_package_name}' as package name.
             Generating package into '{self.target_package_path}'.
             Using '{self.client_name}' as client name.
@@ -132,11 +235,21 @@ class ClientSettings(BaseSettings):
             Coping base client class from '{self.base_client_file_path}'.
             Generating enums into '{self.enums_module_name}.py'.
             Generating inputs into '{self.input_types_module_name}.py'.
+            {fragments_msg}
+            {common_types_msg}
+            {prune_unused_types_msg}
+            {lazy_init_msg}
+            {input_types_shards_msg}
+            {result_types_shards_msg}
             {comments_msg}
             {snake_case_msg}
             {async_client_msg}
             {files_to_include_msg}
             {plugins_msg}
+            {jobs_msg}
+            {cache_msg}
+            {skip_unchanged_files_msg}
+            Formatting generated code using '{self.formatter.value}' formatter.
             """
         )
 
@@ -157,10 +270,13 @@ class GraphQLSchemaSettings(BaseSettings):
         return dedent(
             f"""\
             Selected strategy: {Strategy.GRAPHQL_SCHEMA}
-            Using schema from '{self.schema_path or self.remote_schema_url}'.
+            Using schema from '{self.schema_source}'.
+            {self.graphql_files_include_message}
+            {self.graphql_files_exclude_message}
             Saving graphql schema to: {self.target_file_path}.
             Using {self.schema_variable_name} as variable name for schema.
             Using {self.type_map_variable_name} as variable name for type map.
+            Formatting generated code using '{self.formatter.value}' formatter.
             """
         )
 
@@ -170,6 +286,18 @@ def assert_path_exists(path: str):
         raise InvalidConfiguration(f"Provided path {path} doesn't exist.")
 
 
+def assert_object_path_is_valid(object_path: str):
+    module_name, _, attributes = object_path.partition(":")
+    if not module_name or not all(
+        name.isidentifier()
+        for name in [*module_name.split("."), *attributes.split(".")]
+    ):
+        raise InvalidConfiguration(
+            f"Provided object path {object_path} has to be in format "
+            "'package.module:variable'."
+        )
+
+
 def assert_path_is_valid_directory(path: str):
     if not Path(path).is_dir():
         raise InvalidConfiguration(f"Provided path {path} isn't a directory.")
@@ -187,6 +315,30 @@ def assert_string_is_valid_python_identifier(name: str):
         )
 
 
+def assert_number_is_positive(value: int, name: str):
+    if not isinstance(value, int) or value < 1:
+        raise InvalidConfiguration(
+            f"Provided {name} value {value} has to be a positive integer."
+        )
+
+
+def assert_number_is_not_negative(value: int, name: str):
+    if not isinstance(value, int) or value < 0:
+        raise InvalidConfiguration(
+            f"Provided {name} value {value} has to be a non-negative integer."
+        )
+
+
+def resolve_formatter(formatter: str) -> Formatter:
+    try:
+        return Formatter(formatter)
+    except ValueError as exc:
+        raise InvalidConfiguration(
+            f"Provided formatter {formatter} is not supported. "
+            f"Use one of: {', '.join(f.value for f in Formatter)}, none."
+        ) from exc
+
+
 def resolve_headers(headers: Dict) -> Dict:
     return {key: get_header_value(value) for key, value in headers.items()}
 
@@ -1,24 +1,98 @@
 import ast
-import re
-from textwrap import indent
+import enum
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Union
 
-import isort
-from autoflake import fix_code  # type: ignore
-from black import Mode, format_str
+from .native_formatter import format_module, unparse
+
+
+def read_umask() -> int:
+    """Return umask of process, which can be read only by setting a new one."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Umask is read once, on import, because changing it while other threads create
+# files, eg. in server or with jobs, would affect their permissions.
+UMASK = read_umask()
+
+
+class Formatter(str, enum.Enum):
+    FULL = "full"
+    BLACK_ONLY = "black-only"
+    NATIVE = "native"
+
+    @classmethod
+    def _missing_(cls, value):
+        if value == "none":
+            return cls.NATIVE
+        return None
 
 
 def ast_to_str(
     ast_obj: ast.AST,
     remove_unused_imports: bool = True,
     multiline_strings: bool = False,
+    formatter: Formatter = Formatter.FULL,
 ) -> str:
     """Convert ast object into string."""
-    code = ast.unparse(ast_obj)
-    if remove_unused_imports:
+    if formatter == Formatter.NATIVE:
+        if isinstance(ast_obj, ast.Module):
+            code = format_module(
+                ast_obj,
+                remove_unused_imports=remove_unused_imports,
+                multiline_strings=multiline_strings,
+            )
+        else:
+            code = unparse(ast_obj, multiline_strings) + "\n"
+        return code
+
+    # External formatters are slow to import, so they are imported on first use.
+    # pylint: disable=import-outside-toplevel
+    from black import Mode, format_str
+
+    code = unparse(ast_obj, multiline_strings)
+    if formatter == Formatter.FULL and remove_unused_imports:
+        from autoflake import fix_code  # type: ignore
+
         code = fix_code(code, remove_all_unused_imports=True)
-    if multiline_strings:
-        code = format_multiline_strings(code)
-    return format_str(isort.code(code), mode=Mode())
+    if formatter == Formatter.FULL:
+        import isort
+
+        code = isort.code(code)
+    return format_str(code, mode=Mode())
+
+
+def write_file_atomically(path: Path, content: Union[str, bytes]) -> None:
+    """Write content into temporary file and then rename it to given path."""
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        if isinstance(content, bytes):
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(content)
+        else:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                temp_file.write(content)
+        os.chmod(temp_path, get_file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def get_file_mode(path: Path) -> int:
+    """Return permissions of existing file or default permissions for new file."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
 
 
 def str_to_snake_case(name: str) -> str:
@@ -30,43 +104,3 @@ def str_to_snake_case(name: str) -> str:
 def str_to_pascal_case(name: str) -> str:
     """Converts snake_case string into PascalCase."""
     return "".join(n[:1].upper() + n[1:] for n in name.split("_"))
-
-
-def convert_to_multiline_string(source: str, variable_indent_size=8) -> str:
-    """
-    Converts multiple strings into 1 multilne string.
-    eg. 'abc\\n''def\\n''ghi\\n' is coverted into
-    \"\"\"
-        abc
-        def
-        ghi
-        \"\"\"
-    """
-    joined_source = source.replace("\\n", "\n").replace("'", "")
-    if joined_source.endswith("\n"):
-        joined_source += '"""'
-    else:
-        joined_source += '\n"""'
-    return '"""\n' + indent(joined_source, (variable_indent_size + 4) * " ")
-
-
-def get_variable_indent_size(source: str) -> int:
-    "Returns number of white characters at the beginning of source."
-    match = re.match(r"\s*", source)
-    if match:
-        return len(match.group())
-    return 0
-
-
-def format_multiline_strings(source: str) -> str:
-    """Fromats multiline string declarations."""
-    formatted_source = source
-    for match in re.finditer(r".*?=.*?('.*?'\s*){2,}", source):
-        line = match.group()
-        variable_indent_size = get_variable_indent_size(line)
-        orginal_str_match = re.search("'.*'", line)
-        if orginal_str_match:
-            orginal_str = orginal_str_match.group()
-            formatted = convert_to_multiline_string(orginal_str, variable_indent_size)
-            formatted_source = formatted_source.replace(orginal_str, formatted)
-    return formatted_source
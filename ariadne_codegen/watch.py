@@ -0,0 +1,187 @@
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, cast
+
+from graphql import DocumentNode, GraphQLError, GraphQLSchema
+
+from .client_generators.cache import CachedResultTypes
+from .client_generators.package import get_package_generator
+from .exceptions import CodeGenException
+from .plugins.explorer import get_plugins_types
+from .plugins.manager import PluginManager
+from .schema import (
+    filter_fragments_definitions,
+    filter_operations_definitions,
+    get_graphql_files_paths,
+    get_graphql_schema_from_object,
+    get_graphql_schema_from_path,
+    get_graphql_schema_from_url,
+    get_schema_object_module_path,
+    merge_documents,
+    parse_graphql_file,
+)
+from .settings import ClientSettings
+
+WATCH_INTERVAL = 0.5
+
+
+class ClientWatcher:
+    """
+    Regenerates client every time schema, queries or included files change.
+    Schema, parsed query files and formatted result types modules are kept
+    in memory between runs, so only changed parts are processed again.
+    """
+
+    def __init__(
+        self,
+        settings: ClientSettings,
+        config_dict: Dict,
+        interval: float = WATCH_INTERVAL,
+        keep_remote_schema: bool = True,
+    ) -> None:
+        self.settings = settings
+        self.config_dict = config_dict
+        self.interval = interval
+        self.keep_remote_schema = keep_remote_schema
+        self.plugins_types = get_plugins_types(settings.plugins)
+        self.cache_entries: Dict[str, CachedResultTypes] = {}
+
+        self._schema: Optional[GraphQLSchema] = None
+        self._schema_mtimes: Optional[Dict[Path, int]] = None
+        self._queries_documents: Dict[Path, Tuple[int, DocumentNode]] = {}
+        self._mtimes: Optional[Dict[Path, int]] = None
+
+    def run(self) -> None:
+        """Generate client and keep regenerating it until interrupted."""
+        try:
+            while True:
+                try:
+                    generated_files = self.check()
+                # graphql-core reports invalid schema with GraphQLError or
+                # TypeError, eg. when schema file references unknown type.
+                except (CodeGenException, GraphQLError, TypeError) as exc:
+                    sys.stderr.write(f"\n{type(exc).__name__}: {exc}\n")
+                else:
+                    if generated_files is not None:
+                        sys.stdout.write(
+                            "\nGenerated files:\n  "
+                            + "\n  ".join(generated_files)
+                            + "\n"
+                        )
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+
+    def check(self) -> Optional[List[str]]:
+        """Regenerate client if any watched file changed since last check."""
+        mtimes = self.get_watched_files_mtimes()
+        if mtimes == self._mtimes:
+            return None
+        self._mtimes = mtimes
+        generated_files = self.regenerate()
+        # Files found during generation, eg. module of imported schema object,
+        # are watched from now on.
+        self._mtimes = {**self.get_watched_files_mtimes(), **mtimes}
+        return generated_files
+
+    def regenerate(self) -> List[str]:
+        """Generate client using files that changed and data kept in memory."""
+        schema, schema_source = self._get_schema()
+        definitions = self._get_queries_document().definitions
+        package_generator = get_package_generator(
+            settings=self.settings,
+            schema=schema,
+            schema_source=schema_source,
+            fragments=filter_fragments_definitions(definitions),
+            plugin_manager=PluginManager(
+                schema=schema,
+                config_dict=self.config_dict,
+                plugins_types=self.plugins_types,
+            ),
+            cache_entries=self.cache_entries,
+        )
+        # Unchanged files are never rewritten in watch mode, regardless of
+        # skip_unchanged_files setting, so tools watching generated package
+        # aren't triggered by files which content is the same.
+        package_generator.skip_unchanged_files = True
+        package_generator.add_operations(filter_operations_definitions(definitions))
+        generated_files = package_generator.generate()
+        # Entries not used by this run are pruned by cache, if it's used at all.
+        if not package_generator.result_types_cache:
+            self.cache_entries.clear()
+        return generated_files
+
+    def get_watched_files_mtimes(self) -> Dict[Path, int]:
+        paths: List[Path] = []
+        if self.settings.schema_path:
+            paths.extend(self._get_graphql_files_paths(self.settings.schema_path))
+        elif self.settings.schema_object:
+            module_path = get_schema_object_module_path(self.settings.schema_object)
+            if module_path:
+                paths.append(module_path)
+        paths.extend(self._get_graphql_files_paths(self.settings.queries_path))
+        paths.extend(Path(file_) for file_ in self.settings.files_to_include)
+        paths.append(Path(cast(str, self.settings.base_client_file_path)))
+        return {path: get_mtime(path) for path in paths}
+
+    def _get_schema(self) -> Tuple[GraphQLSchema, str]:
+        if not self.settings.schema_path and self.settings.schema_object:
+            # Module is reloaded only if its file changed since last import.
+            self._schema = get_graphql_schema_from_object(self.settings.schema_object)
+            return self._schema, self.settings.schema_object
+
+        if not self.settings.schema_path:
+            # Settings validation ensures one of schema sources is provided.
+            remote_schema_url = cast(str, self.settings.remote_schema_url)
+            if not self._schema or not self.keep_remote_schema:
+                self._schema = get_graphql_schema_from_url(
+                    url=remote_schema_url,
+                    headers=self.settings.remote_schema_headers,
+                    verify_ssl=self.settings.remote_schema_verify_ssl,
+                    cache_path=self.settings.remote_schema_cache_path,
+                    cache_ttl=self.settings.remote_schema_cache_ttl,
+                )
+            return self._schema, remote_schema_url
+
+        schema_mtimes = {
+            path: get_mtime(path)
+            for path in self._get_graphql_files_paths(self.settings.schema_path)
+        }
+        if not self._schema or schema_mtimes != self._schema_mtimes:
+            self._schema = get_graphql_schema_from_path(
+                self.settings.schema_path,
+                cache_path=self.settings.schema_cache_path,
+                include=self.settings.graphql_files_include,
+                exclude=self.settings.graphql_files_exclude,
+                jobs=self.settings.jobs,
+            )
+            self._schema_mtimes = schema_mtimes
+        return self._schema, self.settings.schema_path
+
+    def _get_graphql_files_paths(self, path: str) -> List[Path]:
+        return get_graphql_files_paths(
+            Path(path),
+            include=self.settings.graphql_files_include,
+            exclude=self.settings.graphql_files_exclude,
+        )
+
+    def _get_queries_document(self) -> DocumentNode:
+        documents: Dict[Path, Tuple[int, DocumentNode]] = {}
+        for path in self._get_graphql_files_paths(self.settings.queries_path):
+            mtime = get_mtime(path)
+            cached = self._queries_documents.get(path)
+            if cached and cached[0] == mtime:
+                documents[path] = cached
+            else:
+                documents[path] = (mtime, parse_graphql_file(path))
+        self._queries_documents = documents
+        return merge_documents(document for _, document in documents.values())
+
+
+def get_mtime(path: Path) -> int:
+    """Return modification time of file or -1 if file doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
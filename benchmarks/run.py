@@ -0,0 +1,252 @@
+"""
+Benchmark of code generation pipeline on synthetic corpora.
+
+Usage:
+    python -m benchmarks.run --size 100 --size 1000 --output results.json
+    python -m benchmarks.run --baseline benchmarks/baselines/native.json
+"""
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import click
+from graphql import assert_valid_schema, build_ast_schema, parse
+
+from ariadne_codegen.client_generators.enums import EnumsGenerator
+from ariadne_codegen.client_generators.input_types import InputTypesGenerator
+from ariadne_codegen.client_generators.package import PackageGenerator
+from ariadne_codegen.client_generators.result_types import ResultTypesGenerator
+from ariadne_codegen.schema import (
+    filter_fragments_definitions,
+    filter_operations_definitions,
+)
+from ariadne_codegen.utils import Formatter, ast_to_str
+
+from .synthetic import SyntheticCorpus, generate_corpus
+
+DEFAULT_SIZES = (100, 1000)
+DEFAULT_TOLERANCE = 0.25
+# Differences smaller than these are treated as noise.
+MIN_TIME_DIFFERENCE = 0.05
+MIN_MEMORY_DIFFERENCE = 1024 * 1024
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageResult:
+    time: float
+    peak_memory: int
+
+
+class StagesRecorder:
+    """Runs stages measuring their wall time and, optionally, memory peak."""
+
+    def __init__(self, measure_memory: bool) -> None:
+        self.measure_memory = measure_memory
+        self.results: Dict[str, StageResult] = {}
+
+    def run(self, name: str, func: Callable[[], T]) -> T:
+        if self.measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            result = func()
+        finally:
+            elapsed = time.perf_counter() - start
+            peak_memory = 0
+            if self.measure_memory:
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+        self.results[name] = StageResult(time=elapsed, peak_memory=peak_memory)
+        return result
+
+
+def run_pipeline(
+    corpus: SyntheticCorpus, formatter: Formatter, recorder: StagesRecorder
+) -> None:
+    document = recorder.run("schema_parsing", lambda: parse(corpus.schema_str))
+    schema = recorder.run("schema_building", lambda: build_ast_schema(document))
+    recorder.run("schema_validation", lambda: assert_valid_schema(schema))
+    definitions = recorder.run(
+        "queries_parsing", lambda: parse(corpus.queries_str).definitions
+    )
+    operations = filter_operations_definitions(definitions)
+    fragments = filter_fragments_definitions(definitions)
+    fragments_definitions = {f.name.value: f for f in fragments}
+
+    enums_module = recorder.run("enums", lambda: EnumsGenerator(schema).generate())
+    input_types_module = recorder.run(
+        "input_types", lambda: InputTypesGenerator(schema, "enums").generate()
+    )
+    result_types_modules = recorder.run(
+        "result_types",
+        lambda: [
+            ResultTypesGenerator(
+                schema=schema,
+                operation_definition=operation,
+                enums_module_name="enums",
+                fragments_definitions=fragments_definitions,
+            ).generate()
+            for operation in operations
+        ],
+    )
+    modules = [enums_module, input_types_module, *result_types_modules]
+    recorder.run(
+        "ast_to_str",
+        lambda: [ast_to_str(module, formatter=formatter) for module in modules],
+    )
+
+    def generate_package() -> List[str]:
+        with tempfile.TemporaryDirectory() as target_path:
+            generator = PackageGenerator(
+                package_name="client",
+                target_path=target_path,
+                schema=schema,
+                fragments=fragments,
+                formatter=formatter,
+            )
+            for operation in operations:
+                generator.add_operation(operation)
+            return generator.generate()
+
+    recorder.run("package", generate_package)
+
+
+def run_benchmark(
+    types_count: int, formatter: Formatter, measure_memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Return results of benchmark for corpus with given number of types.
+    Timings come from separate run without tracemalloc, it slows code down.
+    """
+    corpus = generate_corpus(types_count)
+    timings = StagesRecorder(measure_memory=False)
+    run_pipeline(corpus, formatter, timings)
+    stages = timings.results
+    if measure_memory:
+        memory = StagesRecorder(measure_memory=True)
+        run_pipeline(corpus, formatter, memory)
+        for name, result in memory.results.items():
+            stages[name].peak_memory = result.peak_memory
+    return {
+        "types_count": types_count,
+        "operations_count": corpus.operations_count,
+        "stages": {name: asdict(result) for name, result in stages.items()},
+    }
+
+
+def get_environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ariadne-codegen": version("ariadne-codegen"),
+        "graphql-core": version("graphql-core"),
+        "black": version("black"),
+    }
+
+
+def compare_with_baseline(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Return descriptions of stages slower or using more memory than baseline."""
+    regressions = []
+    for size, size_results in results["results"].items():
+        baseline_stages = baseline["results"].get(size, {}).get("stages", {})
+        for stage, result in size_results["stages"].items():
+            if stage not in baseline_stages:
+                continue
+            for metric, min_difference in (
+                ("time", MIN_TIME_DIFFERENCE),
+                ("peak_memory", MIN_MEMORY_DIFFERENCE),
+            ):
+                value, baseline_value = result[metric], baseline_stages[stage][metric]
+                if (
+                    baseline_value
+                    and value > baseline_value * (1 + tolerance)
+                    and value - baseline_value > min_difference
+                ):
+                    regressions.append(
+                        f"{size} types, {stage}, {metric}: "
+                        f"{value:.3f} > {baseline_value:.3f}"
+                    )
+    return regressions
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = []
+    for size, size_results in results["results"].items():
+        lines.append(
+            f"{size} types, {size_results['operations_count']} operations "
+            f"({results['formatter']} formatter):"
+        )
+        for stage, result in size_results["stages"].items():
+            lines.append(
+                f"  {stage:<18} {result['time']:>9.3f} s"
+                f" {result['peak_memory'] / 1024 / 1024:>9.1f} MiB"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def load_baseline(path: Optional[str]) -> Tuple[Optional[Dict[str, Any]], List[int]]:
+    if not path:
+        return None, []
+    baseline = json.loads(Path(path).read_text(encoding="utf-8"))
+    return baseline, [int(size) for size in baseline["results"]]
+
+
+@click.command()
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="Number of types in synthetic schema, can be used multiple times.",
+)
+@click.option(
+    "--formatter",
+    type=click.Choice([f.value for f in Formatter]),
+    default=None,
+    help="Formatter used to convert modules to code.",
+)
+@click.option("--no-memory", is_flag=True, help="Don't measure memory peaks.")
+@click.option("--output", default=None, help="Path to file to save results in.")
+@click.option("--baseline", default=None, help="Path to results to compare with.")
+@click.option("--tolerance", default=DEFAULT_TOLERANCE, show_default=True)
+def main(sizes, formatter, no_memory, output, baseline, tolerance):
+    baseline_results, baseline_sizes = load_baseline(baseline)
+    sizes = sizes or baseline_sizes or DEFAULT_SIZES
+    formatter = Formatter(
+        formatter
+        or (baseline_results["formatter"] if baseline_results else Formatter.FULL)
+    )
+
+    results = {
+        "environment": get_environment(),
+        "formatter": formatter.value,
+        "results": {
+            str(size): run_benchmark(size, formatter, measure_memory=not no_memory)
+            for size in sizes
+        },
+    }
+    sys.stdout.write(format_results(results))
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if baseline_results:
+        regressions = compare_with_baseline(results, baseline_results, tolerance)
+        if regressions:
+            sys.stdout.write("Regressions:\n  " + "\n  ".join(regressions) + "\n")
+            sys.exit(1)
+        sys.stdout.write("No regressions.\n")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
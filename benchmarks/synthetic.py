@@ -0,0 +1,218 @@
+"""
+Deterministic generator of synthetic schemas and matching operations.
+
+Types are split between enums, input types, interfaces, object types and unions.
+Input types reference enums and other input types, object types implement
+interfaces and reference other objects, unions and enums. Every operation
+uses a chain of fragments, inline fragments on unions and interfaces and
+variables of input types.
+"""
+import random
+from dataclasses import dataclass
+from typing import List, Tuple
+
+ENUMS_RATIO = 0.1
+INPUTS_RATIO = 0.3
+INTERFACES_RATIO = 0.05
+UNIONS_RATIO = 0.1
+
+ENUM_VALUES_COUNT = 5
+OBJECT_SCALAR_FIELDS_COUNT = 6
+UNION_MEMBERS_COUNT = 3
+FRAGMENTS_CHAIN_LENGTH = 5
+SCALARS = ("String", "Int", "Float", "Boolean", "ID")
+
+
+@dataclass
+class SyntheticCorpus:
+    types_count: int
+    seed: int
+    schema_str: str
+    queries_str: str
+    operations_count: int
+
+
+@dataclass
+class _Counts:
+    enums: int
+    inputs: int
+    interfaces: int
+    unions: int
+    objects: int
+
+
+@dataclass
+class _Relations:
+    union_members: List[List[int]]
+    objects_unions: List[int]
+
+
+def get_counts(types_count: int) -> _Counts:
+    enums = max(1, int(types_count * ENUMS_RATIO))
+    inputs = max(1, int(types_count * INPUTS_RATIO))
+    interfaces = max(1, int(types_count * INTERFACES_RATIO))
+    unions = max(1, int(types_count * UNIONS_RATIO))
+    objects = max(
+        UNION_MEMBERS_COUNT, types_count - enums - inputs - interfaces - unions
+    )
+    return _Counts(
+        enums=enums,
+        inputs=inputs,
+        interfaces=interfaces,
+        unions=unions,
+        objects=objects,
+    )
+
+
+def get_interface_index(counts: _Counts, object_index: int) -> int:
+    return object_index % counts.interfaces
+
+
+def generate_corpus(types_count: int, seed: int = 0) -> SyntheticCorpus:
+    """Return schema with about given number of types and operations using it."""
+    counts = get_counts(types_count)
+    rng = random.Random(seed)
+    relations = _Relations(
+        union_members=[
+            rng.sample(range(counts.objects), UNION_MEMBERS_COUNT)
+            for _ in range(counts.unions)
+        ],
+        objects_unions=[rng.randrange(counts.unions) for _ in range(counts.objects)],
+    )
+    schema_str = generate_schema_str(counts, relations, rng)
+    queries_str, operations_count = generate_queries_str(counts, relations, rng)
+    return SyntheticCorpus(
+        types_count=types_count,
+        seed=seed,
+        schema_str=schema_str,
+        queries_str=queries_str,
+        operations_count=operations_count,
+    )
+
+
+def generate_schema_str(
+    counts: _Counts, relations: _Relations, rng: random.Random
+) -> str:
+    definitions: List[str] = []
+    for i in range(counts.enums):
+        values = "\n".join(f"  VALUE_{i}_{v}" for v in range(ENUM_VALUES_COUNT))
+        definitions.append(f"enum Enum{i} {{\n{values}\n}}")
+
+    for i in range(counts.inputs):
+        fields = [
+            "  id: ID",
+            "  name: String",
+            f"  status: Enum{rng.randrange(counts.enums)}",
+            f"  value: {rng.choice(SCALARS)}!",
+        ]
+        if i > 0:
+            fields.append(f"  nested: Input{rng.randrange(i)}")
+        if i > 1:
+            fields.append(f"  items: [Input{rng.randrange(i)}!]")
+        definitions.append(f"input Input{i} {{\n" + "\n".join(fields) + "\n}")
+
+    for i in range(counts.interfaces):
+        definitions.append(f"interface Interface{i} {{\n  id: ID!\n  name: String!\n}}")
+
+    for i in range(counts.objects):
+        fields = [
+            "  id: ID!",
+            "  name: String!",
+            f"  status: Enum{rng.randrange(counts.enums)}!",
+        ]
+        fields.extend(
+            f"  field{f}: {rng.choice(SCALARS)}"
+            for f in range(OBJECT_SCALAR_FIELDS_COUNT)
+        )
+        fields.append(f"  child: Object{(i + 1) % counts.objects}")
+        fields.append(f"  children: [Object{rng.randrange(counts.objects)}!]!")
+        fields.append(f"  related: Union{relations.objects_unions[i]}")
+        definitions.append(
+            f"type Object{i} implements Interface{get_interface_index(counts, i)}"
+            " {\n" + "\n".join(fields) + "\n}"
+        )
+
+    for i, members in enumerate(relations.union_members):
+        definitions.append(
+            f"union Union{i} = " + " | ".join(f"Object{m}" for m in members)
+        )
+
+    query_fields = [
+        f"  object{i}(id: ID!, filter: Input{i % counts.inputs}): Object{i}"
+        for i in range(counts.objects)
+    ]
+    query_fields.extend(
+        f"  search{i}(text: String!): [Union{i}!]!" for i in range(counts.unions)
+    )
+    query_fields.extend(
+        f"  node{i}(id: ID!): Interface{i}" for i in range(counts.interfaces)
+    )
+    definitions.append("type Query {\n" + "\n".join(query_fields) + "\n}")
+
+    mutation_fields = [
+        f"  createObject{i}(input: Input{i % counts.inputs}!): Object{i}!"
+        for i in range(0, counts.objects, 2)
+    ]
+    definitions.append("type Mutation {\n" + "\n".join(mutation_fields) + "\n}")
+
+    return "\n\n".join(definitions) + "\n"
+
+
+def generate_queries_str(
+    counts: _Counts, relations: _Relations, rng: random.Random
+) -> Tuple[str, int]:
+    definitions: List[str] = []
+    for i in range(counts.objects):
+        child_selection = (
+            f"...Object{i + 1}Fields"
+            if (i + 1) % FRAGMENTS_CHAIN_LENGTH and i + 1 < counts.objects
+            else "id"
+        )
+        definitions.append(
+            f"fragment Object{i}Fields on Object{i} {{\n"
+            "  id\n  name\n  status\n"
+            f"  field{rng.randrange(OBJECT_SCALAR_FIELDS_COUNT)}\n"
+            f"  child {{\n    {child_selection}\n  }}\n"
+            "}"
+        )
+
+    operations_count = 0
+    for i in range(0, counts.objects, FRAGMENTS_CHAIN_LENGTH):
+        member = rng.choice(relations.union_members[relations.objects_unions[i]])
+        definitions.append(
+            f"query GetObject{i}($id: ID!, $filter: Input{i % counts.inputs}) {{\n"
+            f"  object{i}(id: $id, filter: $filter) {{\n"
+            f"    ...Object{i}Fields\n"
+            "    children {\n      id\n      name\n    }\n"
+            "    related {\n      __typename\n"
+            f"      ... on Object{member} {{\n        id\n        status\n      }}\n"
+            f"      ... on Interface{get_interface_index(counts, member)} {{\n"
+            "        name\n      }\n"
+            "    }\n"
+            "  }\n"
+            "}"
+        )
+        operations_count += 1
+        if i % 2 == 0:
+            definitions.append(
+                f"mutation CreateObject{i}($input: Input{i % counts.inputs}!) {{\n"
+                f"  createObject{i}(input: $input) {{\n    id\n    name\n    status\n"
+                "  }\n"
+                "}"
+            )
+            operations_count += 1
+
+    for i, members in enumerate(relations.union_members):
+        definitions.append(
+            f"query Search{i}($text: String!) {{\n"
+            f"  search{i}(text: $text) {{\n    __typename\n"
+            + "".join(
+                f"    ... on Object{m} {{\n      id\n      name\n    }}\n"
+                for m in members
+            )
+            + "  }\n"
+            "}"
+        )
+        operations_count += 1
+
+    return "\n\n".join(definitions) + "\n", operations_count
@@ -109,3 +109,25 @@ def test_generate_returns_module_with_classes_in_the_same_order_as_declared():
 
     generated_class_names = [c.name for c in filter_class_defs(module)]
     assert generated_class_names == expected_order
+
+
+def test_generate_returns_module_only_with_included_types():
+    schema_str = """
+    input InputA {
+        value: Int
+    }
+
+    input InputB {
+        value: Int
+    }
+    """
+    generator = InputTypesGenerator(
+        schema=build_ast_schema(parse(schema_str)),
+        enums_module="enums",
+        included_types={"InputB"},
+    )
+
+    module = generator.generate()
+
+    assert [c.name for c in filter_class_defs(module)] == ["InputB"]
+    assert generator.get_generated_public_names() == ["InputB"]
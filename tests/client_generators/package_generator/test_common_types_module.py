@@ -0,0 +1,55 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_common_types_module_name_creates_module_with_shared_models(
+    tmp_path,
+):
+    package_name = "test_graphql_client"
+    queries_str = """
+    query CustomQuery {
+        query2 {
+            id
+            field2 {
+                fieldb
+            }
+        }
+    }
+
+    query OtherQuery($id: ID!) {
+        query1(id: $id) {
+            id
+            field2 {
+                fieldb
+            }
+        }
+    }
+    """
+    query_def, other_query_def = parse(queries_str).definitions
+    generator = PackageGenerator(
+        package_name,
+        tmp_path.as_posix(),
+        build_ast_schema(parse(SCHEMA_STR)),
+        common_types_module_name="common_types",
+    )
+
+    generator.add_operation(query_def)
+    generator.add_operation(other_query_def)
+    generated_files = generator.generate()
+
+    package_path = tmp_path / package_name
+    assert "common_types.py" in generated_files
+    common_types_content = (package_path / "common_types.py").read_text()
+    assert common_types_content.count("class CustomType_") == 1
+    assert common_types_content.count("class CustomType2_") == 1
+    for file_name, name in (
+        ("custom_query.py", "CustomQueryQuery2"),
+        ("other_query.py", "OtherQueryQuery1"),
+    ):
+        content = (package_path / file_name).read_text()
+        assert "from .common_types import" in content
+        assert f"as {name}\n" in content
+        assert f"class {name}(" not in content
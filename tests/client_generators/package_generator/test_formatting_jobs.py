@@ -0,0 +1,46 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_multiple_jobs_creates_the_same_files_as_single_job(tmp_path):
+    query_str = """
+    query CustomQuery($id: ID!) {
+        query1(id: $id) {
+            field1
+            field3
+        }
+    }
+
+    query CustomQuery2 {
+        query2 {
+            id
+            field2 {
+                fieldb
+            }
+        }
+    }
+    """
+    generated_contents = []
+    for jobs in (1, 2):
+        generator = PackageGenerator(
+            "test_graphql_client",
+            (tmp_path / str(jobs)).as_posix(),
+            build_ast_schema(parse(SCHEMA_STR)),
+            include_comments=False,
+            jobs=jobs,
+        )
+        (tmp_path / str(jobs)).mkdir()
+        for definition in parse(query_str).definitions:
+            generator.add_operation(definition)
+        generated_files = generator.generate()
+        generated_contents.append(
+            {
+                file_name: generator.package_path.joinpath(file_name).read_text()
+                for file_name in generated_files
+            }
+        )
+
+    assert generated_contents[0] == generated_contents[1]
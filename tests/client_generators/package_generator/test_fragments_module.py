@@ -0,0 +1,70 @@
+from textwrap import dedent
+
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_fragments_module_name_creates_shared_fragments_module(
+    tmp_path,
+):
+    package_name = "test_graphql_client"
+    queries_str = """
+    query CustomQuery($id: ID!) {
+        query1(id: $id) {
+            ...TestFragment
+            field3
+        }
+    }
+
+    query ListQuery {
+        query2 {
+            ...TestFragment
+        }
+    }
+
+    fragment TestFragment on CustomType {
+        field1
+        field2 {
+            fieldb
+        }
+    }
+    """
+    expected_fragments = """
+    class TestFragment(BaseModel):
+        field1: Optional[List[Optional[str]]]
+        field2: Optional["TestFragmentField2"]
+
+
+    class TestFragmentField2(BaseModel):
+        fieldb: Optional[int]
+    """
+    expected_types = """
+    class CustomQueryQuery1(TestFragment):
+        field3: CustomEnum
+    """
+    query_def, list_query_def, fragment_def = parse(queries_str).definitions
+    generator = PackageGenerator(
+        package_name,
+        tmp_path.as_posix(),
+        build_ast_schema(parse(SCHEMA_STR)),
+        fragments=[fragment_def],
+        fragments_module_name="fragments",
+    )
+
+    generator.add_operation(query_def)
+    generator.add_operation(list_query_def)
+    generated_files = generator.generate()
+
+    package_path = tmp_path / package_name
+    assert "fragments.py" in generated_files
+    assert dedent(expected_fragments) in (package_path / "fragments.py").read_text()
+    result_types_content = (package_path / "custom_query.py").read_text()
+    assert "from .fragments import TestFragment" in result_types_content
+    assert dedent(expected_types) in result_types_content
+    assert (
+        "from .fragments import TestFragment"
+        in (package_path / "__init__.py").read_text()
+    )
@@ -0,0 +1,58 @@
+import pytest
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+from ariadne_codegen.exceptions import ParsingError
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_add_operations_with_jobs_generates_the_same_package_as_without_jobs(
+    tmp_path,
+):
+    queries_str = """
+    query CustomQuery($id: ID!) {
+        query1(id: $id) {
+            id
+        }
+    }
+
+    query OtherQuery {
+        query2 {
+            id
+            field1
+        }
+    }
+    """
+    definitions = parse(queries_str).definitions
+    packages = {}
+    for jobs in (1, 2):
+        generator = PackageGenerator(
+            f"package_{jobs}",
+            tmp_path.as_posix(),
+            build_ast_schema(parse(SCHEMA_STR)),
+            include_comments=False,
+            jobs=jobs,
+        )
+        generator.add_operations(definitions)
+        generated_files = generator.generate()
+        packages[jobs] = {
+            file_name: (tmp_path / f"package_{jobs}" / file_name).read_text()
+            for file_name in generated_files
+        }
+
+    assert packages[1] == packages[2]
+    assert "def custom_query(" in packages[2]["client.py"]
+    assert "class OtherQuery(" in packages[2]["other_query.py"]
+
+
+def test_add_operations_without_name_raises_parsing_error(tmp_path):
+    generator = PackageGenerator(
+        "test_graphql_client",
+        tmp_path.as_posix(),
+        build_ast_schema(parse(SCHEMA_STR)),
+        jobs=2,
+    )
+
+    with pytest.raises(ParsingError):
+        generator.add_operations(parse("query { query2 { id } }").definitions)
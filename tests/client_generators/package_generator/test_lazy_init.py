@@ -0,0 +1,33 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_lazy_init_generates_init_importing_names_on_access(
+    tmp_path,
+):
+    package_name = "test_graphql_client"
+    generator = PackageGenerator(
+        package_name,
+        tmp_path.as_posix(),
+        build_ast_schema(parse(SCHEMA_STR)),
+        lazy_init=True,
+    )
+    query_str = """
+    query CustomQuery {
+        query2 {
+            id
+        }
+    }
+    """
+    generator.add_operation(parse(query_str).definitions[0])
+
+    generator.generate()
+
+    init_content = (tmp_path / package_name / "__init__.py").read_text()
+    assert "if _TYPE_CHECKING:" in init_content
+    assert '"CustomQuery": ".custom_query"' in init_content
+    assert "def __getattr__(name: str) -> _Any:" in init_content
+    assert "__all__ = [" in init_content
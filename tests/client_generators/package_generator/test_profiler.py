@@ -0,0 +1,31 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+from ariadne_codegen.profiling import Profiler
+from ariadne_codegen.utils import Formatter
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_profiler_records_stages_per_operation_and_file(tmp_path):
+    profiler = Profiler(measure_memory=False)
+    generator = PackageGenerator(
+        "test_graphql_client",
+        tmp_path.as_posix(),
+        build_ast_schema(parse(SCHEMA_STR)),
+        formatter=Formatter.NATIVE,
+        profiler=profiler,
+    )
+    generator.add_operation(parse("query CustomQuery { query2 { id } }").definitions[0])
+    generator.generate()
+
+    stages = {(s.name, tuple(s.details.items())) for s in profiler.stages.values()}
+    assert ("add_operation", (("operation", "CustomQuery"),)) in stages
+    assert (
+        "generate",
+        (("generator", "result_types"), ("operation", "CustomQuery")),
+    ) in stages
+    assert ("generate", (("generator", "enums"),)) in stages
+    assert ("ast_to_str", (("file", "custom_query.py"),)) in stages
+    assert ("write_file", (("file", "custom_query.py"),)) in stages
+    assert ("write_file", (("file", "base_model.py"),)) in stages
@@ -0,0 +1,81 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+from ariadne_codegen.client_generators.scalars import ScalarData
+
+
+def test_generate_with_prune_unused_types_generates_only_used_types(tmp_path):
+    schema_str = """
+    schema {
+        query: Query
+    }
+
+    type Query {
+        query1(input: CustomInput): CustomType
+        query2(input: OtherInput): CustomType
+    }
+
+    type CustomType {
+        id: ID!
+        field1: CustomEnum!
+        field2: OtherEnum
+    }
+
+    enum CustomEnum {
+        VAL1
+    }
+
+    enum OtherEnum {
+        VAL1
+    }
+
+    input CustomInput {
+        value: Int!
+        nested: NestedInput
+    }
+
+    input NestedInput {
+        value: SCALARABC
+    }
+
+    input OtherInput {
+        value: SCALARXYZ
+    }
+
+    scalar SCALARABC
+    scalar SCALARXYZ
+    """
+    query_str = """
+    query CustomQuery($input: CustomInput) {
+        query1(input: $input) {
+            id
+            field1
+        }
+    }
+    """
+    package_name = "test_graphql_client"
+    generator = PackageGenerator(
+        package_name,
+        tmp_path.as_posix(),
+        build_ast_schema(parse(schema_str)),
+        custom_scalars={
+            "SCALARABC": ScalarData(type_="str", parse="parse_abc"),
+            "SCALARXYZ": ScalarData(type_="int", parse="parse_xyz"),
+        },
+        prune_unused_types=True,
+    )
+
+    generator.add_operation(parse(query_str).definitions[0])
+    generator.generate()
+
+    package_path = tmp_path / package_name
+    enums_content = (package_path / "enums.py").read_text()
+    assert "class CustomEnum(" in enums_content
+    assert "OtherEnum" not in enums_content
+    input_types_content = (package_path / "input_types.py").read_text()
+    assert "class CustomInput(" in input_types_content
+    assert "class NestedInput(" in input_types_content
+    assert "OtherInput" not in input_types_content
+    scalars_content = (package_path / "scalars.py").read_text()
+    assert "parse_abc" in scalars_content
+    assert "parse_xyz" not in scalars_content
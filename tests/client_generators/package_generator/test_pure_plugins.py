@@ -0,0 +1,93 @@
+import ast
+
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+from ariadne_codegen.plugins.base import Plugin
+from ariadne_codegen.plugins.manager import PluginManager
+
+from ..test_package_generator import SCHEMA_STR
+
+
+class SchemaTypesCountPlugin(Plugin):
+    def generate_result_class(self, class_def, operation_definition, selection_set):
+        types_count = len(self.schema.type_map)
+        class_def.body.insert(0, ast.Expr(ast.Constant(f"Types: {types_count}")))
+        return class_def
+
+
+class PureSchemaTypesCountPlugin(SchemaTypesCountPlugin):
+    pure = True
+
+
+QUERIES_STR = """
+query CustomQuery($id: ID!) {
+    query1(id: $id) {
+        field1
+    }
+}
+
+query CustomQuery2 {
+    query2 {
+        id
+    }
+}
+"""
+
+
+def test_add_operations_with_pure_plugins_generates_result_types_in_processes(
+    tmp_path,
+):
+    generated_contents = []
+    for jobs in (1, 2):
+        schema = build_ast_schema(parse(SCHEMA_STR))
+        generator = PackageGenerator(
+            "test_graphql_client",
+            (tmp_path / str(jobs)).as_posix(),
+            schema,
+            include_comments=False,
+            jobs=jobs,
+            plugin_manager=PluginManager(
+                schema=schema, plugins_types=[PureSchemaTypesCountPlugin]
+            ),
+        )
+        (tmp_path / str(jobs)).mkdir()
+        generator.add_operations(parse(QUERIES_STR).definitions)
+        generated_files = generator.generate()
+        generated_contents.append(
+            {
+                file_name: generator.package_path.joinpath(file_name).read_text()
+                for file_name in generated_files
+            }
+        )
+
+    assert sorted(generator.converted_result_types_files) == [
+        "custom_query.py",
+        "custom_query2.py",
+    ]
+    assert generated_contents[0] == generated_contents[1]
+    assert '"""Types: ' in generated_contents[1]["custom_query.py"]
+
+
+def test_add_operations_with_not_pure_plugins_adds_operations_one_by_one(tmp_path):
+    schema = build_ast_schema(parse(SCHEMA_STR))
+    generator = PackageGenerator(
+        "test_graphql_client",
+        tmp_path.as_posix(),
+        schema,
+        jobs=2,
+        cache_dir=(tmp_path / "cache").as_posix(),
+        plugin_manager=PluginManager(
+            schema=schema, plugins_types=[SchemaTypesCountPlugin]
+        ),
+    )
+
+    generator.add_operations(parse(QUERIES_STR).definitions)
+
+    assert generator.pool_plugin_manager is None
+    assert generator.result_types_cache is None
+    assert not generator.converted_result_types_files
+    assert sorted(generator.result_types_files) == [
+        "custom_query.py",
+        "custom_query2.py",
+    ]
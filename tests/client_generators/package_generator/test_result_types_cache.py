@@ -0,0 +1,46 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_cache_dir_reuses_cached_result_types(tmp_path):
+    cache_dir = tmp_path / "cache"
+    query_str = """
+    query CustomQuery {
+        query2 {
+            id
+        }
+    }
+    """
+
+    def generate():
+        generator = PackageGenerator(
+            "test_graphql_client",
+            tmp_path.as_posix(),
+            build_ast_schema(parse(SCHEMA_STR)),
+            include_comments=False,
+            cache_dir=cache_dir.as_posix(),
+        )
+        generator.add_operation(parse(query_str).definitions[0])
+        generator.generate()
+        return generator
+
+    generator = generate()
+    result_types_path = generator.package_path / "custom_query.py"
+    expected_content = result_types_path.read_text()
+    (cache_entry_path,) = cache_dir.glob("*/*.json")
+    cache_entry_path.write_text(
+        cache_entry_path.read_text().replace("CustomQueryQuery2", "CachedQuery2")
+    )
+
+    generator = generate()
+
+    assert not generator.result_types_files
+    assert "custom_query.py" in generator.cached_result_types_files
+    assert result_types_path.read_text() == expected_content.replace(
+        "CustomQueryQuery2", "CachedQuery2"
+    )
+    init_content = generator.package_path.joinpath("__init__.py").read_text()
+    assert "CachedQuery2" in init_content
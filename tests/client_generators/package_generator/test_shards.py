@@ -0,0 +1,87 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_input_types_shards_generates_shards_and_index(tmp_path):
+    schema_str = """
+    schema {
+        query: Query
+    }
+
+    type Query {
+        query1(input: AInput, other: DInput): Int
+    }
+
+    input AInput {
+        b: BInput
+        c: CInput
+    }
+
+    input BInput {
+        a: AInput
+    }
+
+    input CInput {
+        value: Int!
+    }
+
+    input DInput {
+        value: Int!
+    }
+    """
+    package_name = "test_graphql_client"
+    generator = PackageGenerator(
+        package_name,
+        tmp_path.as_posix(),
+        build_ast_schema(parse(schema_str)),
+        input_types_shards=2,
+    )
+
+    generated_files = generator.generate()
+
+    package_path = tmp_path / package_name
+    assert "input_types_0.py" in generated_files
+    assert "input_types_1.py" in generated_files
+    assert "input_types_2.py" not in generated_files
+    shard_0 = (package_path / "input_types_0.py").read_text()
+    shard_1 = (package_path / "input_types_1.py").read_text()
+    assert "class CInput(" in shard_0
+    assert "class AInput(" in shard_1
+    assert "class BInput(" in shard_1
+    assert "from .input_types_0 import CInput" in shard_1
+    index = (package_path / "input_types.py").read_text()
+    assert '"AInput": ".input_types_1"' in index
+    assert '"CInput": ".input_types_0"' in index
+
+
+def test_generate_with_result_types_shards_merges_operations_modules(tmp_path):
+    package_name = "test_graphql_client"
+    generator = PackageGenerator(
+        package_name,
+        tmp_path.as_posix(),
+        build_ast_schema(parse(SCHEMA_STR)),
+        result_types_shards=2,
+    )
+    for query_str in [
+        "query QueryA { query2 { id } }",
+        "query QueryB { query2 { id } }",
+        "query QueryC { query2 { id } }",
+    ]:
+        generator.add_operation(parse(query_str).definitions[0])
+
+    generated_files = generator.generate()
+
+    package_path = tmp_path / package_name
+    assert "query_a.py" not in generated_files
+    assert "result_types_0.py" in generated_files
+    assert "result_types_1.py" in generated_files
+    shard_0 = (package_path / "result_types_0.py").read_text()
+    assert "class QueryA(" in shard_0
+    assert "class QueryC(" in shard_0
+    assert "class QueryB(" in (package_path / "result_types_1.py").read_text()
+    client_content = (package_path / "client.py").read_text()
+    assert "from .result_types_0 import QueryA, QueryC" in client_content
+    assert "from .result_types_1 import QueryB" in client_content
@@ -0,0 +1,44 @@
+from freezegun import freeze_time
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.package import PackageGenerator
+
+from ..test_package_generator import SCHEMA_STR
+
+
+def test_generate_with_skip_unchanged_files_doesnt_overwrite_unchanged_files(
+    tmp_path,
+):
+    query_str = """
+    query CustomQuery {
+        query2 {
+            id
+        }
+    }
+    """
+
+    def generate(query_field: str, frozen_time: str):
+        generator = PackageGenerator(
+            "test_graphql_client",
+            tmp_path.as_posix(),
+            build_ast_schema(parse(SCHEMA_STR)),
+            include_comments=True,
+            skip_unchanged_files=True,
+        )
+        generator.add_operation(
+            parse(query_str.replace("id", query_field)).definitions[0]
+        )
+        with freeze_time(frozen_time):
+            return generator.generate()
+
+    generate("id", "2022-12-01 12:00")
+    package_path = tmp_path / "test_graphql_client"
+    enums_content = package_path.joinpath("enums.py").read_text()
+
+    generated_files = generate("field1", "2022-12-02 12:00")
+
+    assert "enums.py" in generated_files
+    assert package_path.joinpath("enums.py").read_text() == enums_content
+    query_content = package_path.joinpath("custom_query.py").read_text()
+    assert "field1" in query_content
+    assert "2022-12-02 12:00" in query_content
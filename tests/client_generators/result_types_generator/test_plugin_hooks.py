@@ -60,6 +60,36 @@ def test_generator_triggers_generate_result_class_hook_for_every_class(mocker):
     } == {"CustomQuery", "CustomQueryCamelCaseQuery"}
 
 
+def test_generator_triggers_generate_result_class_hook_once_per_class(mocker):
+    query_str = """
+    query CustomQuery {
+        camelCaseQuery {
+            id
+            field1 {
+                fielda
+            }
+        }
+    }
+    """
+    mocked_plugin_manager = mocker.MagicMock()
+    mocked_plugin_manager.generate_result_class.side_effect = (
+        lambda class_def, **_: class_def
+    )
+
+    ResultTypesGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        operation_definition=cast(
+            OperationDefinitionNode, parse(query_str).definitions[0]
+        ),
+        enums_module_name="enums",
+        plugin_manager=mocked_plugin_manager,
+    )
+
+    assert sorted(
+        c.args[0].name for c in mocked_plugin_manager.generate_result_class.mock_calls
+    ) == ["CustomQuery", "CustomQueryCamelCaseQuery", "CustomQueryCamelCaseQueryField1"]
+
+
 def test_generator_triggers_generate_result_field_hook_for_every_field(mocker):
     query_str = """
     query CustomQuery {
@@ -0,0 +1,251 @@
+from graphql import GraphQLSchema, build_ast_schema, parse
+
+from ariadne_codegen.client_generators.cache import (
+    CachedResultTypes,
+    ResultTypesCache,
+    get_result_types_cache_base_key,
+    get_used_fragments_names,
+)
+from ariadne_codegen.client_generators.scalars import ScalarData
+from ariadne_codegen.plugins.base import Plugin
+from ariadne_codegen.plugins.manager import PluginManager
+
+SCHEMA_STR = """
+type Query {
+    a: TypeA
+}
+
+type TypeA {
+    id: ID!
+    b: TypeB
+}
+
+type TypeB {
+    id: ID!
+}
+"""
+
+QUERIES_STR = """
+query getA {
+    a {
+        ...FragmentA
+    }
+}
+
+fragment FragmentA on TypeA {
+    id
+    b {
+        ...FragmentB
+    }
+}
+
+fragment FragmentB on TypeB {
+    id
+}
+
+fragment UnusedFragment on TypeB {
+    id
+}
+"""
+
+
+class PurePlugin(Plugin):
+    pure = True
+    settings = "a"
+
+    def cache_key(self) -> str:
+        return self.settings
+
+
+def get_base_key(**kwargs):
+    arguments = {
+        "schema": build_ast_schema(parse(SCHEMA_STR)),
+        "enums_module_name": "enums",
+        "convert_to_snake_case": True,
+        "base_model_import": "base_model",
+        "custom_scalars": {},
+        **kwargs,
+    }
+    return get_result_types_cache_base_key(**arguments)
+
+
+def test_get_used_fragments_names_returns_directly_and_indirectly_used_fragments():
+    operation, *fragments = parse(QUERIES_STR).definitions
+    fragments_definitions = {f.name.value: f for f in fragments}
+
+    result = get_used_fragments_names(operation.selection_set, fragments_definitions)
+
+    assert result == {"FragmentA", "FragmentB"}
+
+
+def test_get_result_types_cache_base_key_is_stable():
+    assert get_base_key() == get_base_key()
+
+
+def test_get_result_types_cache_base_key_depends_on_schema_and_settings():
+    base_key = get_base_key()
+
+    assert base_key != get_base_key(
+        schema=build_ast_schema(parse(SCHEMA_STR + "type TypeC { id: ID! }"))
+    )
+    assert base_key != get_base_key(convert_to_snake_case=False)
+    assert base_key != get_base_key(custom_scalars={"ID": ScalarData(type_="int")})
+
+
+def test_get_key_changes_when_used_fragment_changes(tmp_path):
+    cache = ResultTypesCache(cache_dir=tmp_path.as_posix(), base_key=get_base_key())
+    operation, *fragments = parse(QUERIES_STR).definitions
+    changed_operation, *changed_fragments = parse(
+        QUERIES_STR.replace(
+            "fragment FragmentB on TypeB {", "fragment FragmentB on TypeB { __typename"
+        )
+    ).definitions
+
+    key = cache.get_key(operation, {f.name.value: f for f in fragments})
+    changed_key = cache.get_key(
+        changed_operation, {f.name.value: f for f in changed_fragments}
+    )
+
+    assert key != changed_key
+
+
+def test_get_key_doesnt_change_when_unused_fragment_changes(tmp_path):
+    cache = ResultTypesCache(cache_dir=tmp_path.as_posix(), base_key=get_base_key())
+    operation, *fragments = parse(QUERIES_STR).definitions
+    changed_operation, *changed_fragments = parse(
+        QUERIES_STR.replace(
+            "fragment UnusedFragment on TypeB {",
+            "fragment UnusedFragment on TypeB { __typename",
+        )
+    ).definitions
+
+    key = cache.get_key(operation, {f.name.value: f for f in fragments})
+    changed_key = cache.get_key(
+        changed_operation, {f.name.value: f for f in changed_fragments}
+    )
+
+    assert key == changed_key
+
+
+def test_get_returns_entry_saved_with_set(tmp_path):
+    cache = ResultTypesCache(cache_dir=(tmp_path / "cache").as_posix(), base_key="")
+    entry = CachedResultTypes(
+        code="class A:\n    pass\n", operation_str="query A { a }", public_names=["A"]
+    )
+
+    cache.set("key", entry)
+
+    assert cache.get("key") == entry
+
+
+def test_get_returns_none_for_missing_or_invalid_entry(tmp_path):
+    cache = ResultTypesCache(cache_dir=tmp_path.as_posix(), base_key="")
+    tmp_path.joinpath("invalid.json").write_text("{invalid")
+
+    assert cache.get("missing") is None
+    assert cache.get("invalid") is None
+
+
+def test_get_result_types_cache_base_key_depends_on_plugins_cache_keys():
+    plugin_manager = PluginManager(schema=GraphQLSchema(), plugins_types=[PurePlugin])
+    base_key = get_base_key(plugin_manager=plugin_manager)
+
+    plugin_manager.plugins[0].settings = "b"
+
+    assert base_key != get_base_key(plugin_manager=plugin_manager)
+
+
+def test_get_result_types_cache_base_key_ignores_settings_not_used_by_plugins():
+    def get_key_with_config(config_dict):
+        return get_base_key(
+            plugin_manager=PluginManager(
+                schema=GraphQLSchema(),
+                config_dict=config_dict,
+                plugins_types=[PurePlugin],
+            )
+        )
+
+    config_dict = {
+        "tool": {
+            "ariadne-codegen": {"jobs": 1, "cache_dir": "a", "plugin_option": "a"},
+            "plugin": {"option": "a"},
+        }
+    }
+    base_key = get_key_with_config(config_dict)
+
+    assert base_key == get_key_with_config(
+        {
+            "tool": {
+                "ariadne-codegen": {
+                    "jobs": 4,
+                    "cache_dir": "b",
+                    "formatter": "native",
+                    "plugin_option": "a",
+                },
+                "plugin": {"option": "a"},
+            }
+        }
+    )
+    assert base_key != get_key_with_config(
+        {
+            "tool": {
+                "ariadne-codegen": {"jobs": 1, "cache_dir": "a", "plugin_option": "b"},
+                "plugin": {"option": "a"},
+            }
+        }
+    )
+    assert base_key != get_key_with_config(
+        {
+            "tool": {
+                "ariadne-codegen": {"jobs": 1, "cache_dir": "a", "plugin_option": "a"},
+                "plugin": {"option": "b"},
+            }
+        }
+    )
+
+
+def test_get_result_types_cache_base_key_depends_on_sources_of_codegen(mocker):
+    base_key = get_base_key()
+
+    mocker.patch(
+        "ariadne_codegen.client_generators.cache.get_sources_hash",
+        return_value="changed",
+    )
+
+    assert base_key != get_base_key()
+
+
+def test_prune_removes_entries_not_used_by_cache(tmp_path):
+    entry = CachedResultTypes(code="", operation_str="", public_names=[])
+    used_key, unused_key = "a" * 64, "b" * 64
+    previous_cache = ResultTypesCache(cache_dir=tmp_path.as_posix(), base_key="base")
+    previous_cache.set(used_key, entry)
+    previous_cache.set(unused_key, entry)
+    tmp_path.joinpath("base", "other_file.json").write_text("{}")
+    entries = {used_key: entry, unused_key: entry}
+    cache = ResultTypesCache(
+        cache_dir=tmp_path.as_posix(), base_key="base", entries=entries
+    )
+
+    cache.get(used_key)
+    cache.prune()
+
+    assert list(entries) == [used_key]
+    assert sorted(path.name for path in tmp_path.joinpath("base").iterdir()) == [
+        f"{used_key}.json",
+        "other_file.json",
+    ]
+
+
+def test_prune_keeps_entries_of_caches_with_other_base_keys(tmp_path):
+    entry = CachedResultTypes(code="", operation_str="", public_names=[])
+    key = "a" * 64
+    other_cache = ResultTypesCache(cache_dir=tmp_path.as_posix(), base_key="other")
+    other_cache.set(key, entry)
+    cache = ResultTypesCache(cache_dir=tmp_path.as_posix(), base_key="base")
+    cache.set("b" * 64, entry)
+
+    cache.prune()
+
+    assert tmp_path.joinpath("other", f"{key}.json").is_file()
+    assert tmp_path.joinpath("base", f"{'b' * 64}.json").is_file()
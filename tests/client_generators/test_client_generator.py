@@ -1,6 +1,7 @@
 import ast
 
 from ariadne_codegen.client_generators.client import ClientGenerator
+from ariadne_codegen.codegen import generate_multiline_constant
 
 from ..utils import compare_ast, filter_imports, get_class_def
 
@@ -176,7 +177,7 @@ def test_add_method_generates_correct_async_method_body():
             value=ast.Call(
                 func=ast.Name("gql"),
                 keywords=[],
-                args=[[ast.Constant(value=l + "\n") for l in query_str.splitlines()]],
+                args=[generate_multiline_constant(query_str + "\n")],
             ),
         ),
         ast.AnnAssign(
@@ -302,7 +303,7 @@ def test_add_method_generates_correct_method_body():
             value=ast.Call(
                 func=ast.Name("gql"),
                 keywords=[],
-                args=[[ast.Constant(value=l + "\n") for l in query_str.splitlines()]],
+                args=[generate_multiline_constant(query_str + "\n")],
             ),
         ),
         ast.AnnAssign(
@@ -0,0 +1,111 @@
+import ast
+from typing import Dict, Tuple, cast
+
+from graphql import OperationDefinitionNode, build_ast_schema, parse
+
+from ariadne_codegen.client_generators.common_types import CommonTypesGenerator
+from ariadne_codegen.client_generators.result_types import ResultTypesGenerator
+
+from ..utils import compare_ast, filter_class_defs, filter_imports
+
+SCHEMA_STR = """
+schema {
+  query: Query
+}
+
+type Query {
+  user: User
+  users: [User!]!
+  admin: Admin
+}
+
+type User {
+  id: ID!
+  name: String!
+  friend: User
+}
+
+type Admin {
+  id: ID!
+  name: String!
+}
+"""
+
+
+def get_generator(
+    *queries_strs: str,
+) -> Tuple[CommonTypesGenerator, Dict[str, ast.Module]]:
+    schema = build_ast_schema(parse(SCHEMA_STR))
+    generator = CommonTypesGenerator(module_name="common_types")
+    modules = {}
+    for query_str in queries_strs:
+        operation_definition = cast(
+            OperationDefinitionNode, parse(query_str).definitions[0]
+        )
+        result_types_generator = ResultTypesGenerator(
+            schema=schema,
+            operation_definition=operation_definition,
+            enums_module_name="enums",
+        )
+        module_name = cast(str, operation_definition.name).value.lower()
+        modules[module_name] = result_types_generator.generate()
+        generator.add_module(
+            module_name,
+            modules[module_name],
+            result_types_generator.get_classes_types(),
+        )
+    return generator, modules
+
+
+def test_generate_moves_models_with_the_same_structure_to_common_module():
+    generator, modules = get_generator(
+        "query A { user { id name } }", "query B { users { id name } }"
+    )
+
+    module = generator.generate()
+
+    class_defs = filter_class_defs(module)
+    assert len(class_defs) == 1
+    assert class_defs[0].name.startswith("User_")
+    module_a = modules["a"]
+    assert [c.name for c in filter_class_defs(module_a)] == ["A"]
+    assert compare_ast(
+        filter_imports(module_a)[-1],
+        ast.ImportFrom(
+            module="common_types",
+            names=[ast.alias(name=class_defs[0].name, asname="AUser")],
+            level=1,
+        ),
+    )
+    assert "__all__ = ['A', 'AUser']" in ast.unparse(module_a)
+
+
+def test_generate_shares_model_together_with_models_used_by_its_fields():
+    generator, modules = get_generator(
+        "query A { user { id friend { id } } }",
+        "query B { user { id friend { id } } }",
+    )
+
+    module = generator.generate()
+
+    assert sorted(c.name.split("_")[0] for c in filter_class_defs(module)) == [
+        "Query",
+        "User",
+        "User",
+    ]
+    module_b = modules["b"]
+    assert not filter_class_defs(module_b)
+    assert "BUserFriend" in ast.unparse(module_b)
+
+
+def test_generate_doesnt_share_models_of_different_types_or_selections():
+    generator, _ = get_generator(
+        "query A { user { id name } }",
+        "query B { admin { id name } }",
+        "query C { users { id alias: name } }",
+        "query D { users { id name @include(if: true) } }",
+    )
+
+    module = generator.generate()
+
+    assert not filter_class_defs(module)
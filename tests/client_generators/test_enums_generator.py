@@ -167,3 +167,23 @@ def test_generate_triggers_generate_enum_hook_for_every_definition(mocker):
     assert call0_enum_type.name == "TestEnumAB"
     assert isinstance(call1_enum_type, GraphQLEnumType)
     assert call1_enum_type.name == "TestEnumCD"
+
+
+def test_generate_returns_module_only_with_included_enums():
+    schema_str = """
+    enum EnumA {
+        VALUE
+    }
+
+    enum EnumB {
+        VALUE
+    }
+    """
+    generator = EnumsGenerator(
+        schema=build_ast_schema(parse(schema_str)), included_types={"EnumA"}
+    )
+
+    module = generator.generate()
+
+    assert [c.name for c in filter_class_defs(module)] == ["EnumA"]
+    assert generator.get_generated_public_names() == ["EnumA"]
@@ -0,0 +1,243 @@
+import ast
+from typing import Optional, cast
+
+from graphql import (
+    FragmentDefinitionNode,
+    OperationDefinitionNode,
+    build_ast_schema,
+    parse,
+)
+
+from ariadne_codegen.client_generators.fragments import FragmentsGenerator
+from ariadne_codegen.client_generators.result_types import ResultTypesGenerator
+from ariadne_codegen.plugins.base import Plugin
+from ariadne_codegen.plugins.manager import PluginManager
+
+from ..utils import compare_ast, filter_class_defs, filter_imports
+
+SCHEMA_STR = """
+schema {
+  query: Query
+}
+
+type Query {
+  user: User
+  users: [User!]!
+}
+
+type User {
+  id: ID!
+  name: String!
+  email: String
+  friend: User
+}
+"""
+
+QUERIES_STR = """
+fragment BasicUser on User {
+  id
+  name
+}
+
+fragment FullUser on User {
+  ...BasicUser
+  email
+  friend {
+    ...BasicUser
+  }
+}
+"""
+
+
+def get_fragments_definitions():
+    return {
+        f.name.value: cast(FragmentDefinitionNode, f)
+        for f in parse(QUERIES_STR).definitions
+    }
+
+
+def get_result_types_generator(
+    query_str: str, plugin_manager: Optional[PluginManager] = None
+) -> ResultTypesGenerator:
+    return ResultTypesGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        operation_definition=cast(
+            OperationDefinitionNode, parse(query_str).definitions[0]
+        ),
+        enums_module_name="enums",
+        fragments_definitions=get_fragments_definitions(),
+        fragments_module_name="fragments",
+        plugin_manager=plugin_manager,
+    )
+
+
+def test_generate_returns_module_with_fragments_classes_inheriting_each_other():
+    generator = FragmentsGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        fragments_definitions=get_fragments_definitions(),
+        enums_module_name="enums",
+        fragments_module_name="fragments",
+    )
+    expected_class_defs = [
+        ast.ClassDef(
+            name="BasicUser",
+            bases=[ast.Name(id="BaseModel")],
+            keywords=[],
+            decorator_list=[],
+            body=[
+                ast.AnnAssign(
+                    target=ast.Name(id="id"),
+                    annotation=ast.Name(id="str"),
+                    simple=1,
+                ),
+                ast.AnnAssign(
+                    target=ast.Name(id="name"),
+                    annotation=ast.Name(id="str"),
+                    simple=1,
+                ),
+            ],
+        ),
+        ast.ClassDef(
+            name="FullUser",
+            bases=[ast.Name(id="BasicUser")],
+            keywords=[],
+            decorator_list=[],
+            body=[
+                ast.AnnAssign(
+                    target=ast.Name(id="email"),
+                    annotation=ast.Subscript(
+                        value=ast.Name(id="Optional"), slice=ast.Name(id="str")
+                    ),
+                    simple=1,
+                ),
+                ast.AnnAssign(
+                    target=ast.Name(id="friend"),
+                    annotation=ast.Subscript(
+                        value=ast.Name(id="Optional"),
+                        slice=ast.Name(id='"FullUserFriend"'),
+                    ),
+                    simple=1,
+                ),
+            ],
+        ),
+        ast.ClassDef(
+            name="FullUserFriend",
+            bases=[ast.Name(id="BasicUser")],
+            keywords=[],
+            decorator_list=[],
+            body=[ast.Pass()],
+        ),
+    ]
+
+    module = generator.generate()
+
+    assert compare_ast(filter_class_defs(module), expected_class_defs)
+    assert generator.get_generated_public_names() == [
+        "BasicUser",
+        "FullUser",
+        "FullUserFriend",
+    ]
+
+
+def test_generate_returns_module_without_duplicated_imports():
+    generator = FragmentsGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        fragments_definitions=get_fragments_definitions(),
+        enums_module_name="enums",
+        fragments_module_name="fragments",
+    )
+
+    imports = filter_imports(generator.generate())
+
+    assert len({ast.dump(import_) for import_ in imports}) == len(imports)
+
+
+def test_generate_triggers_generate_fragments_module_hook(mocker):
+    mocked_plugin_manager = mocker.MagicMock()
+    fragments_definitions = get_fragments_definitions()
+    generator = FragmentsGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        fragments_definitions=fragments_definitions,
+        enums_module_name="enums",
+        fragments_module_name="fragments",
+        plugin_manager=mocked_plugin_manager,
+    )
+
+    generator.generate()
+
+    assert mocked_plugin_manager.generate_fragments_module.called
+    assert (
+        mocked_plugin_manager.generate_fragments_module.call_args.kwargs[
+            "fragments_definitions"
+        ]
+        == fragments_definitions
+    )
+
+
+def test_result_types_generator_inherits_models_from_shared_fragments():
+    generator = get_result_types_generator(
+        """
+        query GetUsers {
+          users {
+            ...FullUser
+          }
+        }
+        """
+    )
+
+    module = generator.generate()
+
+    class_defs = filter_class_defs(module)
+    assert [c.name for c in class_defs] == ["GetUsers", "GetUsersUsers"]
+    assert compare_ast(class_defs[1].bases, [ast.Name(id="FullUser")])
+    assert compare_ast(class_defs[1].body, [ast.Pass()])
+    assert compare_ast(
+        filter_imports(module)[-1],
+        ast.ImportFrom(module="fragments", names=[ast.alias("FullUser")], level=1),
+    )
+
+
+def test_result_types_generator_triggers_hook_for_class_with_only_inherited_fields():
+    class DocstringPlugin(Plugin):
+        def generate_result_class(self, class_def, operation_definition, selection_set):
+            class_def.body.insert(0, ast.Expr(ast.Constant(class_def.name)))
+            return class_def
+
+    schema = build_ast_schema(parse(SCHEMA_STR))
+    generator = get_result_types_generator(
+        """
+        query GetUsers {
+          users {
+            ...FullUser
+          }
+        }
+        """,
+        plugin_manager=PluginManager(schema=schema, plugins_types=[DocstringPlugin]),
+    )
+
+    class_defs = filter_class_defs(generator.generate())
+
+    assert compare_ast(
+        class_defs[1].body, [ast.Expr(ast.Constant("GetUsersUsers")), ast.Pass()]
+    )
+
+
+def test_result_types_generator_inlines_fragment_with_conflicting_field():
+    generator = get_result_types_generator(
+        """
+        query GetUser {
+          user {
+            ...FullUser
+            friend {
+              email
+            }
+          }
+        }
+        """
+    )
+
+    module = generator.generate()
+
+    class_defs = filter_class_defs(module)
+    assert compare_ast(class_defs[1].bases, [ast.Name(id="BaseModel")])
+    assert "FullUser" not in generator.get_inherited_fragments_names()
@@ -1,4 +1,8 @@
 import ast
+import importlib
+import sys
+
+import pytest
 
 from ariadne_codegen.client_generators.init_file import InitFileGenerator
 
@@ -71,3 +75,65 @@ def test_generate_triggers_generate_init_module_from_plugin_manager(mocker):
     generator.generate()
 
     assert mocked_plugin_manager.generate_init_module.called
+
+
+def test_generate_with_lazy_imports_names_only_for_type_checking():
+    generator = InitFileGenerator(lazy=True)
+    generator.add_import(["Xyz"], "xyz", 1)
+    generator.add_import(["Abcd", "Efgh"], "abcd", 1)
+
+    module = generator.generate()
+
+    type_checking_block = next(stmt for stmt in module.body if isinstance(stmt, ast.If))
+    assert type_checking_block.test.id == "_TYPE_CHECKING"
+    assert [i.module for i in type_checking_block.body] == ["xyz", "abcd"]
+    assert not [
+        stmt
+        for stmt in module.body
+        if isinstance(stmt, ast.ImportFrom) and stmt.level == 1
+    ]
+    assert {f.name for f in module.body if isinstance(f, ast.FunctionDef)} == {
+        "__getattr__",
+        "__dir__",
+    }
+
+
+def test_generate_with_lazy_returns_module_importing_names_on_first_access(
+    tmp_path, monkeypatch
+):
+    package_path = tmp_path / "lazy_package"
+    package_path.mkdir()
+    (package_path / "abcd.py").write_text("Abcd = 'abcd'\n")
+    generator = InitFileGenerator(lazy=True)
+    generator.add_import(["Abcd"], "abcd", 1)
+    (package_path / "__init__.py").write_text(ast.unparse(generator.generate()))
+    monkeypatch.syspath_prepend(tmp_path.as_posix())
+    monkeypatch.delitem(sys.modules, "lazy_package", raising=False)
+    monkeypatch.delitem(sys.modules, "lazy_package.abcd", raising=False)
+
+    package = importlib.import_module("lazy_package")
+
+    assert "lazy_package.abcd" not in sys.modules
+    assert package.Abcd == "abcd"
+    assert "lazy_package.abcd" in sys.modules
+    assert dir(package) == ["Abcd"]
+    with pytest.raises(AttributeError):
+        getattr(package, "Xyz")
+
+
+def test_generate_with_lazy_doesnt_shadow_exported_names_with_own_imports(
+    tmp_path, monkeypatch
+):
+    package_path = tmp_path / "lazy_package_names"
+    package_path.mkdir()
+    (package_path / "types.py").write_text("Any = 'any'\nList = 'list'\n")
+    generator = InitFileGenerator(lazy=True)
+    generator.add_import(["Any", "List"], "types", 1)
+    (package_path / "__init__.py").write_text(ast.unparse(generator.generate()))
+    monkeypatch.syspath_prepend(tmp_path.as_posix())
+
+    package = importlib.import_module("lazy_package_names")
+
+    assert package.Any == "any"
+    assert package.List == "list"
+    assert not hasattr(package, "import_module")
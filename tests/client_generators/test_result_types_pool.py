@@ -0,0 +1,91 @@
+import ast
+import pickle
+
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.result_types_pool import (
+    ResultTypesCodeGenerator,
+    generate_in_worker,
+    init_worker,
+)
+from ariadne_codegen.plugins.base import Plugin
+from ariadne_codegen.plugins.manager import PluginManager
+from ariadne_codegen.utils import Formatter
+
+SCHEMA_STR = """
+type Query {
+    query1: CustomType
+}
+
+type CustomType {
+    id: ID!
+    field: String
+}
+"""
+
+QUERY_STR = """
+query CustomQuery {
+    query1 {
+        id
+        field
+    }
+}
+"""
+
+
+class PureFieldsCountPlugin(Plugin):
+    pure = True
+
+    def generate_result_class(self, class_def, operation_definition, selection_set):
+        fields_count = len(self.schema.type_map["CustomType"].fields)
+        class_def.body.insert(0, ast.Expr(ast.Constant(f"Fields: {fields_count}")))
+        return class_def
+
+
+def get_generator(**kwargs) -> ResultTypesCodeGenerator:
+    return ResultTypesCodeGenerator(
+        schema=build_ast_schema(parse(SCHEMA_STR)),
+        operations_definitions=list(parse(QUERY_STR).definitions),
+        fragments_definitions={},
+        enums_module_name="enums",
+        formatter=Formatter.NATIVE,
+        **kwargs,
+    )
+
+
+def test_generate_returns_code_operation_string_and_public_names():
+    result = get_generator().generate(0)
+
+    assert "class CustomQuery(BaseModel):" in result.code
+    assert "class CustomQueryQuery1(BaseModel):" in result.code
+    assert result.operation_str.startswith("query CustomQuery {")
+    assert result.public_names == ["CustomQuery", "CustomQueryQuery1"]
+
+
+def test_generator_can_be_pickled_with_schema():
+    generator = get_generator()
+
+    unpickled = pickle.loads(pickle.dumps(generator))
+
+    assert unpickled.generate(0) == generator.generate(0)
+
+
+def test_generate_in_worker_uses_generator_passed_to_init_worker():
+    generator = get_generator()
+
+    init_worker(generator)
+
+    assert generate_in_worker(0) == generator.generate(0)
+
+
+def test_generator_can_be_pickled_with_plugin_manager_using_schema():
+    schema = build_ast_schema(parse(SCHEMA_STR))
+    plugin_manager = PluginManager(schema=schema, plugins_types=[PureFieldsCountPlugin])
+    generator = get_generator(plugin_manager=plugin_manager)
+
+    unpickled = pickle.loads(pickle.dumps(generator))
+
+    assert unpickled.plugin_manager.plugins[0].schema is unpickled.schema
+    result = unpickled.generate(0)
+    assert '"""Fields: 2"""' in result.code
+    assert result == generator.generate(0)
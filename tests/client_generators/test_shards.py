@@ -0,0 +1,182 @@
+import ast
+from textwrap import dedent
+
+from ariadne_codegen.client_generators.shards import (
+    generate_index_module,
+    get_strongly_connected_components,
+    merge_modules,
+    pack_by_size,
+    pack_components,
+    split_module,
+)
+
+
+def test_get_strongly_connected_components_returns_dependencies_first():
+    graph = {
+        "A": ["B"],
+        "B": ["A", "C"],
+        "C": ["D"],
+        "D": [],
+        "E": ["E"],
+    }
+
+    result = get_strongly_connected_components(graph)
+
+    assert result == [["D"], ["C"], ["A", "B"], ["E"]]
+
+
+def test_get_strongly_connected_components_handles_deep_graphs():
+    graph = {str(i): [str(i + 1)] for i in range(5000)}
+    graph["5000"] = ["0"]
+
+    result = get_strongly_connected_components(graph)
+
+    assert len(result) == 1
+    assert len(result[0]) == 5001
+
+
+def test_pack_components_keeps_order_and_does_not_split_components():
+    components = [["A"], ["B", "C", "D"], ["E"], ["F"], ["G"]]
+
+    result = pack_components(components, 3)
+
+    assert result == [["A"], ["B", "C", "D"], ["E", "F", "G"]]
+
+
+def test_pack_components_returns_no_empty_shards():
+    assert pack_components([["A"]], 5) == [["A"]]
+    assert not pack_components([], 5)
+
+
+def test_pack_by_size_returns_shards_with_similar_sizes():
+    sizes = {"a": 1, "b": 5, "c": 2, "d": 3, "e": 1}
+
+    result = pack_by_size(sizes, 2)
+
+    assert result == [["a", "b"], ["c", "d", "e"]]
+
+
+def test_pack_by_size_returns_no_empty_shards():
+    assert pack_by_size({"a": 1}, 3) == [["a"]]
+
+
+def test_split_module_returns_shards_importing_classes_from_previous_shards():
+    module = ast.parse(
+        dedent(
+            """
+            from typing import Optional
+            from .base_model import BaseModel
+
+            class AInput(BaseModel):
+                b: Optional["BInput"]
+
+            class BInput(BaseModel):
+                a: Optional["AInput"]
+                c: Optional["CInput"]
+
+            class CInput(BaseModel):
+                value: int
+
+            AInput.update_forward_refs()
+            BInput.update_forward_refs()
+            CInput.update_forward_refs()
+            """
+        )
+    )
+
+    result = split_module(module, "input_types", 2)
+
+    assert list(result) == ["input_types_0", "input_types_1"]
+    assert ast.unparse(result["input_types_0"]) == dedent(
+        """\
+        from typing import Optional
+        from .base_model import BaseModel
+
+        class CInput(BaseModel):
+            value: int
+        CInput.update_forward_refs()"""
+    )
+    assert ast.unparse(result["input_types_1"]) == dedent(
+        """\
+        from typing import Optional
+        from .base_model import BaseModel
+        from .input_types_0 import CInput
+
+        class AInput(BaseModel):
+            b: Optional['BInput']
+
+        class BInput(BaseModel):
+            a: Optional['AInput']
+            c: Optional[CInput]
+        AInput.update_forward_refs()
+        BInput.update_forward_refs()"""
+    )
+
+
+def test_merge_modules_returns_module_with_merged_imports_and_all_names():
+    modules = [
+        ast.parse(
+            dedent(
+                """
+                from .base_model import BaseModel
+                from .common_types import Shared as QueryAData
+                __all__ = ["QueryA", "QueryAData"]
+
+                class QueryA(BaseModel):
+                    data: QueryAData
+                """
+            )
+        ),
+        ast.parse(
+            dedent(
+                """
+                from .base_model import BaseModel
+
+                class QueryB(BaseModel):
+                    id: str
+                """
+            )
+        ),
+    ]
+
+    result = merge_modules(modules)
+
+    assert ast.unparse(result) == dedent(
+        """\
+        from .base_model import BaseModel
+        from .common_types import Shared as QueryAData
+        __all__ = ['QueryA', 'QueryAData', 'QueryB']
+
+        class QueryA(BaseModel):
+            data: QueryAData
+
+        class QueryB(BaseModel):
+            id: str"""
+    )
+
+
+def test_generate_index_module_maps_classes_to_shards():
+    shards_modules = {
+        "input_types_0": ast.parse("class AInput:\n    pass"),
+        "input_types_1": ast.parse("class BInput:\n    pass"),
+    }
+
+    result = generate_index_module(shards_modules)
+
+    lazy_imports = next(
+        stmt
+        for stmt in result.body
+        if isinstance(stmt, ast.Assign) and stmt.targets[0].id == "_LAZY_IMPORTS"
+    )
+    assert ast.literal_eval(lazy_imports.value) == {
+        "AInput": ".input_types_0",
+        "BInput": ".input_types_1",
+    }
+
+
+def test_pack_components_returns_not_more_than_given_number_of_shards():
+    components = [["A"], ["B", "C"], ["D"]]
+
+    result = pack_components(components, 2)
+
+    assert result == [["A"], ["B", "C", "D"]]
@@ -0,0 +1,87 @@
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen.client_generators.used_types import get_used_types_names
+
+SCHEMA_STR = """
+schema {
+  query: Query
+}
+
+scalar DateTime
+scalar Unused
+
+enum Role {
+  ADMIN
+}
+
+enum Status {
+  ON
+}
+
+enum Color {
+  RED
+}
+
+input UserFilter {
+  role: Role
+  nested: NestedFilter
+}
+
+input NestedFilter {
+  since: DateTime
+  parent: UserFilter
+}
+
+input OtherInput {
+  color: Color
+}
+
+type Query {
+  users(filter: UserFilter): [User!]!
+  other(input: OtherInput, unused: Unused): Boolean
+}
+
+type User {
+  id: ID!
+  status: Status!
+  color: Color
+}
+"""
+
+
+def test_get_used_types_names_returns_types_of_variables_and_their_fields():
+    query_str = """
+    query ListUsers($filter: UserFilter) {
+        users(filter: $filter) {
+            id
+        }
+    }
+    """
+
+    used_types = get_used_types_names(
+        build_ast_schema(parse(SCHEMA_STR)), parse(query_str).definitions
+    )
+
+    assert {"UserFilter", "NestedFilter", "Role", "DateTime"} <= used_types
+    assert not {"OtherInput", "Color", "Status", "Unused"} & used_types
+
+
+def test_get_used_types_names_returns_enums_and_scalars_of_selected_fields():
+    query_str = """
+    query ListUsers {
+        users {
+            ...UserFields
+        }
+    }
+
+    fragment UserFields on User {
+        id
+        status
+    }
+    """
+
+    used_types = get_used_types_names(
+        build_ast_schema(parse(SCHEMA_STR)), parse(query_str).definitions
+    )
+
+    assert used_types == {"ID", "Status"}
@@ -0,0 +1,31 @@
+from .async_base_client import AsyncBaseClient
+from .base_model import BaseModel
+from .client import Client
+from .exceptions import (
+    GraphQLClientError,
+    GraphQLClientGraphQLError,
+    GraphQLClientGraphQLMultiError,
+    GraphQLClientHttpError,
+    GraphQlClientInvalidResponseError,
+)
+from .get_user import GetUser, GetUserUser, GetUserUserFriend
+from .list_users import ListUsers, ListUsersUsers
+from .list_users_emails import ListUsersEmails, ListUsersEmailsUsers
+
+__all__ = [
+    "AsyncBaseClient",
+    "BaseModel",
+    "Client",
+    "GetUser",
+    "GetUserUser",
+    "GetUserUserFriend",
+    "GraphQLClientError",
+    "GraphQLClientGraphQLError",
+    "GraphQLClientGraphQLMultiError",
+    "GraphQLClientHttpError",
+    "GraphQlClientInvalidResponseError",
+    "ListUsers",
+    "ListUsersEmails",
+    "ListUsersEmailsUsers",
+    "ListUsersUsers",
+]
@@ -0,0 +1,62 @@
+from .async_base_client import AsyncBaseClient
+from .get_user import GetUser
+from .list_users import ListUsers
+from .list_users_emails import ListUsersEmails
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class Client(AsyncBaseClient):
+    async def get_user(self, id: str) -> GetUser:
+        query = gql(
+            """
+            query GetUser($id: ID!) {
+              user(id: $id) {
+                id
+                name
+                friend {
+                  id
+                  name
+                }
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {"id": id}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return GetUser.parse_obj(data)
+
+    async def list_users(self) -> ListUsers:
+        query = gql(
+            """
+            query ListUsers {
+              users {
+                id
+                name
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return ListUsers.parse_obj(data)
+
+    async def list_users_emails(self) -> ListUsersEmails:
+        query = gql(
+            """
+            query ListUsersEmails {
+              users {
+                id
+                email
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return ListUsersEmails.parse_obj(data)
@@ -0,0 +1,9 @@
+from .base_model import BaseModel
+
+
+class User_6c25043edf26(BaseModel):
+    id: str
+    name: str
+
+
+User_6c25043edf26.update_forward_refs()
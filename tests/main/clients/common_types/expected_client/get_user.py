@@ -0,0 +1,20 @@
+from typing import Optional
+
+from .base_model import BaseModel
+from .common_types import User_6c25043edf26 as GetUserUserFriend
+
+__all__ = ["GetUser", "GetUserUser", "GetUserUserFriend"]
+
+
+class GetUser(BaseModel):
+    user: Optional["GetUserUser"]
+
+
+class GetUserUser(BaseModel):
+    id: str
+    name: str
+    friend: Optional["GetUserUserFriend"]
+
+
+GetUser.update_forward_refs()
+GetUserUser.update_forward_refs()
@@ -0,0 +1,13 @@
+from typing import List
+
+from .base_model import BaseModel
+from .common_types import User_6c25043edf26 as ListUsersUsers
+
+__all__ = ["ListUsers", "ListUsersUsers"]
+
+
+class ListUsers(BaseModel):
+    users: List["ListUsersUsers"]
+
+
+ListUsers.update_forward_refs()
@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from .base_model import BaseModel
+
+
+class ListUsersEmails(BaseModel):
+    users: List["ListUsersEmailsUsers"]
+
+
+class ListUsersEmailsUsers(BaseModel):
+    id: str
+    email: Optional[str]
+
+
+ListUsersEmails.update_forward_refs()
+ListUsersEmailsUsers.update_forward_refs()
@@ -0,0 +1,92 @@
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+from typing import List as _List
+
+if _TYPE_CHECKING:
+    from .async_base_client import AsyncBaseClient
+    from .base_model import BaseModel
+    from .client import Client
+    from .enums import Kind
+    from .exceptions import (
+        GraphQLClientError,
+        GraphQLClientGraphQLError,
+        GraphQLClientGraphQLMultiError,
+        GraphQLClientHttpError,
+        GraphQlClientInvalidResponseError,
+    )
+    from .input_types import AInput, BInput, CInput, DInput, EInput, FInput
+    from .result_types_0 import GetA, GetAA, GetAAChildren, GetB, GetBB
+    from .result_types_1 import (
+        ListItems,
+        ListItems2,
+        ListItems2Items,
+        ListItemsItems,
+        ListItemsItemsChildren,
+    )
+_LAZY_IMPORTS = {
+    "AInput": ".input_types",
+    "AsyncBaseClient": ".async_base_client",
+    "BInput": ".input_types",
+    "BaseModel": ".base_model",
+    "CInput": ".input_types",
+    "Client": ".client",
+    "DInput": ".input_types",
+    "EInput": ".input_types",
+    "FInput": ".input_types",
+    "GetA": ".result_types_0",
+    "GetAA": ".result_types_0",
+    "GetAAChildren": ".result_types_0",
+    "GetB": ".result_types_0",
+    "GetBB": ".result_types_0",
+    "GraphQLClientError": ".exceptions",
+    "GraphQLClientGraphQLError": ".exceptions",
+    "GraphQLClientGraphQLMultiError": ".exceptions",
+    "GraphQLClientHttpError": ".exceptions",
+    "GraphQlClientInvalidResponseError": ".exceptions",
+    "Kind": ".enums",
+    "ListItems": ".result_types_1",
+    "ListItems2": ".result_types_1",
+    "ListItems2Items": ".result_types_1",
+    "ListItemsItems": ".result_types_1",
+    "ListItemsItemsChildren": ".result_types_1",
+}
+__all__ = [
+    "AInput",
+    "AsyncBaseClient",
+    "BInput",
+    "BaseModel",
+    "CInput",
+    "Client",
+    "DInput",
+    "EInput",
+    "FInput",
+    "GetA",
+    "GetAA",
+    "GetAAChildren",
+    "GetB",
+    "GetBB",
+    "GraphQLClientError",
+    "GraphQLClientGraphQLError",
+    "GraphQLClientGraphQLMultiError",
+    "GraphQLClientHttpError",
+    "GraphQlClientInvalidResponseError",
+    "Kind",
+    "ListItems",
+    "ListItems2",
+    "ListItems2Items",
+    "ListItemsItems",
+    "ListItemsItemsChildren",
+]
+
+
+def __getattr__(name: str) -> _Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(_LAZY_IMPORTS[name], __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    return list(__all__)
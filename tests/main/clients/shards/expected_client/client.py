@@ -0,0 +1,84 @@
+from typing import Optional
+
+from .async_base_client import AsyncBaseClient
+from .input_types import AInput, BInput, FInput
+from .result_types_0 import GetA, GetB
+from .result_types_1 import ListItems, ListItems2
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class Client(AsyncBaseClient):
+    async def get_a(self, input: Optional[AInput] = None) -> GetA:
+        query = gql(
+            """
+            query GetA($input: AInput) {
+              a(input: $input) {
+                id
+                name
+                children {
+                  id
+                  kind
+                }
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {"input": input}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return GetA.parse_obj(data)
+
+    async def get_b(
+        self, input: Optional[BInput] = None, f: Optional[FInput] = None
+    ) -> GetB:
+        query = gql(
+            """
+            query GetB($input: BInput, $f: FInput) {
+              b(input: $input, f: $f) {
+                id
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {"input": input, "f": f}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return GetB.parse_obj(data)
+
+    async def list_items(self) -> ListItems:
+        query = gql(
+            """
+            query ListItems {
+              items {
+                id
+                name
+                kind
+                children {
+                  id
+                }
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return ListItems.parse_obj(data)
+
+    async def list_items2(self) -> ListItems2:
+        query = gql(
+            """
+            query ListItems2 {
+              items {
+                id
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return ListItems2.parse_obj(data)
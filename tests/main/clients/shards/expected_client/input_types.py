@@ -0,0 +1,30 @@
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+from typing import List as _List
+
+if _TYPE_CHECKING:
+    from .input_types_0 import CInput, DInput
+    from .input_types_1 import AInput, BInput
+    from .input_types_2 import EInput, FInput
+_LAZY_IMPORTS = {
+    "AInput": ".input_types_1",
+    "BInput": ".input_types_1",
+    "CInput": ".input_types_0",
+    "DInput": ".input_types_0",
+    "EInput": ".input_types_2",
+    "FInput": ".input_types_2",
+}
+__all__ = ["AInput", "BInput", "CInput", "DInput", "EInput", "FInput"]
+
+
+def __getattr__(name: str) -> _Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(_LAZY_IMPORTS[name], __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    return list(__all__)
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from .base_model import BaseModel
+
+
+class DInput(BaseModel):
+    value: Optional[str]
+
+
+class CInput(BaseModel):
+    d: Optional["DInput"]
+
+
+DInput.update_forward_refs()
+CInput.update_forward_refs()
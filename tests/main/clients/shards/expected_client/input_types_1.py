@@ -0,0 +1,20 @@
+from typing import Optional
+
+from .base_model import BaseModel
+from .enums import Kind
+from .input_types_0 import CInput
+
+
+class AInput(BaseModel):
+    b: Optional["BInput"]
+    value: Optional[int]
+    kind: Optional[Kind]
+
+
+class BInput(BaseModel):
+    a: Optional["AInput"]
+    c: Optional[CInput]
+
+
+AInput.update_forward_refs()
+BInput.update_forward_refs()
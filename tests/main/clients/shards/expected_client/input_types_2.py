@@ -0,0 +1,16 @@
+from typing import Optional
+
+from .base_model import BaseModel
+
+
+class EInput(BaseModel):
+    value: Optional[str]
+
+
+class FInput(BaseModel):
+    e: Optional["EInput"]
+    self: Optional["FInput"]
+
+
+EInput.update_forward_refs()
+FInput.update_forward_refs()
@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from .base_model import BaseModel
+from .enums import Kind
+
+
+class GetA(BaseModel):
+    a: Optional["GetAA"]
+
+
+class GetAA(BaseModel):
+    id: str
+    name: Optional[str]
+    children: List["GetAAChildren"]
+
+
+class GetAAChildren(BaseModel):
+    id: str
+    kind: Optional[Kind]
+
+
+GetA.update_forward_refs()
+GetAA.update_forward_refs()
+GetAAChildren.update_forward_refs()
+
+
+class GetB(BaseModel):
+    b: Optional["GetBB"]
+
+
+class GetBB(BaseModel):
+    id: str
+
+
+GetB.update_forward_refs()
+GetBB.update_forward_refs()
@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from .base_model import BaseModel
+from .enums import Kind
+
+
+class ListItems(BaseModel):
+    items: List["ListItemsItems"]
+
+
+class ListItemsItems(BaseModel):
+    id: str
+    name: Optional[str]
+    kind: Optional[Kind]
+    children: List["ListItemsItemsChildren"]
+
+
+class ListItemsItemsChildren(BaseModel):
+    id: str
+
+
+ListItems.update_forward_refs()
+ListItemsItems.update_forward_refs()
+ListItemsItemsChildren.update_forward_refs()
+
+
+class ListItems2(BaseModel):
+    items: List["ListItems2Items"]
+
+
+class ListItems2Items(BaseModel):
+    id: str
+
+
+ListItems2.update_forward_refs()
+ListItems2Items.update_forward_refs()
@@ -0,0 +1,31 @@
+from .async_base_client import AsyncBaseClient
+from .base_model import BaseModel
+from .client import Client
+from .exceptions import (
+    GraphQLClientError,
+    GraphQLClientGraphQLError,
+    GraphQLClientGraphQLMultiError,
+    GraphQLClientHttpError,
+    GraphQlClientInvalidResponseError,
+)
+from .fragments import BasicUser, FullUser, FullUserFriend
+from .get_user import GetUser, GetUserUser
+from .list_users import ListUsers, ListUsersUsers
+
+__all__ = [
+    "AsyncBaseClient",
+    "BaseModel",
+    "BasicUser",
+    "Client",
+    "FullUser",
+    "FullUserFriend",
+    "GetUser",
+    "GetUserUser",
+    "GraphQLClientError",
+    "GraphQLClientGraphQLError",
+    "GraphQLClientGraphQLMultiError",
+    "GraphQLClientHttpError",
+    "GraphQlClientInvalidResponseError",
+    "ListUsers",
+    "ListUsersUsers",
+]
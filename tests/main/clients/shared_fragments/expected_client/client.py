@@ -0,0 +1,58 @@
+from .async_base_client import AsyncBaseClient
+from .get_user import GetUser
+from .list_users import ListUsers
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class Client(AsyncBaseClient):
+    async def get_user(self, id: str) -> GetUser:
+        query = gql(
+            """
+            query GetUser($id: ID!) {
+              user(id: $id) {
+                ...FullUser
+              }
+            }
+
+            fragment BasicUser on User {
+              id
+              name
+            }
+
+            fragment FullUser on User {
+              ...BasicUser
+              email
+              friend {
+                ...BasicUser
+              }
+            }
+            """
+        )
+        variables: dict[str, object] = {"id": id}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return GetUser.parse_obj(data)
+
+    async def list_users(self) -> ListUsers:
+        query = gql(
+            """
+            query ListUsers {
+              users {
+                ...BasicUser
+                email
+              }
+            }
+
+            fragment BasicUser on User {
+              id
+              name
+            }
+            """
+        )
+        variables: dict[str, object] = {}
+        response = await self.execute(query=query, variables=variables)
+        data = self.get_data(response)
+        return ListUsers.parse_obj(data)
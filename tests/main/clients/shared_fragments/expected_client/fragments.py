@@ -0,0 +1,22 @@
+from typing import Optional
+
+from .base_model import BaseModel
+
+
+class BasicUser(BaseModel):
+    id: str
+    name: str
+
+
+class FullUser(BasicUser):
+    email: Optional[str]
+    friend: Optional["FullUserFriend"]
+
+
+class FullUserFriend(BasicUser):
+    pass
+
+
+BasicUser.update_forward_refs()
+FullUser.update_forward_refs()
+FullUserFriend.update_forward_refs()
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from .base_model import BaseModel
+from .fragments import FullUser
+
+
+class GetUser(BaseModel):
+    user: Optional["GetUserUser"]
+
+
+class GetUserUser(FullUser):
+    pass
+
+
+GetUser.update_forward_refs()
+GetUserUser.update_forward_refs()
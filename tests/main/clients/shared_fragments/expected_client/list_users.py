@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from .base_model import BaseModel
+from .fragments import BasicUser
+
+
+class ListUsers(BaseModel):
+    users: List["ListUsersUsers"]
+
+
+class ListUsersUsers(BasicUser):
+    email: Optional[str]
+
+
+ListUsers.update_forward_refs()
+ListUsersUsers.update_forward_refs()
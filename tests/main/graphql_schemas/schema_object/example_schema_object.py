@@ -0,0 +1,5 @@
+from pathlib import Path
+
+from graphql import build_schema
+
+schema = build_schema(Path(__file__).with_name("schema.graphql").read_text())
@@ -1,3 +1,4 @@
+import json
 import os
 from importlib.metadata import version
 from pathlib import Path
@@ -130,6 +131,39 @@ def test_main_shows_version():
             "inline_fragments_client",
             CLIENTS_PATH / "inline_fragments" / "expected_client",
         ),
+        (
+            (
+                CLIENTS_PATH / "shared_fragments" / "pyproject.toml",
+                (
+                    CLIENTS_PATH / "shared_fragments" / "queries.graphql",
+                    CLIENTS_PATH / "shared_fragments" / "schema.graphql",
+                ),
+            ),
+            "shared_fragments_client",
+            CLIENTS_PATH / "shared_fragments" / "expected_client",
+        ),
+        (
+            (
+                CLIENTS_PATH / "common_types" / "pyproject.toml",
+                (
+                    CLIENTS_PATH / "common_types" / "queries.graphql",
+                    CLIENTS_PATH / "common_types" / "schema.graphql",
+                ),
+            ),
+            "common_types_client",
+            CLIENTS_PATH / "common_types" / "expected_client",
+        ),
+        (
+            (
+                CLIENTS_PATH / "shards" / "pyproject.toml",
+                (
+                    CLIENTS_PATH / "shards" / "queries.graphql",
+                    CLIENTS_PATH / "shards" / "schema.graphql",
+                ),
+            ),
+            "shards_client",
+            CLIENTS_PATH / "shards" / "expected_client",
+        ),
     ],
     indirect=["project_dir"],
 )
@@ -144,6 +178,34 @@ def test_main_generates_correct_package(
     assert_the_same_files_in_directories(package_path, expected_package_path)
 
 
+@pytest.mark.parametrize(
+    "project_dir, package_name, expected_package_path",
+    [
+        (
+            (
+                CLIENTS_PATH / "example" / "pyproject.toml",
+                (
+                    CLIENTS_PATH / "example" / "queries.graphql",
+                    CLIENTS_PATH / "example" / "schema.graphql",
+                ),
+            ),
+            "example_client",
+            CLIENTS_PATH / "example" / "expected_client",
+        ),
+    ],
+    indirect=["project_dir"],
+)
+def test_main_with_jobs_option_generates_correct_package(
+    project_dir, package_name, expected_package_path
+):
+    result = CliRunner().invoke(main, args="--jobs 2", catch_exceptions=False)
+
+    assert result.exit_code == 0
+    package_path = project_dir / package_name
+    assert package_path.is_dir()
+    assert_the_same_files_in_directories(package_path, expected_package_path)
+
+
 @pytest.mark.parametrize(
     "project_dir, expected_exception",
     [
@@ -257,6 +319,17 @@ def test_main_can_read_config_from_provided_file(tmp_path):
             "schema.py",
             GRAPHQL_SCHEMAS_PATH / "all_types" / "expected_schema.py",
         ),
+        (
+            (
+                GRAPHQL_SCHEMAS_PATH / "schema_object" / "pyproject.toml",
+                (
+                    GRAPHQL_SCHEMAS_PATH / "schema_object" / "example_schema_object.py",
+                    GRAPHQL_SCHEMAS_PATH / "example" / "schema.graphql",
+                ),
+            ),
+            "example_schema.py",
+            GRAPHQL_SCHEMAS_PATH / "example" / "expected_schema.py",
+        ),
     ],
     indirect=["project_dir"],
 )
@@ -267,3 +340,85 @@ def test_main_generates_correct_schema_file(project_dir, file_name, expected_fil
     schema_path = project_dir / file_name
 
     assert schema_path.read_text() == expected_file_path.read_text()
+
+
+@pytest.mark.parametrize("option", ["--watch", "--profile"])
+def test_main_with_server_option_rejects_local_only_options(mocker, option):
+    mocked_send_job = mocker.patch("ariadne_codegen.server.send_job")
+
+    result = CliRunner().invoke(main, args=f"--server {option}")
+
+    assert result.exit_code != 0
+    assert "can't be used with server" in result.output
+    assert not mocked_send_job.called
+
+
+@pytest.mark.parametrize(
+    "project_dir",
+    [
+        (
+            CLIENTS_PATH / "example" / "pyproject.toml",
+            (
+                CLIENTS_PATH / "example" / "queries.graphql",
+                CLIENTS_PATH / "example" / "schema.graphql",
+            ),
+        ),
+    ],
+    indirect=["project_dir"],
+)
+def test_main_with_watch_option_runs_client_watcher(
+    mocker, project_dir
+):  # pylint: disable=W0613
+    mocked_run = mocker.patch("ariadne_codegen.watch.ClientWatcher.run")
+
+    result = CliRunner().invoke(main, args="--watch", catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert mocked_run.called
+
+
+def test_main_with_server_option_sends_job_to_server(mocker):
+    mocked_send_job = mocker.patch(
+        "ariadne_codegen.server.send_job", return_value="Generated files:\n"
+    )
+
+    result = CliRunner().invoke(
+        main, args="--server --socket test.sock --jobs 2", catch_exceptions=False
+    )
+
+    assert result.exit_code == 0
+    assert "Generated files:" in result.output
+    mocked_send_job.assert_called_once_with("test.sock", "client", config=None, jobs=2)
+
+
+@pytest.mark.parametrize(
+    "project_dir",
+    [
+        (
+            CLIENTS_PATH / "example" / "pyproject.toml",
+            (
+                CLIENTS_PATH / "example" / "queries.graphql",
+                CLIENTS_PATH / "example" / "schema.graphql",
+            ),
+        ),
+    ],
+    indirect=["project_dir"],
+)
+def test_main_with_profile_output_saves_profile_report(project_dir):
+    result = CliRunner().invoke(
+        main, args="--profile-output report.json", catch_exceptions=False
+    )
+
+    assert result.exit_code == 0
+    assert "Profile:" in result.output
+    report = json.loads(project_dir.joinpath("report.json").read_text())
+    stages_names = {stage["name"] for stage in report["stages"]}
+    assert {
+        "config_load",
+        "schema_load",
+        "queries_parsing",
+        "add_operation",
+        "generate",
+        "ast_to_str",
+        "write_file",
+    }.issubset(stages_names)
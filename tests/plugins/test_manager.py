@@ -1,4 +1,5 @@
 import ast
+import pickle
 from typing import cast
 
 import pytest
@@ -6,9 +7,12 @@ from graphql import (
     FieldNode,
     GraphQLEnumType,
     GraphQLEnumValueMap,
+    GraphQLField,
     GraphQLInputField,
     GraphQLInputObjectType,
+    GraphQLObjectType,
     GraphQLSchema,
+    GraphQLString,
     OperationDefinitionNode,
     SelectionSetNode,
     VariableDefinitionNode,
@@ -16,6 +20,29 @@ from graphql import (
 
 from ariadne_codegen.plugins.base import Plugin
 from ariadne_codegen.plugins.manager import PluginManager
+from ariadne_codegen.profiling import Profiler
+
+
+class ResultFieldPlugin(Plugin):
+    def generate_result_field(self, field_implementation, operation_definition, field):
+        return field_implementation
+
+
+class PureResultFieldPlugin(ResultFieldPlugin):
+    pure = True
+
+
+class PureClientCodePlugin(Plugin):
+    pure = True
+
+    def generate_client_code(self, generated_code: str) -> str:
+        return generated_code
+
+
+class NotPicklablePlugin(PureResultFieldPlugin):
+    def __init__(self, schema, config_dict):
+        super().__init__(schema, config_dict)
+        self.callback = lambda: None
 
 
 @pytest.fixture
@@ -222,6 +249,17 @@ def test_generate_scalars_module_calls_plugins_generate_scalars_module(
     assert mocked_plugin_manager.plugins[1].generate_scalars_module.called
 
 
+def test_generate_fragments_module_calls_plugins_generate_fragments_module(
+    mocked_plugin_manager,
+):
+    mocked_plugin_manager.generate_fragments_module(
+        ast.Module(), fragments_definitions={}
+    )
+
+    assert mocked_plugin_manager.plugins[0].generate_fragments_module.called
+    assert mocked_plugin_manager.plugins[1].generate_fragments_module.called
+
+
 def test_generate_scalars_parse_dict_calls_plugins_generate_scalars_parse_dict(
     mocked_plugin_manager,
 ):
@@ -276,6 +314,15 @@ def test_generate_result_types_code_calls_plugins_generate_result_types_code(
     assert mocked_plugin_manager.plugins[1].generate_result_types_code.called
 
 
+def test_generate_fragments_code_calls_plugins_generate_fragments_code(
+    mocked_plugin_manager,
+):
+    mocked_plugin_manager.generate_fragments_code("")
+
+    assert mocked_plugin_manager.plugins[0].generate_fragments_code.called
+    assert mocked_plugin_manager.plugins[1].generate_fragments_code.called
+
+
 def test_copy_code_calls_plugins_copy_code(mocked_plugin_manager):
     mocked_plugin_manager.copy_code("")
 
@@ -297,3 +344,163 @@ def test_generate_init_code_calls_plugins_generate_init_code(mocked_plugin_manag
 
     assert mocked_plugin_manager.plugins[0].generate_init_code.called
     assert mocked_plugin_manager.plugins[1].generate_init_code.called
+
+
+def test_plugins_hooks_are_recorded_by_profiler():
+    class TestPlugin(Plugin):
+        def generate_client_code(self, generated_code: str) -> str:
+            return generated_code
+
+    profiler = Profiler(measure_memory=False)
+    manager = PluginManager(
+        schema=GraphQLSchema(), plugins_types=[TestPlugin], profiler=profiler
+    )
+
+    manager.generate_client_code("")
+    manager.generate_client_code("")
+
+    assert [s.name for s in profiler.stages.values()] == ["plugin", "plugin_hook"]
+    stats = list(profiler.stages.values())[1]
+    assert stats.name == "plugin_hook"
+    assert stats.details == {"hook": "generate_client_code"}
+    assert stats.count == 2
+
+
+def test_hooks_contain_only_methods_overriding_default_hooks():
+    class PluginA(Plugin):
+        def generate_client_code(self, generated_code: str) -> str:
+            return generated_code + "a"
+
+    class PluginB(Plugin):
+        pass
+
+    class PluginC(PluginA):
+        def generate_enums_code(self, generated_code: str) -> str:
+            return generated_code + "c"
+
+    manager = PluginManager(
+        schema=GraphQLSchema(), plugins_types=[PluginA, PluginB, PluginC]
+    )
+
+    assert manager.hooks["generate_client_code"] == [
+        manager.plugins[0].generate_client_code,
+        manager.plugins[2].generate_client_code,
+    ]
+    assert manager.hooks["generate_enums_code"] == [
+        manager.plugins[2].generate_enums_code
+    ]
+    assert not manager.hooks["generate_result_field"]
+    assert manager.generate_client_code("") == "aa"
+
+
+def test_hook_without_overrides_returns_object_without_profiling():
+    class TestPlugin(Plugin):
+        pass
+
+    profiler = Profiler(measure_memory=False)
+    manager = PluginManager(
+        schema=GraphQLSchema(), plugins_types=[TestPlugin], profiler=profiler
+    )
+    module = ast.Module(body=[], type_ignores=[])
+
+    assert manager.generate_init_module(module) is module
+    assert not profiler.stages
+
+
+def test_get_plugins_stats_returns_stats_of_every_plugin_hook():
+    class PluginA(Plugin):
+        def generate_client_code(self, generated_code: str) -> str:
+            return generated_code + "a"
+
+        def generate_enums_code(self, generated_code: str) -> str:
+            return generated_code
+
+    class PluginB(Plugin):
+        def generate_client_code(self, generated_code: str) -> str:
+            return generated_code + "b"
+
+    profiler = Profiler(measure_memory=False)
+    manager = PluginManager(
+        schema=GraphQLSchema(), plugins_types=[PluginA, PluginB], profiler=profiler
+    )
+
+    assert manager.generate_client_code("") == "ab"
+    manager.generate_client_code("")
+    manager.generate_enums_code("")
+
+    result = manager.get_plugins_stats()
+
+    plugin_a_name = f"{__name__}.{PluginA.__qualname__}"
+    plugin_b_name = f"{__name__}.{PluginB.__qualname__}"
+    assert list(result) == [plugin_a_name, plugin_b_name]
+    assert {hook: stats.count for hook, stats in result[plugin_a_name].items()} == {
+        "generate_client_code": 2,
+        "generate_enums_code": 1,
+    }
+    assert {hook: stats.count for hook, stats in result[plugin_b_name].items()} == {
+        "generate_client_code": 2
+    }
+    assert result[plugin_b_name]["generate_client_code"].time > 0
+
+
+def test_get_plugins_stats_returns_empty_dict_without_profiler():
+    class TestPlugin(Plugin):
+        def generate_client_code(self, generated_code: str) -> str:
+            return generated_code
+
+    manager = PluginManager(schema=GraphQLSchema(), plugins_types=[TestPlugin])
+    manager.generate_client_code("")
+
+    assert not manager.get_plugins_stats()
+
+
+def test_are_hooks_pure_checks_only_plugins_overriding_given_hooks():
+    manager = PluginManager(
+        schema=GraphQLSchema(),
+        plugins_types=[PureResultFieldPlugin, ResultFieldPlugin, PureClientCodePlugin],
+    )
+
+    assert manager.are_hooks_pure(["generate_client_code"])
+    assert not manager.are_hooks_pure(["generate_result_field"])
+    assert manager.are_hooks_pure(["generate_enums_code"])
+
+
+def test_get_pool_plugin_manager_returns_picklable_manager_with_overriding_plugins():
+    schema = GraphQLSchema(
+        query=GraphQLObjectType("Query", fields={"a": GraphQLField(GraphQLString)})
+    )
+    profiler = Profiler(measure_memory=False)
+    manager = PluginManager(
+        schema=schema,
+        config_dict={"key": "value"},
+        plugins_types=[PureClientCodePlugin, PureResultFieldPlugin],
+        profiler=profiler,
+    )
+
+    pool_manager = manager.get_pool_plugin_manager(["generate_result_field"])
+
+    assert pool_manager
+    assert pool_manager.plugins == [manager.plugins[1]]
+    assert pool_manager.profiler is None
+    unpickled = pickle.loads(pickle.dumps(pool_manager))
+    assert isinstance(unpickled.plugins[0], PureResultFieldPlugin)
+    assert unpickled.plugins[0].config_dict == {"key": "value"}
+    assert unpickled.plugins[0].schema is None
+    assert unpickled.hooks["generate_result_field"] == [
+        unpickled.plugins[0].generate_result_field
+    ]
+
+
+def test_get_pool_plugin_manager_returns_none_for_not_pure_plugins():
+    manager = PluginManager(
+        schema=GraphQLSchema(),
+        plugins_types=[PureResultFieldPlugin, ResultFieldPlugin],
+    )
+
+    assert manager.get_pool_plugin_manager(["generate_result_field"]) is None
+
+
+def test_get_pool_plugin_manager_returns_none_for_not_picklable_plugins():
+    manager = PluginManager(schema=GraphQLSchema(), plugins_types=[NotPicklablePlugin])
+
+    assert manager.get_pool_plugin_manager(["generate_result_field"]) is None
@@ -0,0 +1,71 @@
+from graphql import build_schema, parse, validate
+
+from ariadne_codegen.utils import Formatter
+from benchmarks.run import compare_with_baseline, run_benchmark
+from benchmarks.synthetic import generate_corpus
+
+
+def test_generate_corpus_is_deterministic():
+    assert generate_corpus(100, seed=1) == generate_corpus(100, seed=1)
+    assert generate_corpus(100, seed=1) != generate_corpus(100, seed=2)
+
+
+def test_generate_corpus_returns_valid_schema_and_operations():
+    corpus = generate_corpus(100)
+
+    schema = build_schema(corpus.schema_str)
+    document = parse(corpus.queries_str)
+
+    assert not validate(schema, document)
+    assert len(schema.type_map) >= 100
+    assert corpus.operations_count == len(
+        [d for d in document.definitions if d.kind == "operation_definition"]
+    )
+
+
+def test_run_benchmark_returns_results_of_every_stage():
+    result = run_benchmark(50, Formatter.NATIVE, measure_memory=True)
+
+    assert result["types_count"] == 50
+    assert set(result["stages"]) == {
+        "schema_parsing",
+        "schema_building",
+        "schema_validation",
+        "queries_parsing",
+        "enums",
+        "input_types",
+        "result_types",
+        "ast_to_str",
+        "package",
+    }
+    assert result["stages"]["package"]["peak_memory"] > 0
+
+
+def test_compare_with_baseline_returns_only_significant_regressions():
+    baseline = {
+        "results": {
+            "100": {
+                "stages": {
+                    "a": {"time": 1.0, "peak_memory": 100},
+                    "b": {"time": 1.0, "peak_memory": 100},
+                    "c": {"time": 0.01, "peak_memory": 100},
+                }
+            }
+        }
+    }
+    results = {
+        "results": {
+            "100": {
+                "stages": {
+                    "a": {"time": 2.0, "peak_memory": 100},
+                    "b": {"time": 1.1, "peak_memory": 150},
+                    "c": {"time": 0.03, "peak_memory": 100},
+                }
+            }
+        }
+    }
+
+    regressions = compare_with_baseline(results, baseline, tolerance=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("100 types, a, time")
@@ -0,0 +1,144 @@
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+MAIN_PATH = Path(__file__).parent / "main"
+
+FORMATTERS_MODULES = {"black", "isort", "autoflake"}
+
+# Script running CLI like ariadne-codegen entry point does and then printing
+# names of all modules imported by the process.
+CLI_SCRIPT = """
+import sys
+from ariadne_codegen.main import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+sys.stderr.write("\\nMODULES " + " ".join(sys.modules) + "\\n")
+"""
+
+# CLI arguments, project to run in, modules which cannot be imported and budget
+# of cumulative import time, in microseconds, measured with -X importtime.
+# Budgets are about 1.7 times typical times measured on a single CPU, they
+# depend on machine, so checking them is opt-in with `pytest -m import_time`.
+CLI_PATHS = {
+    "version": (
+        ["--version"],
+        None,
+        {"graphql", "httpx", "pydantic", *FORMATTERS_MODULES},
+        120_000,
+    ),
+    "graphqlschema": (
+        ["graphqlschema"],
+        "graphql_schemas/example",
+        {"httpx", "ariadne_codegen.client_generators.package", *FORMATTERS_MODULES},
+        280_000,
+    ),
+    "client": (
+        [],
+        "clients/example",
+        {
+            "httpx",
+            "ariadne_codegen.graphql_schema_generators.schema",
+            *FORMATTERS_MODULES,
+        },
+        340_000,
+    ),
+}
+
+
+def get_top_level_imports_times(importtime_output):
+    """Return cumulative import times of modules not imported by other modules."""
+    times = {}
+    for line in importtime_output.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2][1:]
+        if not name.startswith(" "):
+            times[name] = int(parts[1])
+    return times
+
+
+@lru_cache(maxsize=None)
+def get_startup_modules():
+    """Return names of modules imported by interpreter before running any code."""
+    return set(
+        get_top_level_imports_times(
+            subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", "pass"],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stderr
+        )
+    )
+
+
+def run_cli_in_subprocess(args, cwd):
+    """Return import time of modules imported by CLI and their names."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CLI_SCRIPT, *args],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=cwd,
+    )
+    import_time = sum(
+        time
+        for name, time in get_top_level_imports_times(result.stderr).items()
+        if name not in get_startup_modules()
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("MODULES "):
+            modules = set(line.split()[1:])
+    return import_time, modules
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    def copy_project(project):
+        if not project:
+            return tmp_path
+        project_path = tmp_path / project
+        project_path.mkdir(parents=True)
+        for file_path in MAIN_PATH.joinpath(project).iterdir():
+            if file_path.is_file():
+                project_path.joinpath(file_path.name).write_text(file_path.read_text())
+        config_path = project_path / "pyproject.toml"
+        config_path.write_text(
+            config_path.read_text().replace(
+                "[tool.ariadne-codegen]",
+                '[tool.ariadne-codegen]\nformatter = "native"',
+            )
+        )
+        return project_path
+
+    return copy_project
+
+
+@pytest.mark.parametrize("cli_path", CLI_PATHS)
+def test_cli_path_does_not_import_modules_it_does_not_need(project_path, cli_path):
+    args, project, not_needed_modules, _ = CLI_PATHS[cli_path]
+
+    _, modules = run_cli_in_subprocess(args, project_path(project))
+
+    imported_modules = modules | {name.split(".")[0] for name in modules}
+    assert not imported_modules.intersection(not_needed_modules)
+
+
+@pytest.mark.import_time
+@pytest.mark.parametrize("cli_path", CLI_PATHS)
+def test_cli_path_import_time_is_within_budget(project_path, cli_path):
+    args, project, _, budget = CLI_PATHS[cli_path]
+    cwd = project_path(project)
+
+    # The fastest of few runs is compared, to not fail on momentary load.
+    import_time = min(run_cli_in_subprocess(args, cwd)[0] for _ in range(5))
+
+    assert import_time <= budget
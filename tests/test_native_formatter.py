@@ -0,0 +1,285 @@
+import ast
+from textwrap import dedent
+
+from graphql import build_ast_schema, parse
+
+from ariadne_codegen import native_formatter
+from ariadne_codegen.client_generators.package import PackageGenerator
+from ariadne_codegen.codegen import generate_multiline_constant
+from ariadne_codegen.native_formatter import (
+    format_module,
+    format_multiline_string,
+    unparse,
+    wrap_line,
+)
+from ariadne_codegen.stdlib_modules import STDLIB_MODULES_NAMES
+from ariadne_codegen.utils import Formatter
+
+
+def test_format_module_merges_sorts_and_groups_imports():
+    source = """
+    from .enums import B
+    from pydantic import Field
+    from typing import Optional
+    from .enums import A
+    import os
+    from typing import List, Optional
+    x: Optional[List[A]] = Field(B, default=os.sep)
+    """
+    expected = """\
+    import os
+    from typing import List, Optional
+
+    from pydantic import Field
+
+    from .enums import A, B
+    x: Optional[List[A]] = Field(B, default=os.sep)
+    """
+
+    result = format_module(ast.parse(dedent(source)))
+
+    assert result == dedent(expected)
+
+
+def test_format_module_removes_unused_imports():
+    source = """
+    from typing import Any, List, Optional, Union
+    from pydantic import Field
+    from .base_model import BaseModel
+    class A(BaseModel):
+        b: Optional["B"]
+    """
+    expected = """\
+    from typing import Optional
+
+    from .base_model import BaseModel
+
+
+    class A(BaseModel):
+        b: Optional['B']
+    """
+
+    result = format_module(ast.parse(dedent(source)))
+
+    assert result == dedent(expected)
+
+
+def test_format_module_keeps_unused_imports_if_remove_unused_imports_is_false():
+    source = """
+    from .client import Client
+    from .client import Client
+    """
+    expected = "from .client import Client\n"
+
+    result = format_module(ast.parse(dedent(source)), remove_unused_imports=False)
+
+    assert result == expected
+
+
+def test_format_module_separates_definitions_with_two_blank_lines():
+    source = """
+    class A:
+        pass
+    class B:
+        pass
+    A.update_forward_refs()
+    B.update_forward_refs()
+    """
+    expected = """\
+    class A:
+        pass
+
+
+    class B:
+        pass
+
+
+    A.update_forward_refs()
+    B.update_forward_refs()
+    """
+
+    result = format_module(ast.parse(dedent(source)))
+
+    assert result == dedent(expected)
+
+
+def test_format_module_splits_long_import_into_multiple_lines():
+    names = [f"VeryLongClassName{i}" for i in range(5)]
+    module = ast.Module(
+        body=[
+            ast.ImportFrom(
+                module="types", names=[ast.alias(name=n) for n in names], level=1
+            )
+        ],
+        type_ignores=[],
+    )
+    expected = "from .types import (\n" + "".join(f"    {n},\n" for n in names) + ")\n"
+
+    result = format_module(module, remove_unused_imports=False)
+
+    assert result == expected
+
+
+def test_format_module_groups_imports_using_fallback_stdlib_modules_names(
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        native_formatter, "STDLIB_MODULES_NAMES", set(STDLIB_MODULES_NAMES)
+    )
+    source = """
+    from pydantic import Field
+    from typing import Optional
+    x: Optional[int] = Field()
+    """
+    expected = """\
+    from typing import Optional
+
+    from pydantic import Field
+    x: Optional[int] = Field()
+    """
+
+    result = format_module(ast.parse(dedent(source)))
+
+    assert result == dedent(expected)
+
+
+def test_format_module_wraps_long_list_with_one_item_per_line():
+    names = [f"VeryLongClassName{i}" for i in range(5)]
+    module = ast.parse(f"__all__ = {names!r}")
+    expected = "__all__ = [\n" + "".join(f"    {n!r},\n" for n in names) + "]\n"
+
+    result = format_module(module)
+
+    assert result == expected
+
+
+def test_format_module_wraps_long_call_and_keeps_docstring_untouched():
+    docstring = "Docstring " * 10
+    source = f"""
+    class A(BaseModel):
+        \"\"\"
+        {docstring}
+        \"\"\"
+        value: Optional[str] = Field(alias="veryLongAliasOfValueField", default=None, description="value")
+    """
+    expected = f"""\
+    class A(BaseModel):
+        \"\"\"
+        {docstring}
+        \"\"\"
+        value: Optional[str] = Field(
+            alias='veryLongAliasOfValueField', default=None, description='value'
+        )
+    """
+
+    result = format_module(ast.parse(dedent(source)))
+
+    assert result == dedent(expected)
+
+
+def test_wrap_line_splits_earlier_brackets_if_part_before_last_ones_is_too_long():
+    types = ", ".join(f'"VeryLongTypeNameNumber{i}"' for i in range(3))
+    line = f"    field: Union[{types}] = Field(alias='field')"
+
+    result = wrap_line(line)
+
+    assert result == [
+        "    field: Union[",
+        f"        {types}",
+        "    ] = Field(alias='field')",
+    ]
+
+
+def test_wrap_line_splits_nested_items_and_keeps_single_item_tuple_comma():
+    arguments = ", ".join(f"argument_{i}" for i in range(12))
+    line = f"x = call(({arguments},), other(argument,))"
+
+    result = wrap_line(line)
+
+    assert result == [
+        "x = call(",
+        "    (",
+        *[f"        argument_{i}," for i in range(12)],
+        "    ),",
+        "    other(argument,),",
+        ")",
+    ]
+    assert ast.dump(ast.parse("\n".join(result))) == ast.dump(ast.parse(line))
+
+
+def test_wrap_line_adds_parentheses_to_long_import():
+    names = [f"VeryLongClassName{i}" for i in range(5)]
+    line = "    from .types import " + ", ".join(names)
+
+    result = wrap_line(line)
+
+    assert result == [
+        "    from .types import (",
+        *[f"        {name}," for name in names],
+        "    )",
+    ]
+
+
+def test_unparse_writes_marked_constant_as_indented_multiline_string():
+    function_def = ast.parse("def a():\n    query = gql(QUERY)").body[0]
+    function_def.body[0].value.args = [generate_multiline_constant("a {\n  b\n}\n")]
+
+    result = unparse(function_def)
+
+    assert result == dedent(
+        '''\
+        def a():
+            query = gql("""
+                a {
+                  b
+                }
+                """)'''
+    )
+    assert ast.unparse(function_def) == "def a():\n    query = gql('a {\\n  b\\n}\\n')"
+
+
+def test_unparse_adds_spaces_around_defaults_of_annotated_arguments():
+    source = "def a(b: int=1, c=2, *, d: Callable=lambda e=3: e, **f) -> int:\n    pass"
+
+    result = unparse(ast.parse(source).body[0])
+
+    assert result == (
+        "def a(b: int = 1, c=2, *, d: Callable = lambda e=3: e, **f) -> int:\n"
+        "    pass"
+    )
+
+
+def test_native_formatter_writes_client_method_signature_like_black(tmp_path):
+    schema_str = """
+    type Query {
+        users(country: String, limit: Int!): [String!]!
+    }
+    """
+    query_str = """
+    query GetUsers($country: String, $limit: Int!) {
+        users(country: $country, limit: $limit)
+    }
+    """
+    generator = PackageGenerator(
+        "client",
+        tmp_path.as_posix(),
+        build_ast_schema(parse(schema_str)),
+        formatter=Formatter.NATIVE,
+    )
+    generator.add_operation(parse(query_str).definitions[0])
+
+    generator.generate()
+
+    client_content = (tmp_path / "client" / "client.py").read_text()
+    assert (
+        "    async def get_users(self, limit: int, country: Optional[str] = None)"
+        " -> GetUsers:\n"
+    ) in client_content
+
+
+def test_format_multiline_string_returns_literal_evaluating_to_indented_value():
+    value = 'a(text: """x""", other: "y\\\\n"""")\n'
+
+    result = format_multiline_string(value, 4)
+
+    assert ast.literal_eval(result) == "\n    " + value + "    "
@@ -0,0 +1,52 @@
+import json
+
+from ariadne_codegen.profiling import Profiler, profile_stage
+
+
+def test_stage_aggregates_calls_with_the_same_name_and_details():
+    profiler = Profiler(measure_memory=False)
+
+    for file_name in ("a.py", "b.py", "a.py"):
+        with profiler.stage("write_file", file=file_name):
+            pass
+
+    stages = profiler.get_report()["stages"]
+    assert [(s["name"], s["details"], s["count"]) for s in stages] == [
+        ("write_file", {"file": "a.py"}, 2),
+        ("write_file", {"file": "b.py"}, 1),
+    ]
+
+
+def test_stage_records_memory_peak_including_nested_stages():
+    profiler = Profiler()
+    profiler.start()
+
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            data = bytearray(4 * 1024 * 1024)
+            del data
+        data = bytearray(1024)
+    profiler.stop()
+
+    stages = {s["name"]: s for s in profiler.get_report()["stages"]}
+    assert stages["inner"]["peak_memory"] >= 4 * 1024 * 1024
+    assert stages["outer"]["peak_memory"] >= stages["inner"]["peak_memory"]
+
+
+def test_get_report_json_returns_total_time_and_stages():
+    profiler = Profiler(measure_memory=False)
+    profiler.start()
+    with profiler.stage("config_load"):
+        pass
+    profiler.stop()
+
+    report = json.loads(profiler.get_report_json())
+
+    assert report["total_time"] >= 0
+    assert report["stages"][0]["name"] == "config_load"
+    assert "config_load" in profiler.format_report()
+
+
+def test_profile_stage_without_profiler_does_nothing():
+    with profile_stage(None, "stage", file="a.py"):
+        pass
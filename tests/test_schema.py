@@ -1,14 +1,36 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
 import httpx
 import pytest
-from graphql import GraphQLSchema, OperationDefinitionNode
+from graphql import (
+    GraphQLSchema,
+    OperationDefinitionNode,
+    build_schema,
+    introspection_from_schema,
+    parse,
+    print_schema,
+)
 
-from ariadne_codegen.exceptions import IntrospectionError, InvalidGraphqlSyntax
+from ariadne_codegen.exceptions import (
+    IntrospectionError,
+    InvalidConfiguration,
+    InvalidGraphqlSyntax,
+)
 from ariadne_codegen.schema import (
     get_graphql_queries,
+    get_graphql_schema_from_object,
     get_graphql_schema_from_path,
     introspect_remote_schema,
-    load_graphql_files_from_path,
-    read_graphql_file,
+    load_graphql_documents_from_path,
+    matches_any_pattern,
+    merge_documents,
+    parse_graphql_file,
+    read_graphql_source,
     walk_graphql_files,
 )
 
@@ -81,6 +103,10 @@ INCORRECT_QUERY = """
     }
 """
 
+INTROSPECTION_RESPONSE_PATH = (
+    Path(__file__).parent / "main" / "clients" / "remote_schema" / "response.json"
+)
+
 FIRST_QUERY_FILENAME = "query1.graphql"
 SECOND_QUERY_FILENAME = "query2.graphql"
 
@@ -126,6 +152,50 @@ def path_fixture(request):
     return request.getfixturevalue(request.param)
 
 
+class IntrospectionServer(HTTPServer):
+    def __init__(self, etag=None):
+        super().__init__(("127.0.0.1", 0), IntrospectionRequestHandler)
+        self.etag = etag
+        self.content = INTROSPECTION_RESPONSE_PATH.read_bytes()
+        self.requests_headers = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/graphql/"
+
+
+class IntrospectionRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests_headers.append(dict(self.headers))
+        if self.server.etag and self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.server.content)))
+        if self.server.etag:
+            self.send_header("ETag", self.server.etag)
+        self.end_headers()
+        self.wfile.write(self.server.content)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def introspection_server(request):
+    server = IntrospectionServer(etag=getattr(request, "param", None))
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def single_file_query(tmp_path_factory):
     file_ = tmp_path_factory.mktemp("queries").joinpath(FIRST_QUERY_FILENAME)
@@ -150,18 +220,6 @@ def queries_directory(tmp_path_factory):
     return schemas_dir
 
 
-def test_read_graphql_file_returns_content_of_file(single_file_schema):
-    assert read_graphql_file(single_file_schema) == FIRST_SCHEMA
-
-
-def test_read_graphql_file_with_invalid_file_raises_invalid_graphql_syntax_exception(
-    incorrect_schema_file,
-):
-    with pytest.raises(InvalidGraphqlSyntax) as exc:
-        read_graphql_file(incorrect_schema_file)
-    assert str(incorrect_schema_file) in str(exc)
-
-
 def test_walk_graphql_files_returns_graphql_files_from_directory(schemas_directory):
     assert sorted(f.name for f in walk_graphql_files(schemas_directory)) == sorted(
         [FIRST_FILENAME, SECOND_FILENAME]
@@ -176,27 +234,237 @@ def test_walk_graphql_files_returns_graphql_files_from_nested_directory(
     ) == sorted([FIRST_FILENAME, SECOND_FILENAME])
 
 
-def test_load_graphql_files_from_path_returns_schema_from_single_file(
+def test_walk_graphql_files_skips_files_and_directories_matching_exclude_patterns(
+    schemas_nested_directories, mocker
+):
+    skipped_dir = schemas_nested_directories / "node_modules"
+    skipped_dir.mkdir()
+    skipped_dir.joinpath("skipped.graphql").write_text(FIRST_SCHEMA)
+    schemas_nested_directories.joinpath("skipped.gql").write_text(FIRST_SCHEMA)
+    walked_dirs = []
+    walk = os.walk
+
+    def walk_and_record(*args, **kwargs):
+        for dir_path, dir_names, file_names in walk(*args, **kwargs):
+            walked_dirs.append(Path(dir_path))
+            yield dir_path, dir_names, file_names
+
+    mocker.patch("ariadne_codegen.schema.os.walk", side_effect=walk_and_record)
+
+    result = walk_graphql_files(
+        schemas_nested_directories, exclude=["**/node_modules", "*.gql"]
+    )
+
+    assert sorted(f.name for f in result) == sorted([FIRST_FILENAME, SECOND_FILENAME])
+    assert schemas_nested_directories / "nested" in walked_dirs
+    assert skipped_dir not in walked_dirs
+
+
+def test_walk_graphql_files_returns_only_files_matching_include_patterns(
+    schemas_nested_directories,
+):
+    result = walk_graphql_files(schemas_nested_directories, include=["nested/*"])
+
+    assert [f.name for f in result] == [SECOND_FILENAME]
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected",
+    [
+        ("src/**/*.graphql", "src/a.graphql", True),
+        ("src/**/*.graphql", "src/nested/deeper/a.graphql", True),
+        ("**/*.graphql", "a.graphql", True),
+        ("src/**/**/a.graphql", "src/a.graphql", True),
+        ("src/**/*.graphql", "other/a.graphql", False),
+        ("src**/*.graphql", "src.graphql", False),
+    ],
+)
+def test_matches_any_pattern_matches_zero_or_more_directories_with_globstar(
+    pattern, path, expected
+):
+    assert matches_any_pattern(Path(path), [pattern]) is expected
+
+
+def test_walk_graphql_files_skips_files_matching_both_include_and_exclude_patterns(
+    schemas_nested_directories,
+):
+    result = walk_graphql_files(
+        schemas_nested_directories,
+        include=["**/*.graphql"],
+        exclude=["nested/**/*.graphql"],
+    )
+
+    assert [f.name for f in result] == [FIRST_FILENAME]
+
+
+def test_parse_graphql_file_returns_document_with_file_path_as_source_name(
     single_file_schema,
 ):
-    assert load_graphql_files_from_path(single_file_schema) == FIRST_SCHEMA
+    document = parse_graphql_file(single_file_schema)
+
+    assert len(document.definitions) == 2
+    assert document.loc.source.name == single_file_schema.as_posix()
 
 
-def test_load_graphql_files_from_path_returns_schema_from_directory(
+def test_parse_graphql_file_with_invalid_file_raises_invalid_graphql_syntax_exception(
+    incorrect_schema_file,
+):
+    with pytest.raises(InvalidGraphqlSyntax) as exc:
+        parse_graphql_file(incorrect_schema_file)
+    assert str(incorrect_schema_file) in str(exc)
+
+
+def test_load_graphql_documents_from_path_returns_document_for_every_file(
+    schemas_nested_directories,
+):
+    documents = load_graphql_documents_from_path(schemas_nested_directories)
+
+    assert [Path(d.loc.source.name).name for d in documents] == [
+        FIRST_FILENAME,
+        SECOND_FILENAME,
+    ]
+
+
+def test_load_graphql_documents_from_path_with_jobs_keeps_order_of_files(
+    schemas_nested_directories,
+):
+    documents = load_graphql_documents_from_path(schemas_nested_directories, jobs=2)
+
+    assert [Path(d.loc.source.name).name for d in documents] == [
+        FIRST_FILENAME,
+        SECOND_FILENAME,
+    ]
+
+
+def test_load_graphql_documents_from_path_with_jobs_parses_files_read_by_threads(
+    schemas_nested_directories, mocker
+):
+    threads = {"read": set(), "parse": set()}
+
+    def record_thread(stage, function):
+        def wrapper(*args):
+            threads[stage].add(threading.get_ident())
+            return function(*args)
+
+        return wrapper
+
+    mocker.patch(
+        "ariadne_codegen.schema.read_graphql_source",
+        record_thread("read", read_graphql_source),
+    )
+    mocker.patch("ariadne_codegen.schema.parse", record_thread("parse", parse))
+
+    documents = load_graphql_documents_from_path(schemas_nested_directories, jobs=2)
+
+    assert len(documents) == 2
+    assert threads["parse"] == {threading.get_ident()}
+    assert threading.get_ident() not in threads["read"]
+
+
+def test_merge_documents_returns_document_with_definitions_from_all_documents(
     schemas_directory,
 ):
-    assert load_graphql_files_from_path(schemas_directory) == "\n".join(
-        [FIRST_SCHEMA, SECOND_SCHEMA]
+    documents = load_graphql_documents_from_path(schemas_directory)
+
+    document = merge_documents(documents)
+
+    assert document.definitions == (documents[0].definitions + documents[1].definitions)
+
+
+def test_get_graphql_schema_from_path_parses_every_file_once(mocker, schemas_directory):
+    mocked_parse = mocker.patch("ariadne_codegen.schema.parse", side_effect=parse)
+
+    get_graphql_schema_from_path(schemas_directory.as_posix())
+
+    assert mocked_parse.call_count == 2
+
+
+def test_get_graphql_schema_from_path_with_cache_path_reuses_cached_schema(
+    mocker, tmp_path, schemas_directory
+):
+    cache_path = tmp_path / "cache" / "schema.pickle"
+    schema = get_graphql_schema_from_path(
+        schemas_directory.as_posix(), cache_path=cache_path.as_posix()
     )
+    mocked_parse = mocker.patch("ariadne_codegen.schema.parse", side_effect=parse)
+    mocked_validation = mocker.patch("ariadne_codegen.schema.assert_valid_schema")
 
+    cached_schema = get_graphql_schema_from_path(
+        schemas_directory.as_posix(), cache_path=cache_path.as_posix()
+    )
 
-def test_load_graphql_files_from_path_returns_schema_from_nested_directory(
-    schemas_nested_directories,
+    assert cache_path.is_file()
+    assert not mocked_parse.called
+    assert not mocked_validation.called
+    assert print_schema(cached_schema) == print_schema(schema)
+
+
+def test_get_graphql_schema_from_path_with_cache_path_detects_changed_file(
+    tmp_path, schemas_directory
 ):
-    assert load_graphql_files_from_path(schemas_nested_directories) == "\n".join(
-        [FIRST_SCHEMA, SECOND_SCHEMA]
+    cache_path = tmp_path / "schema.pickle"
+    get_graphql_schema_from_path(
+        schemas_directory.as_posix(), cache_path=cache_path.as_posix()
+    )
+    schemas_directory.joinpath(SECOND_FILENAME).write_text(
+        SECOND_SCHEMA.replace("name: String", "name: String\n        age: Int"),
+        encoding="utf-8",
+    )
+
+    schema = get_graphql_schema_from_path(
+        schemas_directory.as_posix(), cache_path=cache_path.as_posix()
     )
 
+    assert "age" in schema.type_map["User"].fields
+
+
+def test_get_graphql_schema_from_path_with_invalid_cache_file_builds_schema(
+    tmp_path, single_file_schema
+):
+    cache_path = tmp_path / "schema.pickle"
+    cache_path.write_bytes(b"invalid")
+
+    schema = get_graphql_schema_from_path(
+        single_file_schema.as_posix(), cache_path=cache_path.as_posix()
+    )
+
+    assert "Custom" in schema.type_map
+
+
+@pytest.mark.parametrize("wrap_in_response", [False, True])
+def test_get_graphql_schema_from_path_builds_schema_from_introspection_json_file(
+    tmp_path, wrap_in_response
+):
+    introspection = introspection_from_schema(build_schema(FIRST_SCHEMA))
+    json_path = tmp_path / "schema.json"
+    json_path.write_text(
+        json.dumps({"data": introspection} if wrap_in_response else introspection),
+        encoding="utf-8",
+    )
+
+    schema = get_graphql_schema_from_path(json_path.as_posix())
+
+    assert print_schema(schema) == print_schema(build_schema(FIRST_SCHEMA))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "invalid json",
+        "[]",
+        json.dumps({"data": None, "errors": [{"message": "Error"}]}),
+        json.dumps({"__schema": {"types": []}}),
+    ],
+)
+def test_get_graphql_schema_from_path_raises_introspection_error_for_invalid_json_file(
+    tmp_path, content
+):
+    json_path = tmp_path / "schema.json"
+    json_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(IntrospectionError):
+        get_graphql_schema_from_path(json_path.as_posix())
+
 
 @pytest.mark.parametrize(
     "path_fixture",
@@ -219,9 +487,7 @@ def test_get_graphql_schema_with_invalid_schema_raises_invalid_graphql_syntax_ex
 def test_introspect_remote_schema_called_with_invalid_url_raises_introspection_error(
     mocker,
 ):
-    mocker.patch(
-        "ariadne_codegen.schema.httpx.post", side_effect=httpx.InvalidURL("msg")
-    )
+    mocker.patch("httpx.post", side_effect=httpx.InvalidURL("msg"))
 
     with pytest.raises(IntrospectionError):
         introspect_remote_schema("invalid_url")
@@ -231,7 +497,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_not_success_res
     mocker,
 ):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(status_code=400),
     )
 
@@ -245,7 +511,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_not_json_respon
     mocker,
 ):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(status_code=200, content="invalid_json"),
     )
 
@@ -257,7 +523,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_not_dict_respon
     mocker,
 ):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(status_code=200, content="[]"),
     )
 
@@ -269,7 +535,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_json_without_da
     mocker,
 ):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(status_code=200, content='{"not_data": null}'),
     )
 
@@ -279,7 +545,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_json_without_da
 
 def test_introspect_remote_schema_raises_introspection_error_for_graphql_errors(mocker):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(
             status_code=200,
             content="""
@@ -305,7 +571,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_invalid_data_va
     mocker,
 ):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(
             status_code=200,
             content='{"data": []}',
@@ -318,7 +584,7 @@ def test_introspect_remote_schema_raises_introspection_error_for_invalid_data_va
 
 def test_introspect_remote_schema_returns_introspection_result(mocker):
     mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(
             status_code=200,
             content='{"data": {"__schema": {}}}',
@@ -332,7 +598,7 @@ def test_introspect_remote_schema_returns_introspection_result(mocker):
 
 def test_introspect_remote_schema_uses_provided_headers(mocker):
     mocked_post = mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(
             status_code=200,
             content='{"data": {"__schema": {}}}',
@@ -348,7 +614,7 @@ def test_introspect_remote_schema_uses_provided_headers(mocker):
 @pytest.mark.parametrize("verify_ssl", [True, False])
 def test_introspect_remote_schema_uses_provided_verify_ssl_flag(verify_ssl, mocker):
     mocked_post = mocker.patch(
-        "ariadne_codegen.schema.httpx.post",
+        "httpx.post",
         return_value=httpx.Response(
             status_code=200, content='{"data": {"__schema": {}}}'
         ),
@@ -388,3 +654,177 @@ def test_get_graphql_queries_with_invalid_file_raises_invalid_graphql_syntax_exc
 ):
     with pytest.raises(InvalidGraphqlSyntax):
         get_graphql_queries(incorrect_file_query.as_posix())
+
+
+def test_introspect_remote_schema_with_cache_path_saves_result_in_cache(
+    tmp_path, introspection_server
+):
+    cache_path = tmp_path / "introspection.json"
+
+    result = introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix()
+    )
+
+    cached = json.loads(cache_path.read_text())
+    assert cached["data"] == result
+    assert cached["url"] == introspection_server.url
+    assert cached["data_hash"]
+    assert cached["fetched_at"]
+
+
+def test_introspect_remote_schema_uses_cached_result_within_ttl(
+    tmp_path, introspection_server
+):
+    cache_path = tmp_path / "introspection.json"
+    result = introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix(), cache_ttl=60
+    )
+
+    cached_result = introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix(), cache_ttl=60
+    )
+
+    assert cached_result == result
+    assert len(introspection_server.requests_headers) == 1
+
+
+def test_introspect_remote_schema_doesnt_use_cached_result_for_different_headers(
+    tmp_path, introspection_server
+):
+    cache_path = tmp_path / "introspection.json"
+    introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix(), cache_ttl=60
+    )
+
+    introspect_remote_schema(
+        introspection_server.url,
+        headers={"Authorization": "Bearer token"},
+        cache_path=cache_path.as_posix(),
+        cache_ttl=60,
+    )
+
+    assert len(introspection_server.requests_headers) == 2
+    assert "Bearer token" not in cache_path.read_text()
+
+
+@pytest.mark.parametrize("introspection_server", ['"v1"'], indirect=True)
+def test_introspect_remote_schema_sends_conditional_request_with_cached_etag(
+    tmp_path, introspection_server
+):
+    cache_path = tmp_path / "introspection.json"
+    result = introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix()
+    )
+    introspection_server.content = b"not used"
+
+    cached_result = introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix()
+    )
+
+    assert cached_result == result
+    first_headers, second_headers = introspection_server.requests_headers
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize("introspection_server", ['"v1"'], indirect=True)
+def test_introspect_remote_schema_fetches_full_result_when_etag_changes(
+    tmp_path, introspection_server
+):
+    cache_path = tmp_path / "introspection.json"
+    introspect_remote_schema(introspection_server.url, cache_path=cache_path.as_posix())
+    introspection_server.etag = '"v2"'
+    introspection_server.content = json.dumps({"data": {"changed": True}}).encode()
+
+    result = introspect_remote_schema(
+        introspection_server.url, cache_path=cache_path.as_posix()
+    )
+
+    assert result == {"changed": True}
+    assert json.loads(cache_path.read_text())["etag"] == '"v2"'
+
+
+@pytest.fixture
+def schema_module(tmp_path, monkeypatch):
+    package_dir = tmp_path / "test_schema_object_package"
+    package_dir.mkdir()
+    package_dir.joinpath("__init__.py").touch()
+    package_dir.joinpath("schema.py").write_text(
+        "from graphql import build_schema\n"
+        f"schema = build_schema({FIRST_SCHEMA!r})\n"
+        "class Server:\n"
+        "    schema = schema\n"
+        "not_schema = 'type Query { a: String }'\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(tmp_path.as_posix())
+    yield "test_schema_object_package.schema"
+    for module_name in (
+        "test_schema_object_package",
+        "test_schema_object_package.schema",
+    ):
+        sys.modules.pop(module_name, None)
+
+
+@pytest.mark.parametrize("attributes", ["schema", "Server.schema"])
+def test_get_graphql_schema_from_object_returns_imported_schema(
+    schema_module, attributes
+):
+    schema = get_graphql_schema_from_object(f"{schema_module}:{attributes}")
+
+    assert isinstance(schema, GraphQLSchema)
+    assert schema is get_graphql_schema_from_object(f"{schema_module}:schema")
+    assert "Custom" in schema.type_map
+
+
+def test_get_graphql_schema_from_object_imports_module_from_cwd_and_restores_path(
+    tmp_path, monkeypatch
+):
+    tmp_path.joinpath("cwd_schema_module.py").write_text(
+        f"from graphql import build_schema\nschema = build_schema({FIRST_SCHEMA!r})\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    sys_path = list(sys.path)
+
+    schema = get_graphql_schema_from_object("cwd_schema_module:schema")
+
+    assert "Custom" in schema.type_map
+    assert sys.path == sys_path
+    del sys.modules["cwd_schema_module"]
+
+
+def test_get_graphql_schema_from_object_reloads_module_after_its_file_change(
+    schema_module, tmp_path
+):
+    schema = get_graphql_schema_from_object(f"{schema_module}:schema")
+    module_path = tmp_path / "test_schema_object_package" / "schema.py"
+    stat = module_path.stat()
+    module_path.write_text(
+        "from graphql import build_schema\n"
+        "schema = build_schema('type Query { changed: String }')\n",
+        encoding="utf-8",
+    )
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded_schema = get_graphql_schema_from_object(f"{schema_module}:schema")
+
+    assert reloaded_schema is not schema
+    assert "changed" in reloaded_schema.query_type.fields
+    assert get_graphql_schema_from_object(f"{schema_module}:schema") is (
+        reloaded_schema
+    )
+
+
+@pytest.mark.parametrize(
+    "object_path",
+    [
+        "not_existing_module:schema",
+        "test_schema_object_package.schema:not_existing",
+        "test_schema_object_package.schema:not_schema",
+    ],
+)
+def test_get_graphql_schema_from_object_raises_invalid_configuration(
+    schema_module, object_path  # pylint: disable=unused-argument
+):
+    with pytest.raises(InvalidConfiguration):
+        get_graphql_schema_from_object(object_path)
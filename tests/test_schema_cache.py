@@ -0,0 +1,73 @@
+import pytest
+from graphql import parse, print_ast
+
+from ariadne_codegen.schema_cache import (
+    get_schema_files_hash,
+    load_cached_schema_document,
+    save_schema_document_in_cache,
+)
+
+SCHEMA_STR = """
+type Query {
+    a: Int
+}
+"""
+
+
+def test_save_schema_document_in_cache_saves_document_without_locations(tmp_path):
+    cache_path = tmp_path / "schema.pickle"
+    document = parse(SCHEMA_STR)
+
+    save_schema_document_in_cache(cache_path, "hash", document)
+    cached_document = load_cached_schema_document(cache_path, "hash")
+
+    assert print_ast(cached_document) == print_ast(document)
+    assert cached_document.loc is None
+    assert cached_document.definitions[0].loc is None
+    assert document.loc is not None
+
+
+def test_load_cached_schema_document_returns_none_for_different_hash(tmp_path):
+    cache_path = tmp_path / "schema.pickle"
+    save_schema_document_in_cache(cache_path, "hash", parse(SCHEMA_STR))
+
+    assert load_cached_schema_document(cache_path, "other_hash") is None
+
+
+def test_load_cached_schema_document_doesnt_unpickle_document_for_different_hash(
+    tmp_path, mocker
+):
+    cache_path = tmp_path / "schema.pickle"
+    save_schema_document_in_cache(cache_path, "hash", parse(SCHEMA_STR))
+    mocked_load = mocker.patch("ariadne_codegen.schema_cache.pickle.load")
+
+    load_cached_schema_document(cache_path, "other_hash")
+
+    assert not mocked_load.called
+
+
+@pytest.mark.parametrize(
+    "pickled_document",
+    [b"cnot_existing_module\nDocumentNode\n.", b"cgraphql\nNotExistingNode\n."],
+)
+def test_load_cached_schema_document_returns_none_for_not_importable_document(
+    tmp_path, pickled_document
+):
+    cache_path = tmp_path / "schema.pickle"
+    cache_path.write_bytes(b"hash\n" + pickled_document)
+
+    assert load_cached_schema_document(cache_path, "hash") is None
+
+
+def test_load_cached_schema_document_returns_none_for_missing_file(tmp_path):
+    assert load_cached_schema_document(tmp_path / "schema.pickle", "hash") is None
+
+
+def test_get_schema_files_hash_depends_on_files_content(tmp_path):
+    file_ = tmp_path / "schema.graphql"
+    file_.write_text(SCHEMA_STR)
+    files_hash = get_schema_files_hash([file_])
+
+    file_.write_text(SCHEMA_STR + "scalar A")
+
+    assert get_schema_files_hash([file_]) != files_hash
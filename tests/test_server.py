@@ -0,0 +1,96 @@
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from ariadne_codegen.exceptions import ServerError
+from ariadne_codegen.main import graphql_schema
+from ariadne_codegen.server import CodegenServer, send_job
+
+CLIENTS_PATH = Path(__file__).parent / "main" / "clients"
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return (tmp_path / "s.sock").as_posix()
+
+
+@pytest.fixture
+def server(socket_path):
+    server = CodegenServer(socket_path, graphql_schema)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    for file_name in ("pyproject.toml", "queries.graphql", "schema.graphql"):
+        project_path.joinpath(file_name).write_text(
+            CLIENTS_PATH.joinpath("example", file_name).read_text()
+        )
+    monkeypatch.chdir(project_path)
+    return project_path
+
+
+@pytest.mark.usefixtures("server")
+def test_send_job_generates_client_in_client_working_directory(
+    socket_path, project_dir
+):
+    expected_path = CLIENTS_PATH / "example" / "expected_client"
+
+    output = send_job(socket_path, "client")
+
+    assert "Generated files:" in output
+    for expected_file in expected_path.glob("*.py"):
+        assert (
+            project_dir.joinpath("example_client", expected_file.name).read_text()
+            == expected_file.read_text()
+        )
+
+
+def test_send_job_reuses_client_state_kept_by_server(server, socket_path, project_dir):
+    send_job(socket_path, "client")
+    watchers = list(server.watchers.values())
+
+    send_job(socket_path, "client", jobs=2)
+
+    assert list(server.watchers.values()) == watchers
+    assert watchers[0].settings.jobs == 2
+    assert (project_dir / "example_client" / "client.py").exists()
+
+
+def test_send_job_keeps_state_only_of_most_recently_used_configs(
+    server, socket_path, project_dir, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("ariadne_codegen.server.MAX_WATCHERS", 1)
+    other_project_dir = tmp_path / "other_project"
+    shutil.copytree(project_dir, other_project_dir)
+    send_job(socket_path, "client")
+
+    monkeypatch.chdir(other_project_dir)
+    send_job(socket_path, "client")
+
+    assert [cwd for cwd, _ in server.watchers] == [other_project_dir.as_posix()]
+
+
+def test_send_job_raises_server_error_with_job_error(
+    server, socket_path, tmp_path, monkeypatch
+):  # pylint: disable=unused-argument
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ServerError) as exc:
+        send_job(socket_path, "client", config="missing.toml")
+
+    assert "ConfigFileNotFound" in str(exc.value)
+
+
+def test_send_job_raises_server_error_if_server_is_not_running(socket_path):
+    with pytest.raises(ServerError):
+        send_job(socket_path, "client")
@@ -127,6 +127,33 @@ def test_client_settings_without_schema_path_or_remote_schema_url_raises_excepti
         ClientSettings(queries_path=queries_path)
 
 
+def test_client_settings_with_schema_object_is_valid(tmp_path):
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    settings = ClientSettings(
+        schema_object="package.module:schema", queries_path=queries_path
+    )
+
+    assert settings.schema_source == "package.module:schema"
+    assert "Using schema from 'package.module:schema'." in (
+        settings.used_settings_message
+    )
+
+
+@pytest.mark.parametrize(
+    "schema_object", ["package.module", ":schema", "package.module:", "a-b:schema"]
+)
+def test_client_settings_with_invalid_schema_object_raises_invalid_configuration(
+    tmp_path, schema_object
+):
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    with pytest.raises(InvalidConfiguration):
+        ClientSettings(schema_object=schema_object, queries_path=queries_path)
+
+
 def test_client_settings_resolves_env_variable_for_remote_schema_header_with_prefix(
     tmp_path, mocker
 ):
@@ -170,6 +197,88 @@ def test_client_settings_raises_invalid_configuration_for_not_found_env_variable
         )
 
 
+@pytest.mark.parametrize("jobs", [0, -1])
+def test_client_settings_with_not_positive_jobs_raises_invalid_configuration(
+    tmp_path, jobs
+):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.touch()
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    with pytest.raises(InvalidConfiguration):
+        ClientSettings(
+            schema_path=schema_path.as_posix(),
+            queries_path=queries_path.as_posix(),
+            jobs=jobs,
+        )
+
+
+def test_client_settings_with_invalid_formatter_raises_invalid_configuration(
+    tmp_path,
+):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.touch()
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    with pytest.raises(InvalidConfiguration):
+        ClientSettings(
+            schema_path=schema_path.as_posix(),
+            queries_path=queries_path.as_posix(),
+            formatter="prettier",
+        )
+
+
+def test_client_settings_with_invalid_fragments_module_name_raises_exception(
+    tmp_path,
+):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.touch()
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    with pytest.raises(InvalidConfiguration):
+        ClientSettings(
+            schema_path=schema_path.as_posix(),
+            queries_path=queries_path.as_posix(),
+            fragments_module_name="invalid-name",
+        )
+
+
+def test_client_settings_with_invalid_common_types_module_name_raises_exception(
+    tmp_path,
+):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.touch()
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    with pytest.raises(InvalidConfiguration):
+        ClientSettings(
+            schema_path=schema_path.as_posix(),
+            queries_path=queries_path.as_posix(),
+            common_types_module_name="invalid-name",
+        )
+
+
+@pytest.mark.parametrize("option", ["input_types_shards", "result_types_shards"])
+def test_client_settings_with_not_positive_shards_raises_invalid_configuration(
+    tmp_path, option
+):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.touch()
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.touch()
+
+    with pytest.raises(InvalidConfiguration):
+        ClientSettings(
+            schema_path=schema_path.as_posix(),
+            queries_path=queries_path.as_posix(),
+            **{option: 0},
+        )
+
+
 def test_client_settings_used_settings_message_returns_string_with_summary_of_data(
     tmp_path,
 ):
@@ -201,6 +310,10 @@ def test_client_settings_used_settings_message_returns_string_with_summary_of_da
     assert settings.base_client_file_path in result
     assert settings.enums_module_name in result
     assert settings.input_types_module_name in result
+    assert "Generating all input types, enums and scalars." in result
+    assert "Generating '__init__.py' importing all names eagerly." in result
+    assert "Reading all graphql files." in result
+    assert "Not skipping graphql files." in result
 
 
 def test_graphq_schema_settings_without_remote_schema_url_with_schema_path_is_valid(
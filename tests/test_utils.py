@@ -3,12 +3,8 @@ from textwrap import dedent
 
 import pytest
 
-from ariadne_codegen.utils import (
-    ast_to_str,
-    convert_to_multiline_string,
-    format_multiline_strings,
-    get_variable_indent_size,
-)
+from ariadne_codegen.codegen import generate_multiline_constant
+from ariadne_codegen.utils import Formatter, ast_to_str, write_file_atomically
 
 
 @pytest.mark.parametrize(
@@ -75,33 +71,31 @@ def test_ast_to_str_removes_unused_imports():
     assert not_used_imported_class not in generated_code
 
 
-@pytest.mark.parametrize(
-    ["source", "expected_indent"],
-    [
-        ("        query = gql('xyz''xyz')", 8),
-        ("    return True", 4),
-        ("def abcd():", 0),
-    ],
-)
-def test_get_variable_indent_size_returns_number_of_spaces_at_the_beginning_of_source(
-    source, expected_indent
-):
-    assert get_variable_indent_size(source) == expected_indent
-
-
-def test_convert_to_multiline_string_removes_string_with_triple_quotes():
-    source = "'abc\\n'def\\n''ghi\\n'"
-    expected = '"""\n    abc\n    def\n    ghi\n    """'
+def get_module_with_multiline_string() -> ast.Module:
+    module = ast.parse(
+        dedent(
+            """
+            class Client:
+                async def abcd(self) -> Abcd:
+                    query = gql(QUERY)
+            """
+        )
+    )
+    call = module.body[0].body[0].body[0].value
+    call.args = [
+        generate_multiline_constant("query abcd {\n  query1 {\n    field1\n  }\n}\n")
+    ]
+    return module
 
-    assert convert_to_multiline_string(source, variable_indent_size=0) == expected
 
+@pytest.mark.parametrize(
+    ["formatter", "expected_result"],
+    [
+        (
+            Formatter.NATIVE,
+            '''\
+class Client:
 
-def test_format_multiline_strings_returns_code_with_formatted_multiline_strings():
-    source = """
-    async def abcd(self) -> Abcd:
-        query = gql('query abcd {\\n''  query1 {\\n''    field1\\n''  }\\n''}\\n')
-    """
-    expected = '''
     async def abcd(self) -> Abcd:
         query = gql("""
             query abcd {
@@ -110,6 +104,102 @@ def test_format_multiline_strings_returns_code_with_formatted_multiline_strings(
               }
             }
             """)
-    '''
+''',
+        ),
+        (
+            Formatter.BLACK_ONLY,
+            '''\
+class Client:
+    async def abcd(self) -> Abcd:
+        query = gql(
+            """
+            query abcd {
+              query1 {
+                field1
+              }
+            }
+            """
+        )
+''',
+        ),
+    ],
+)
+def test_ast_to_str_with_multiline_strings_returns_triple_quoted_strings(
+    formatter, expected_result
+):
+    result = ast_to_str(
+        get_module_with_multiline_string(),
+        multiline_strings=True,
+        formatter=formatter,
+    )
+
+    assert result == expected_result
+
+
+def test_ast_to_str_without_multiline_strings_returns_single_line_strings():
+    result = ast_to_str(get_module_with_multiline_string(), formatter=Formatter.NATIVE)
+
+    assert "gql('query abcd {\\n  query1 {\\n" in result
+
+
+@pytest.mark.parametrize("formatter", [Formatter.BLACK_ONLY, Formatter.NATIVE])
+def test_ast_to_str_with_formatter_returns_valid_code(formatter):
+    module = ast.parse(
+        dedent(
+            """
+            from typing import Optional
+            from typing import List
+            class A:
+                a: Optional[List['A']] = None
+            """
+        )
+    )
+
+    result = ast_to_str(module, formatter=formatter)
+
+    assert ast.dump(ast.parse(result).body[-1]) == ast.dump(module.body[-1])
+
+
+def test_ast_to_str_with_black_only_formatter_doesnt_sort_imports():
+    module = ast.parse("from b import B\nfrom a import A\n")
+
+    result = ast_to_str(module, formatter=Formatter.BLACK_ONLY)
+
+    assert result == "from b import B\nfrom a import A\n"
+
+
+def test_formatter_accepts_none_as_native_alias():
+    assert Formatter("none") == Formatter.NATIVE
+
+
+def test_write_file_atomically_writes_content_without_leaving_temporary_files(
+    tmp_path,
+):
+    file_path = tmp_path / "file.py"
+    file_path.write_text("old content")
+
+    write_file_atomically(file_path, "new content")
+
+    assert file_path.read_text() == "new content"
+    assert [f.name for f in tmp_path.iterdir()] == ["file.py"]
+
+
+def test_write_file_atomically_keeps_permissions_of_existing_file(tmp_path):
+    file_path = tmp_path / "file.py"
+    file_path.write_text("old content")
+    file_path.chmod(0o640)
+
+    write_file_atomically(file_path, "new content")
+
+    assert file_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_write_file_atomically_creates_file_with_umask_read_on_import(tmp_path, mocker):
+    mocker.patch("ariadne_codegen.utils.UMASK", 0o027)
+    mocked_umask = mocker.patch("ariadne_codegen.utils.os.umask")
+    file_path = tmp_path / "file.py"
+
+    write_file_atomically(file_path, "content")
 
-    assert format_multiline_strings(source) == expected
+    assert file_path.stat().st_mode & 0o777 == 0o640
+    assert not mocked_umask.called
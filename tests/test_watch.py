@@ -0,0 +1,150 @@
+import os
+import sys
+
+import pytest
+
+from ariadne_codegen.settings import ClientSettings
+from ariadne_codegen.watch import ClientWatcher
+
+SCHEMA_STR = """
+schema {
+  query: Query
+}
+
+type Query {
+  a: String!
+  b: Int!
+}
+"""
+
+
+@pytest.fixture
+def settings(tmp_path):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(SCHEMA_STR)
+    queries_path = tmp_path / "queries"
+    queries_path.mkdir()
+    queries_path.joinpath("get_a.graphql").write_text("query GetA { a }")
+    queries_path.joinpath("get_b.graphql").write_text("query GetB { b }")
+    return ClientSettings(
+        schema_path=schema_path.as_posix(),
+        queries_path=queries_path.as_posix(),
+        target_package_path=tmp_path.as_posix(),
+        formatter="native",
+    )
+
+
+def touch(path, content):
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_check_generates_client_only_if_watched_files_changed(settings):
+    watcher = ClientWatcher(settings=settings, config_dict={})
+
+    generated_files = watcher.check()
+
+    assert generated_files and "get_a.py" in generated_files
+    assert watcher.check() is None
+
+
+def test_check_regenerates_client_after_query_file_change(settings, tmp_path):
+    watcher = ClientWatcher(settings=settings, config_dict={})
+    watcher.check()
+    package_path = tmp_path / "graphql_client"
+
+    touch(tmp_path / "queries" / "get_a.graphql", "query GetA { a b }")
+    generated_files = watcher.check()
+
+    assert generated_files
+    assert "b: int" in package_path.joinpath("get_a.py").read_text()
+
+
+def test_check_regenerates_client_after_schema_file_change(settings, tmp_path):
+    watcher = ClientWatcher(settings=settings, config_dict={})
+    watcher.check()
+    package_path = tmp_path / "graphql_client"
+
+    touch(tmp_path / "schema.graphql", SCHEMA_STR.replace("a: String!", "a: Int!"))
+    watcher.check()
+
+    assert "a: int" in package_path.joinpath("get_a.py").read_text()
+
+
+def test_regenerate_reuses_unchanged_operations_and_query_files(settings, tmp_path):
+    watcher = ClientWatcher(settings=settings, config_dict={})
+    watcher.check()
+    get_b_path = tmp_path / "queries" / "get_b.graphql"
+    get_b_document = watcher._queries_documents[  # pylint: disable=protected-access
+        get_b_path
+    ][1]
+    cache_entries = dict(watcher.cache_entries)
+
+    touch(tmp_path / "queries" / "get_a.graphql", "query GetA { a b }")
+    watcher.check()
+
+    assert (
+        watcher._queries_documents[get_b_path][1]  # pylint: disable=protected-access
+        is get_b_document
+    )
+    assert len(cache_entries) == 2
+    assert len(set(cache_entries) & set(watcher.cache_entries)) == 1
+    assert len(watcher.cache_entries) == 2
+
+
+def test_run_reports_invalid_schema_and_keeps_watching(
+    settings, tmp_path, mocker, capsys
+):
+    schema_path = tmp_path / "schema.graphql"
+    touch(schema_path, SCHEMA_STR.replace("a: String!", "a: Strin!"))
+    sleep_calls = []
+
+    def fix_schema_then_interrupt(_):
+        if sleep_calls:
+            raise KeyboardInterrupt
+        sleep_calls.append(1)
+        touch(schema_path, SCHEMA_STR)
+
+    mocker.patch(
+        "ariadne_codegen.watch.time.sleep", side_effect=fix_schema_then_interrupt
+    )
+    watcher = ClientWatcher(settings=settings, config_dict={})
+
+    watcher.run()
+
+    captured = capsys.readouterr()
+    assert "Unknown type 'Strin'" in captured.err
+    assert "get_a.py" in captured.out
+
+
+def test_check_regenerates_client_after_schema_object_module_change(
+    tmp_path, monkeypatch
+):
+    module_path = tmp_path / "watched_schema_module.py"
+    module_path.write_text(
+        f"from graphql import build_schema\nschema = build_schema({SCHEMA_STR!r})\n"
+    )
+    queries_path = tmp_path / "queries.graphql"
+    queries_path.write_text("query GetA { a }")
+    monkeypatch.chdir(tmp_path)
+    settings = ClientSettings(
+        schema_object="watched_schema_module:schema",
+        queries_path=queries_path.as_posix(),
+        target_package_path=tmp_path.as_posix(),
+        formatter="native",
+    )
+    watcher = ClientWatcher(settings=settings, config_dict={})
+    watcher.check()
+    assert watcher.check() is None
+
+    touch(
+        module_path,
+        module_path.read_text().replace("a: String!", "a: Int!"),
+    )
+    generated_files = watcher.check()
+
+    assert generated_files
+    get_a_code = tmp_path.joinpath("graphql_client", "get_a.py").read_text()
+    assert "a: int" in get_a_code
+    del sys.modules["watched_schema_module"]